@@ -1,6 +1,14 @@
 from node import *
 
 class ALOHANode(Node):
+    state_handler_names = {
+        State.Idle: 'idle_state',
+        State.Receiving: 'receiving_state',
+        State.Sending: 'sending_state',
+        State.BackingOff: 'backing_off_state',
+        State.WaitingForAnswer: 'waiting_for_answer_state',
+    }
+
     def __init__(self, id: int, radius: float, transceive_range: float, x_pos: float, y_pos: float):
         self.id = id
         self.radius = radius
@@ -18,18 +26,35 @@ class ALOHANode(Node):
 
         super().__init__()
 
-    def execute_state_machine(self, simulation_time: int, active_transmissions: list[Transmission]):
-        logging.debug("node {} - [State: {}]".format(self.id, self.state.name))
+
+    def get_state_counter(self) -> int:
+        if self.state == State.Sending:
+            return self.sending_state_counter
+        elif self.state == State.Receiving:
+            return self.receiving_state_counter
+        elif self.state == State.BackingOff:
+            return self.protocol.backoff
+        elif self.state == State.WaitingForAnswer:
+            return self.waiting_for_answer_state_counter
+
+
+    def next_wakeup(self, simulation_time: int) -> int | float:
         if self.state == State.Idle:
-            self.idle_state(simulation_time, active_transmissions)
+            return simulation_time if self.send_schedule else float('inf')
+
+        # The counter is decremented before it is checked, so it expires `counter - 1` ticks from now
+        return simulation_time + max(self.get_state_counter(), 1) - 1
+
+
+    def fast_forward(self, ticks: int):
+        if self.state == State.Sending:
+            self.sending_state_counter -= ticks
         elif self.state == State.Receiving:
-            self.receiving_state(simulation_time, active_transmissions)
-        elif self.state == State.Sending:
-            self.sending_state(simulation_time)   
+            self.receiving_state_counter -= ticks
         elif self.state == State.BackingOff:
-            self.backing_off_state(simulation_time, active_transmissions)   
+            self.protocol.backoff -= ticks
         elif self.state == State.WaitingForAnswer:
-            self.waiting_for_answer_state(simulation_time, active_transmissions)   
+            self.waiting_for_answer_state_counter -= ticks
 
 
     def transition_to_receiving(self, message: Message):
@@ -39,7 +64,7 @@ class ALOHANode(Node):
         logging.debug("\tReceiving: [{}], Transition to {}".format(message, self.state.name))
 
 
-    def transition_to_sending(self, simulation_time: int, message_to_send: Message, active_transmissions: list[Transmission]):
+    def transition_to_sending(self, simulation_time: int, message_to_send: Message, active_transmissions: Channel):
         self.state = State.Sending
         self.protocol.backoff = 0
         self.sending_state_counter = message_to_send.length
@@ -81,6 +106,18 @@ class ALOHANode(Node):
         logging.debug("\tTransition to {} with backoff={}".format(self.state, self.protocol.backoff))
 
 
+    def resume_previous_state(self):
+        elapsed = self.protocol.currently_receiving.length - self.receiving_state_counter
+        # If we were waiting for a message, return to waiting
+        if self.waiting_for_answer_state_counter > 0:
+            self.transition_to_wait_for_answer(self.waiting_for_answer_state_counter - elapsed, 0, 0)
+        # If we were backing off, return to backoff
+        elif self.protocol.backoff > 0:
+            self.transition_to_backoff(self.protocol.backoff - elapsed)
+        else:
+            self.transition_to_idle()
+
+
     #################################################################################################################################
     #################################################################################################################################
     #                                                   Begin state implementations
@@ -88,11 +125,11 @@ class ALOHANode(Node):
     #################################################################################################################################
 
 
-    def idle_state(self, simulation_time: int, active_transmissions: list['Transmission']):
+    def idle_state(self, simulation_time: int, active_transmissions: Channel):
         # Anything to receive?
         if transmissions := self.get_receivable_messages(simulation_time, active_transmissions):
             match transmissions:
-                case [transmission] if transmission.transmit_time + self.get_packet_travel_time(get_node_by_id(self.neighbors, transmission.message.source)) == simulation_time:
+                case [transmission] if transmission.transmit_time + self.get_packet_travel_time(self.get_neighbor(transmission.message.source)) == simulation_time:
                     self.transition_to_receiving(transmission.message)
                     return
                 case [_, _, *_]:
@@ -117,7 +154,7 @@ class ALOHANode(Node):
             return
 
 
-    def sending_state(self, simulation_time: int):
+    def sending_state(self, simulation_time: int, active_transmissions: Channel):
         self.sending_state_counter -= 1
         logging.debug("\tstate_counter: {}".format(self.sending_state_counter))
         if self.sending_state_counter <= 0:
@@ -136,61 +173,24 @@ class ALOHANode(Node):
                 self.transition_to_idle()
 
 
-    def receiving_state(self, simulation_time: int, active_transmissions: list[Transmission]):
+    def receiving_state(self, simulation_time: int, active_transmissions: Channel):
         # Check for collisions
         if transmissions := self.get_receivable_messages(simulation_time, active_transmissions):
             match transmissions:
-                case [transmission] if transmission.transmit_time + self.get_packet_travel_time(get_node_by_id(self.neighbors, transmission.message.source)) == simulation_time:
+                case [transmission] if transmission.transmit_time + self.get_packet_travel_time(self.get_neighbor(transmission.message.source)) == simulation_time:
                     if transmission.message != self.protocol.currently_receiving:
                         logging.debug("\tCollision with [{}]".format(transmission.message))
                         self.collision_counter += 1
-                        # If we were waiting for a message, return to waiting
-                        if self.waiting_for_answer_state_counter > 0:
-                            new_wait_for_answer_state_counter = self.waiting_for_answer_state_counter - (self.protocol.currently_receiving.length - self.receiving_state_counter)
-                            self.transition_to_wait_for_answer(new_wait_for_answer_state_counter, 0, 0)
-                            return
-                        
-                        # If we were backing off, return to backoff
-                        if self.protocol.backoff > 0:
-                            new_backoff = self.protocol.backoff - (self.protocol.currently_receiving.length - self.receiving_state_counter)
-                            self.transition_to_backoff(new_backoff)
-                            return
-                        
-                        self.transition_to_idle()
+                        self.resume_previous_state()
                         return
                 case [_, _, *_]:
                     logging.debug("\tCollision, received more than one Message at the same time.")
                     self.collision_counter += 1
-                    # If we were waiting for a message, return to waiting
-                    if self.waiting_for_answer_state_counter > 0:
-                        new_wait_for_answer_state_counter = self.waiting_for_answer_state_counter - (self.protocol.currently_receiving.length - self.receiving_state_counter)
-                        self.transition_to_wait_for_answer(new_wait_for_answer_state_counter, 0, 0)
-                        return
-                    
-                    # If we were backing off, return to backoff
-                    if self.protocol.backoff > 0:
-                        new_backoff = self.protocol.backoff - (self.protocol.currently_receiving.length - self.receiving_state_counter)
-                        self.transition_to_backoff(new_backoff)
-                        return
-                    
-                    self.transition_to_idle()
+                    self.resume_previous_state()
                     return
                 case []:
                     logging.info('Node moved out of range as communication was occuring, resetting to idle')
-                    if self.waiting_for_answer_state_counter > 0:
-                        new_wait_for_answer_state_counter = self.waiting_for_answer_state_counter - (
-                                    self.protocol.currently_receiving.length - self.receiving_state_counter)
-                        self.transition_to_wait_for_answer(new_wait_for_answer_state_counter, 0, 0)
-                        return
-
-                    # If we were backing off, return to backoff
-                    if self.protocol.backoff > 0:
-                        new_backoff = self.protocol.backoff - (
-                                    self.protocol.currently_receiving.length - self.receiving_state_counter)
-                        self.transition_to_backoff(new_backoff)
-                        return
-
-                    self.transition_to_idle()
+                    self.resume_previous_state()
                     return
 
 
@@ -200,7 +200,7 @@ class ALOHANode(Node):
             self.process_received_message(self.protocol.currently_receiving, simulation_time, active_transmissions)
 
 
-    def process_received_message(self, received_message: Message, simulation_time: int, active_transmissions: list[Transmission]):
+    def process_received_message(self, received_message: Message, simulation_time: int, active_transmissions: Channel):
         self.protocol.currently_receiving = None
         logging.debug("\tFinished receiving [{}]".format(received_message))
 
@@ -242,7 +242,8 @@ class ALOHANode(Node):
             self.send_schedule.pop(0)
 
             # Copy the `receive_buffer` into `received_message`
-            get_node_by_id(self.neighbors, received_message.source).received_message = get_node_by_id(self.neighbors, received_message.source).receive_buffer
+            sender = self.get_neighbor(received_message.source)
+            sender.received_message = sender.receive_buffer
 
             # When receiving an ACK the backoff can be reset
             self.protocol.reset_max_backoff()
@@ -250,7 +251,7 @@ class ALOHANode(Node):
             self.transition_to_idle()
 
 
-    def waiting_for_answer_state(self, simulation_time: int, active_transmissions: list['Transmission']):
+    def waiting_for_answer_state(self, simulation_time: int, active_transmissions: Channel):
         self.waiting_for_answer_state_counter -= 1
         logging.debug("\tstate_counter: {}".format(self.waiting_for_answer_state_counter))
 
@@ -261,7 +262,7 @@ class ALOHANode(Node):
         # Anything to receive?
         if transmissions := self.get_receivable_messages(simulation_time, active_transmissions):
             match transmissions:
-                case [transmission] if transmission.transmit_time + self.get_packet_travel_time(get_node_by_id(self.neighbors, transmission.message.source)) == simulation_time:
+                case [transmission] if transmission.transmit_time + self.get_packet_travel_time(self.get_neighbor(transmission.message.source)) == simulation_time:
                     self.transition_to_receiving(transmission.message)
                     return
                 case [_, _, *_]:
@@ -269,7 +270,7 @@ class ALOHANode(Node):
                     self.collision_counter += 1
 
 
-    def backing_off_state(self, simulation_time: int, active_transmissions: list[HighLevelMessage]):
+    def backing_off_state(self, simulation_time: int, active_transmissions: Channel):
         self.protocol.backoff -= 1
         logging.debug("\tbackoff {}".format(self.protocol.backoff))
         if self.protocol.backoff <= 0:
@@ -278,7 +279,7 @@ class ALOHANode(Node):
         # Anything to receive?
         if transmissions := self.get_receivable_messages(simulation_time, active_transmissions):
             match transmissions:
-                case [transmission] if transmission.transmit_time + self.get_packet_travel_time(get_node_by_id(self.neighbors, transmission.message.source)) == simulation_time:
+                case [transmission] if transmission.transmit_time + self.get_packet_travel_time(self.get_neighbor(transmission.message.source)) == simulation_time:
                     self.transition_to_receiving(transmission.message)
                 case [_, _, *_]:
                     logging.debug("\tCollision, received more than one Message at the same time.")
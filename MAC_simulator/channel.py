@@ -0,0 +1,131 @@
+import heapq
+from itertools import count
+from typing import Callable
+
+from transmission import Transmission
+
+
+class Channel:
+    """
+    `Channel` owns the transmissions that are currently on the air. A transmission is retired as soon as it can no longer
+    arrive at any node, i.e. once `transmit_time + max_propagation_delay + length` has passed, so the cost of looking at
+    the channel depends on the current load and not on how long the simulation has been running.
+
+    When a transmission is added, its arrival window `[transmit_time + travel time, ... + length)` is computed once for
+    every node that has the sender as a neighbor and put into that receiver's arrival calendar. Those receivers are kept
+    by the sender, see `Node.receivers_by_id`, so adding a transmission does not depend on the number of nodes.
+    """
+
+    def __init__(self, nodes: list, max_propagation_delay: int):
+        self.nodes = nodes
+        self.nodes_by_id = {node.id: node for node in nodes}
+        self.max_propagation_delay = max_propagation_delay
+        self.transmissions: list[Transmission] = []
+        # Earliest time at which one of `transmissions` can be retired
+        self.next_expiry = float('inf')
+
+        # Per receiver id: heap of arrival windows that have not started yet and list of currently open windows.
+        # Both store `(lb, ub, transmission)`, the heap additionally an insertion counter to break ties.
+        self.calendars: dict[int, list[tuple[int, int, int, Transmission]]] = {node.id: [] for node in nodes}
+        self.open_windows: dict[int, list[tuple[int, int, Transmission]]] = {node.id: [] for node in nodes}
+        self.insertion_counter = count()
+        # Called with the receiver id and start of every new arrival window, see `NodeWakeupQueue`
+        self.arrival_listener: Callable[[int, int], None] | None = None
+
+        # All arrival windows `(lb, ub, receiver id)` by start and the open ones `(ub, receiver id)` by end, only
+        # maintained once `get_busy_receivers` got called
+        self.track_busy_receivers = False
+        self.window_starts: list[tuple[int, int, int]] = []
+        self.window_ends: list[tuple[int, int]] = []
+        self.open_window_counts: dict[int, int] = {}
+
+    def __iter__(self):
+        return iter(self.transmissions)
+
+    def __len__(self) -> int:
+        return len(self.transmissions)
+
+    def get_expiry(self, transmission: Transmission) -> int:
+        return transmission.transmit_time + self.max_propagation_delay + transmission.message.length
+
+    def append(self, transmission: Transmission):
+        self.transmissions.append(transmission)
+        self.next_expiry = min(self.next_expiry, self.get_expiry(transmission))
+
+        sender = self.nodes_by_id[transmission.message.source]
+        for receiver in sender.receivers_by_id.values():
+            lb = transmission.transmit_time + receiver.get_packet_travel_time(sender)
+            heapq.heappush(self.calendars[receiver.id],
+                           (lb, next(self.insertion_counter), lb + transmission.message.length, transmission))
+            if self.track_busy_receivers:
+                heapq.heappush(self.window_starts, (lb, lb + transmission.message.length, receiver.id))
+            if self.arrival_listener:
+                self.arrival_listener(receiver.id, lb)
+
+    def retire(self, simulation_time: int):
+        """
+        Drops every transmission that has fully arrived at all of its possible receivers.
+
+        :param simulation_time: current time of the simulation
+        """
+        if simulation_time < self.next_expiry:
+            return
+
+        self.transmissions = [t for t in self.transmissions if self.get_expiry(t) > simulation_time]
+        self.next_expiry = min(map(self.get_expiry, self.transmissions), default=float('inf'))
+
+    def update_open_windows(self, receiver_id: int, simulation_time: int) -> list[tuple[int, int, Transmission]]:
+        """
+        Opens all windows of `receiver_id` that started by `simulation_time` and closes the ones that have ended.
+        `simulation_time` must not decrease between calls.
+        """
+        calendar = self.calendars[receiver_id]
+        open_windows = self.open_windows[receiver_id]
+        while calendar and calendar[0][0] <= simulation_time:
+            lb, _, ub, transmission = heapq.heappop(calendar)
+            open_windows.append((lb, ub, transmission))
+
+        if any(ub <= simulation_time for _, ub, _ in open_windows):
+            open_windows = [window for window in open_windows if window[1] > simulation_time]
+            self.open_windows[receiver_id] = open_windows
+
+        return open_windows
+
+    def get_receivable_messages(self, receiver_id: int, simulation_time: int) -> list[Transmission]:
+        return [transmission for _, _, transmission in self.update_open_windows(receiver_id, simulation_time)]
+
+    def next_arrival(self, receiver_id: int, simulation_time: int) -> int | float:
+        open_windows = self.update_open_windows(receiver_id, simulation_time)
+        if len(open_windows) > 1 or any(lb == simulation_time for lb, _, _ in open_windows):
+            return simulation_time
+
+        calendar = self.calendars[receiver_id]
+        return calendar[0][0] if calendar else float('inf')
+
+    def get_busy_receivers(self, simulation_time: int) -> set[int]:
+        """
+        Returns the ids of all receivers at which a transmission starts arriving at `simulation_time` or that currently
+        have more than one transmission arriving. Those are the only receivers for which the channel can change
+        anything this tick. Has to be called before the first transmission is added and `simulation_time` must not
+        decrease between calls.
+        """
+        self.track_busy_receivers = True
+
+        busy_receivers = set()
+        while self.window_starts and self.window_starts[0][0] <= simulation_time:
+            lb, ub, receiver_id = heapq.heappop(self.window_starts)
+            if lb == simulation_time:
+                busy_receivers.add(receiver_id)
+            if ub > simulation_time:
+                self.open_window_counts[receiver_id] = self.open_window_counts.get(receiver_id, 0) + 1
+                heapq.heappush(self.window_ends, (ub, receiver_id))
+
+        while self.window_ends and self.window_ends[0][0] <= simulation_time:
+            _, receiver_id = heapq.heappop(self.window_ends)
+            self.open_window_counts[receiver_id] -= 1
+            if self.open_window_counts[receiver_id] == 0:
+                del self.open_window_counts[receiver_id]
+
+        busy_receivers.update(receiver_id for receiver_id, open_windows in self.open_window_counts.items()
+                              if open_windows > 1)
+        return busy_receivers
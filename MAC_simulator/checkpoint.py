@@ -0,0 +1,40 @@
+"""
+Snapshots of a running simulation, so long runs can be resumed after a crash instead of starting over.
+
+A checkpoint pickles the scenario with everything reachable from it, i.e. the nodes with their state counters, send
+schedules and random number streams, the MAC and DSDV state, together with the channel and the simulation time. The
+neighbors of the nodes are left out and rebuilt from the neighbor index on loading. Resuming from a checkpoint
+continues exactly like the uninterrupted run would have.
+"""
+import os
+import pickle
+from dataclasses import dataclass
+
+from channel import Channel
+
+
+@dataclass
+class Checkpoint:
+    simulation_time: int
+    scenario: object
+    active_transmissions: Channel
+
+
+def save_checkpoint(path: str, simulation_time: int, scenario, active_transmissions: Channel):
+    checkpoint = Checkpoint(simulation_time, scenario, active_transmissions)
+
+    # Replace the previous checkpoint only once the new one is complete
+    temporary_path = path + '.tmp'
+    with open(temporary_path, 'wb') as file:
+        pickle.dump(checkpoint, file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary_path, path)
+
+
+def load_checkpoint(path: str) -> Checkpoint:
+    with open(path, 'rb') as file:
+        checkpoint = pickle.load(file)
+
+    # Nodes are pickled without their neighbors, see `Node.__getstate__`
+    scenario = checkpoint.scenario
+    scenario.neighbor_index.load(scenario.nodes, scenario.neighbor_index.neighbor_indices)
+    return checkpoint
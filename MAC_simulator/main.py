@@ -1,15 +1,15 @@
 import matplotlib.pyplot as plt
 import logging
 
-from node import State, get_node_by_id
-import numpy as np
-import random
+from node import State, get_max_propagation_delay
+from channel import Channel
+from checkpoint import load_checkpoint, save_checkpoint
 from aloha_node import ALOHANode
 from rts_cts_node import RTSCTSNode
 from transmission import HighLevelMessage
+from random_streams import RandomStreams
 
-# from scenarious import data_sink_rts_cts_25_random_max_100 as scen
-from scenarious_routing import Routing_1_aloha as scen
+from scenario_registry import build_scenario
 
 """
 for i in range(0, N):
@@ -47,12 +47,12 @@ class Visualizer:
         node_circle_range = zip(zip(x_coords, y_coords), [node.transceive_range for node in nodes])
         colours = [node.get_color_based_on_state() for node in nodes]
 
+        nodes_by_id = {node.id: node for node in nodes}
+        senders = [(node, nodes_by_id[node.protocol.currently_receiving.source])
+                   for node in nodes if node.state == State.Receiving]
         established_links = [
-            (get_node_by_id(nodes, node.protocol.currently_receiving.source).x_pos,
-             get_node_by_id(nodes, node.protocol.currently_receiving.source).y_pos,
-             node.x_pos - get_node_by_id(nodes, node.protocol.currently_receiving.source).x_pos,
-             node.y_pos - get_node_by_id(nodes, node.protocol.currently_receiving.source).y_pos)
-            for node in nodes if node.state == State.Receiving]
+            (sender.x_pos, sender.y_pos, node.x_pos - sender.x_pos, node.y_pos - sender.y_pos)
+            for node, sender in senders]
 
         self.ax.clear()
         self.ax.scatter(x_coords, y_coords, clip_on=False, color=colours)
@@ -75,12 +75,50 @@ class Visualizer:
         #input()
 
 
-def run_scenario(scenario) -> tuple[int, int, int]:
-    scenario.setup()
-    simulation_time = 0
-    active_transmissions = []
+def run_scenario(scenario, event_driven: bool = False, seed: int | None = None, checkpoint_path: str | None = None,
+                 checkpoint_interval: int = 1000):
+    """
+    Runs `scenario` until `Scenario.run` returns a result and returns it.
+
+    :param event_driven: instead of executing every clock tick, jump straight to the next tick at which any node can
+        change its state. Produces the same results as the tick loop as long as nodes do not move.
+    :param seed: seed of all random number streams of the run, see `RandomStreams`
+    :param checkpoint_path: file to save a checkpoint to every `checkpoint_interval` ticks, see `resume_scenario`
+    """
+    scenario.setup(RandomStreams(seed))
+    active_transmissions = Channel(scenario.nodes, get_max_propagation_delay(scenario.nodes))
+
+    return simulate(scenario, active_transmissions, 0, event_driven, checkpoint_path, checkpoint_interval)
+
+
+def resume_scenario(checkpoint_path: str, event_driven: bool = False, checkpoint_interval: int = 1000):
+    """
+    Continues the run saved at `checkpoint_path` by `run_scenario` and returns its result. Keeps saving checkpoints
+    to the same file.
+    """
+    checkpoint = load_checkpoint(checkpoint_path)
+
+    return simulate(checkpoint.scenario, checkpoint.active_transmissions, checkpoint.simulation_time, event_driven,
+                    checkpoint_path, checkpoint_interval)
+
+
+def simulate(scenario, active_transmissions: Channel, simulation_time: int, event_driven: bool,
+             checkpoint_path: str | None, checkpoint_interval: int):
+    next_checkpoint_time = simulation_time + checkpoint_interval
+    scenario.set_event_driven(event_driven, simulation_time, active_transmissions)
 
     while True:
+        if checkpoint_path and simulation_time >= next_checkpoint_time:
+            save_checkpoint(checkpoint_path, simulation_time, scenario, active_transmissions)
+            next_checkpoint_time = simulation_time + checkpoint_interval
+
+        if event_driven:
+            next_event_time = scenario.next_event_time(simulation_time, active_transmissions)
+            if simulation_time < next_event_time < float('inf'):
+                scenario.fast_forward(simulation_time, next_event_time - simulation_time)
+                simulation_time = next_event_time
+
+        active_transmissions.retire(simulation_time)
         result = scenario.run(simulation_time, active_transmissions)
         if result:
             return result
@@ -91,21 +129,22 @@ def main():
     X = 10  # Window size
     Y = 10  # Window size
 
-    np.random.seed(42)
-    random.seed(42)
-
     logging.basicConfig(format='%(message)s', level=logging.INFO)
 
+    # e.g. build_scenario('data_sink_rts_cts_25_random_max_100')
+    scen = build_scenario('Routing_1_aloha')
+
     simulation_time = 0
-    active_transmissions = []
+    active_transmissions = Channel(scen.nodes, get_max_propagation_delay(scen.nodes))
 
-    scen.setup()
+    scen.setup(RandomStreams(42))
 
     vis = Visualizer(X, Y)
 
     while True:
         logging.debug("simulation_time: {}".format(simulation_time))
 
+        active_transmissions.retire(simulation_time)
         result = scen.run(simulation_time, active_transmissions)
         if result:
             break
@@ -0,0 +1,99 @@
+from collections import defaultdict
+
+from node import Node, get_distance_between_nodes
+
+
+class NeighborIndex:
+    """
+    Maintains `Node.neighbors` for a list of nodes. The neighbor lists are only rebuilt when a node was added, removed
+    or moved, otherwise `update` is a cheap comparison of the positions.
+
+    Subclasses only have to provide candidate pairs that are within `max_reach` of each other, the exact neighbor check
+    is the same as in `Node.add_neighbors`.
+    """
+
+    def __init__(self):
+        self.positions = None
+        # For every node the indices of its neighbors in the list of nodes passed to `update`
+        self.neighbor_indices: list[list[int]] = []
+
+    def update(self, nodes: list[Node]):
+        positions = [(node.id, node.x_pos, node.y_pos) for node in nodes]
+        if positions == self.positions:
+            return
+        self.positions = positions
+
+        max_radius = max(node.radius for node in nodes)
+        max_reach = max(2 * max_radius + node.transceive_range for node in nodes)
+
+        self.neighbor_indices = []
+        for i, candidates in enumerate(self.get_candidates(nodes, max_reach)):
+            node = nodes[i]
+            indices = []
+            # Keep the order of `nodes` like `add_neighbors` does
+            for j in sorted(candidates):
+                other = nodes[j]
+                if other.id != node.id:
+                    distance = get_distance_between_nodes(node, other)
+                    if distance < (node.radius + other.radius + node.transceive_range):
+                        indices.append(j)
+            self.neighbor_indices.append(indices)
+            node.set_neighbors([nodes[j] for j in indices])
+
+    def load(self, nodes: list[Node], neighbor_indices: list[list[int]]):
+        """
+        Sets the neighbors from the indices into `nodes` that `update` found earlier for the same positions, e.g. read
+        from a cache.
+        """
+        self.positions = [(node.id, node.x_pos, node.y_pos) for node in nodes]
+        self.neighbor_indices = neighbor_indices
+        for node, indices in zip(nodes, neighbor_indices):
+            node.set_neighbors([nodes[j] for j in indices])
+
+    def share(self, base: 'NeighborIndex', nodes: list[Node]) -> bool:
+        """
+        Takes over the neighbors `base` found for nodes at the same positions, e.g. in another replication of the
+        same scenario.
+
+        :return: whether the positions matched
+        """
+        if [(node.id, node.x_pos, node.y_pos) for node in nodes] != base.positions:
+            return False
+
+        self.load(nodes, base.neighbor_indices)
+        return True
+
+    def get_candidates(self, nodes: list[Node], max_reach: float) -> list[list[int]]:
+        """
+        Returns for every node the indices of all nodes that might be closer than `max_reach`.
+        """
+        return [list(range(len(nodes)))] * len(nodes)
+
+
+class GridNeighborIndex(NeighborIndex):
+    """
+    Uniform grid with cells of size `max_reach`, so only the 3x3 surrounding cells have to be checked for every node.
+    """
+
+    def get_candidates(self, nodes: list[Node], max_reach: float) -> list[list[int]]:
+        cells = defaultdict(list)
+        node_cells = []
+        for i, node in enumerate(nodes):
+            cell = (int(node.x_pos // max_reach), int(node.y_pos // max_reach))
+            cells[cell].append(i)
+            node_cells.append(cell)
+
+        return [[j for dx in (-1, 0, 1) for dy in (-1, 0, 1) for j in cells.get((x + dx, y + dy), ())]
+                for x, y in node_cells]
+
+
+class KDTreeNeighborIndex(NeighborIndex):
+    """
+    Range queries using `scipy.spatial.cKDTree`. Requires scipy.
+    """
+
+    def get_candidates(self, nodes: list[Node], max_reach: float) -> list[list[int]]:
+        from scipy.spatial import cKDTree
+
+        positions = [(node.x_pos, node.y_pos) for node in nodes]
+        return cKDTree(positions).query_ball_point(positions, r=max_reach)
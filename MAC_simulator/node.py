@@ -1,13 +1,13 @@
 from dataclasses import dataclass
-from random import randint
+from typing import ClassVar
 
 import numpy as np
 import logging
 from enum import Enum
 from transmission import HighLevelMessage, Message, Transmission, MessageType
 from protocols import MACProtocol, ALOHA, RTSCTSALOHA, DSDVRoutingProtocol
-
-np.random.seed(42)
+from channel import Channel
+from random_streams import NodeStreams
 
 
 class State(Enum):
@@ -27,6 +27,10 @@ class Node:
     x_pos: float
     y_pos: float
     neighbors: list['Node']
+    # Same nodes as `neighbors`, for constant time lookups
+    neighbors_by_id: dict[int, 'Node']
+    # Nodes that have this node as a neighbor, i.e. the receivers of its transmissions, maintained by `set_neighbors`
+    receivers_by_id: dict[int, 'Node']
     collision_counter: int
 
     x_vel: float
@@ -47,17 +51,54 @@ class Node:
     protocol: MACProtocol
     routing_protocol: DSDVRoutingProtocol
 
+    # Set by `set_random_streams` when the scenario is set up
+    random_streams: NodeStreams
+
+    # Maps every state to the name of the method implementing it, see `execute_state_machine`
+    state_handler_names: ClassVar[dict[State, str]] = {}
+
+    # Set by `Topology.update`, used to look up precomputed travel times
+    topology: 'Topology'
+    topology_index: int
+
     def __init__(self):
         self.send_schedule = []
         self.state = State.Idle
         self.neighbors = []
+        self.neighbors_by_id = {}
+        self.receivers_by_id = {}
         self.receive_buffer = None
         self.received_message = None
         self.collision_counter = 0
+        # Only set by scenarios that use routing
+        self.routing_protocol = None
+        self.topology = None
+        self.topology_index = None
+        self.random_streams = None
 
         self.x_vel = 0
         self.y_vel = 0
 
+        # Bound once so dispatching a state is a single dict lookup
+        self.state_handlers = {state: getattr(self, name) for state, name in self.state_handler_names.items()}
+
+    def __getstate__(self):
+        # Pickling the neighbors recurses from neighbor to neighbor through the whole topology, which is too deep for
+        # large scenarios. They are restored from the neighbor index instead, see `checkpoint.load_checkpoint`.
+        state = self.__dict__.copy()
+        del state['neighbors']
+        del state['neighbors_by_id']
+        del state['receivers_by_id']
+        del state['state_handlers']
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self.neighbors = []
+        self.neighbors_by_id = {}
+        self.receivers_by_id = {}
+        self.state_handlers = {state: getattr(self, name) for state, name in self.state_handler_names.items()}
+
     def move(self):
         self.x_pos += self.x_vel * 0.001
         self.y_pos += self.y_vel * 0.001
@@ -74,8 +115,8 @@ class Node:
         # self.y_vel += randint(-1, 1)
 
 
-        self.x_vel += np.random.normal()
-        self.y_vel += np.random.normal()
+        self.x_vel += self.random_streams.mobility.normal()
+        self.y_vel += self.random_streams.mobility.normal()
 
         self.x_vel = min(max(self.x_vel, -5), 5)
         self.y_vel = min(max(self.y_vel, -5), 5)
@@ -90,21 +131,23 @@ class Node:
         return received_message_ret
 
 
-    def execute_state_machine(self, simulation_time: int, active_transmissions: list[Transmission]):
+    def execute_state_machine(self, simulation_time: int, active_transmissions: Channel):
         """
         Executes one state machine cycle.
 
         :param simulation_time: current time of the simulation
         """
+        logging.debug("node %s - [State: %s]", self.id, self.state.name)
+        self.state_handlers[self.state](simulation_time, active_transmissions)
 
 
-    def idle_state(self, simulation_time: int, active_transmissions: list['Transmission']):
+    def idle_state(self, simulation_time: int, active_transmissions: Channel):
         """
         Sends or receives messages.
         """
 
 
-    def sending_state(self, simulation_time: int):
+    def sending_state(self, simulation_time: int, active_transmissions: Channel):
         """
         The protocol is in this state while sending a message. Stays in this state till `state_counter` is 0.
 
@@ -120,7 +163,7 @@ class Node:
         """
 
 
-    def backing_off_state(self, simulation_time: int, active_transmissions: list[HighLevelMessage]):
+    def backing_off_state(self, simulation_time: int, active_transmissions: Channel):
         """
         The protocol is in this state after not receiving an ACK.
 
@@ -128,7 +171,7 @@ class Node:
         """
 
 
-    def waiting_for_answer_state(self, simulation_time: int, active_transmissions: list[Transmission]):
+    def waiting_for_answer_state(self, simulation_time: int, active_transmissions: Channel):
         """
         The protocol is in this state while waiting for an answer after sending a message.
 
@@ -136,12 +179,37 @@ class Node:
         """
 
 
+    def next_wakeup(self, simulation_time: int) -> int | float:
+        """
+        Returns the earliest simulation time at which the state machine does more than count down the counter of its
+        current state. Incoming transmissions are not taken into account, see `next_arrival`.
+
+        :param simulation_time: current time of the simulation
+        """
+
+
+    def fast_forward(self, ticks: int):
+        """
+        Counts down the counter of the current state by `ticks` without executing the state machine.
+        Only valid as long as neither `next_wakeup` nor `next_arrival` lie within the skipped ticks.
+
+        :param ticks: number of skipped clock ticks
+        """
+
+
+    def resume_previous_state(self):
+        """
+        Leaves `State.Receiving` without having received anything, e.g. after a collision, and returns to the state the
+        node was in before it started receiving. The time spent receiving is deducted from that state's counter.
+        """
+
+
     def transition_to_receiving(self, message: Message):
         """
         Transition to Receiving
         """
 
-    def transition_to_sending(self, simulation_time: int, message_to_send: Message, active_transmissions: list[Transmission]):
+    def transition_to_sending(self, simulation_time: int, message_to_send: Message, active_transmissions: Channel):
         """
         Transition to Sending
         """
@@ -168,36 +236,54 @@ class Node:
     """
     Return all messages the node can currently receive. If more than one gets returned, a collision occured.
     """
-    def get_receivable_messages(self, simulation_time: int, active_transmissions: list[Transmission]) -> list[Message]:
-        def predicate_close_and_arriving(t: Transmission) -> bool:
-            lb = t.transmit_time + self.get_packet_travel_time(get_node_by_id(self.neighbors, t.message.source))
-            ub = t.transmit_time + self.get_packet_travel_time(get_node_by_id(self.neighbors, t.message.source)) + t.message.length
+    def get_receivable_messages(self, simulation_time: int, active_transmissions: Channel) -> list[Transmission]:
+        return active_transmissions.get_receivable_messages(self.id, simulation_time)
 
-            return simulation_time in list(range(lb, ub))
 
-        receivable_packets = []
-        for transmission in active_transmissions:
-            # Check whether the message was sent by one of the nodes neighbors
-            if get_node_by_id(self.neighbors, transmission.message.source):
-                # Check whether the message can already be received
-                if predicate_close_and_arriving(transmission):
-                    receivable_packets.append(transmission)
-
-        return receivable_packets
+    """
+    Return the earliest simulation time at which a transmission starts arriving at the node. If more than one
+    transmission is currently arriving, the node has to check for collisions every tick and `simulation_time` is returned.
+    """
+    def next_arrival(self, simulation_time: int, active_transmissions: Channel) -> int | float:
+        return active_transmissions.next_arrival(self.id, simulation_time)
 
 
     def get_packet_travel_time(self, sender) -> int:
+        if self.topology is not None and sender.topology is self.topology:
+            return self.topology.get_travel_time(self, sender)
         return int(get_distance_between_nodes(self, sender))
 
 
     def add_neighbors(self, nodes):
-        self.neighbors = []
+        neighbors = []
         for node in nodes:
             if node.id != self.id:
                 distance = get_distance_between_nodes(self, node)
                 # Check if the distance between the new node and an existing node is less than the sum of their radii plus the minimum distance
                 if distance < (self.radius + node.radius + self.transceive_range):
-                    self.neighbors.append(node)
+                    neighbors.append(node)
+        self.set_neighbors(neighbors)
+
+
+    def set_random_streams(self, random_streams: NodeStreams):
+        self.random_streams = random_streams
+        self.protocol.random = random_streams.backoff
+
+
+    def set_neighbors(self, neighbors: list['Node']):
+        for node in self.neighbors:
+            node.receivers_by_id.pop(self.id, None)
+        self.neighbors = neighbors
+        self.neighbors_by_id = {node.id: node for node in neighbors}
+        for node in neighbors:
+            node.receivers_by_id[self.id] = self
+
+
+    def get_neighbor(self, id: int) -> 'Node | None':
+        """
+        Constant time version of `get_node_by_id(self.neighbors, id)`.
+        """
+        return self.neighbors_by_id.get(id)
 
     def get_color_based_on_state(self) -> str:
         if self.state == State.Idle:
@@ -218,6 +304,13 @@ class Node:
 def get_distance_between_nodes(n1: Node, n2: Node) -> float:
     return np.sqrt((n1.x_pos - n2.x_pos) ** 2 + (n1.y_pos - n2.y_pos) ** 2)
 
+def get_max_propagation_delay(nodes: list[Node]) -> int:
+    """
+    Upper bound of `get_packet_travel_time` between any two neighbors, see `add_neighbors`.
+    """
+    max_radius = max(node.radius for node in nodes)
+    return int(max(2 * max_radius + node.transceive_range for node in nodes))
+
 def get_node_by_id(nodes: list[Node], id: int) -> Node:
     for node in nodes:
         if node.id == id:
@@ -1,34 +1,121 @@
+import heapq
 import logging
-from dataclasses import dataclass
-from random import randint
+from collections import deque
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, replace
 from typing import Protocol
-from collections import defaultdict
 
+from random_streams import RandomStream
 from transmission import HighLevelMessage, Message, MessageType
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DSDVEntry:
     next: int
     distance_metric: int | float
     seq: int
 
 
+class DSDVTableSnapshot(Mapping):
+    """
+    Read-only routing table as it was when it was broadcast. A full dump shares the dict of the owner's table by
+    reference, the owner copies its table before changing it, see `DSDVRoutingProtocol.set_entry`. An incremental
+    update only holds the entries changed since the owner's last full dump.
+    """
+    __slots__ = ('owner', 'version', 'entries', 'full')
+
+    def __init__(self, owner: int, version: int, entries: dict[int, DSDVEntry], full: bool = True):
+        self.owner = owner
+        self.version = version
+        self.entries = entries
+        self.full = full
+
+    def __getitem__(self, target: int) -> DSDVEntry:
+        return self.entries[target]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __repr__(self) -> str:
+        return f'DSDVTableSnapshot(owner={self.owner}, version={self.version}, full={self.full}, {self.entries})'
+
+
 class DSDVRoutingProtocol:
 
-    def __init__(self, id: int):
+    def __init__(self, id: int, random: RandomStream, full_dump_interval: int = 5):
         # maps the target to its respective table entry
         self.table: dict[int: DSDVEntry] = {id: DSDVEntry(id, 0, 0)}
-        self.staleness: dict[int: int] = defaultdict(lambda: 0)
+        # Clock of the protocol, counts the calls of `check_staleness` and the ticks skipped by `fast_forward`
+        self.clock = 0
+        # Maps every node heard from to the clock value at which it was last heard
+        self.last_heard: dict[int, int] = {}
+        # Heap of (deadline, node) with one entry per node in `last_heard`. The deadline can be older than the node's
+        # actual one, the entry is then pushed back when it comes up, see `check_staleness`.
+        self.staleness_deadlines: list[tuple[int, int]] = []
+        self.random = random
         self.max_share_table_backoff = 200
-        self.share_table_backoff = randint(0, self.max_share_table_backoff)
+        self.share_table_backoff = self.random.randint(0, self.max_share_table_backoff)
         self.id = id
-        self.buffer: list[HighLevelMessage] = []
+        # Messages waiting for a route, by target. Every message is stored with its position in the order of `send`
+        # calls, so messages to different targets are released in the order they were sent.
+        self.buffer: dict[int, deque[tuple[int, HighLevelMessage]]] = {}
+        self.buffered_count = 0
+        # Heap of (position of the first message, target) of the buffered targets that have a route. Entries that are
+        # out of date are dropped when they come up, see `get_ready_target`.
+        self.ready_targets: list[tuple[int, int]] = []
         self.sequence = 0
+        # Snapshot of `table` for broadcasts, None once the table changed after it was taken
+        self.snapshot: DSDVTableSnapshot | None = None
+        self.snapshot_version = 0
+        # Every `full_dump_interval`th broadcast sends the whole table, the others only the entries in `changed`
+        self.full_dump_interval = full_dump_interval
+        self.broadcasts_since_full_dump = 0
+        self.changed: set[int] = set()
 
     def get_next(self, target: int) -> int:
         return self.table[target].next
 
+    def set_entry(self, target: int, entry: DSDVEntry):
+        """
+        Changes the routing table. The table is copied first if a snapshot still shares it, so snapshots in flight
+        keep their content. Entries are immutable and are shared by both copies.
+        """
+        if self.snapshot is not None:
+            self.table = dict(self.table)
+            self.snapshot = None
+        if target in self.buffer and entry.distance_metric != float('inf') and not self.has_route(target):
+            heapq.heappush(self.ready_targets, (self.buffer[target][0][0], target))
+        self.table[target] = entry
+        self.changed.add(target)
+
+    def get_snapshot(self) -> DSDVTableSnapshot:
+        """
+        Returns the current table for a broadcast. Broadcasts of an unchanged table share the same snapshot.
+        """
+        if self.snapshot is None:
+            self.snapshot_version += 1
+            self.snapshot = DSDVTableSnapshot(self.id, self.snapshot_version, self.table)
+        return self.snapshot
+
+    def get_update(self) -> DSDVTableSnapshot:
+        """
+        Returns the table update for the next broadcast. Every `full_dump_interval`th update is a full dump, as is any
+        update that would carry more than half of the table anyway. The others are incremental and only carry the
+        entries changed since the last full dump.
+        """
+        self.broadcasts_since_full_dump += 1
+        if self.broadcasts_since_full_dump >= self.full_dump_interval or 2 * len(self.changed) > len(self.table):
+            self.broadcasts_since_full_dump = 0
+            self.changed.clear()
+            return self.get_snapshot()
+
+        self.snapshot_version += 1
+        entries = {target: self.table[target] for target in self.changed}
+        return DSDVTableSnapshot(self.id, self.snapshot_version, entries, full=False)
+
     def send(self, msg: HighLevelMessage):
         """
         Messages can only be sent if the routing algorithm is aware of them so it now becomes the primary buffer for planned transmissions.
@@ -36,7 +123,40 @@ class DSDVRoutingProtocol:
         :return:
         """
         logging.info(f'Message {msg} was added to buffer of {self.id}.')
-        self.buffer.append(msg)
+        queue = self.buffer.setdefault(msg.target, deque())
+        if not queue and self.has_route(msg.target):
+            heapq.heappush(self.ready_targets, (self.buffered_count, msg.target))
+        queue.append((self.buffered_count, msg))
+        self.buffered_count += 1
+
+    def has_route(self, target: int) -> bool:
+        return target in self.table and self.table[target].distance_metric != float('inf')
+
+    def get_ready_target(self) -> int | None:
+        """
+        Returns the target of the oldest buffered message that has a route, or None if there is no such message.
+        """
+        while self.ready_targets:
+            position, target = self.ready_targets[0]
+            queue = self.buffer.get(target)
+            if queue and queue[0][0] == position and self.has_route(target):
+                return target
+            # Released already, or the route was lost again and the target is pushed once it has a route again
+            heapq.heappop(self.ready_targets)
+        return None
+
+    def release(self, target: int) -> HighLevelMessage:
+        """
+        Removes the oldest buffered message to `target` from the buffer.
+        """
+        heapq.heappop(self.ready_targets)
+        queue = self.buffer[target]
+        _, msg = queue.popleft()
+        if queue:
+            heapq.heappush(self.ready_targets, (queue[0][0], target))
+        else:
+            del self.buffer[target]
+        return msg
 
     def tick(self) -> HighLevelMessage | None:
         """
@@ -46,28 +166,68 @@ class DSDVRoutingProtocol:
         # Check for lost connections
         self.check_staleness()
 
-        if self.buffer:
-            for msg in self.buffer:
-                if msg.target in self.table and self.table[msg.target].distance_metric != float('inf'):
-                    self.buffer.remove(msg)
-                    return msg.configure_routing(self.table[msg.target].next, self.id)
+        target = self.get_ready_target()
+        if target is not None:
+            return self.release(target).configure_routing(self.table[target].next, self.id)
 
         self.share_table_backoff -= 1
         if self.share_table_backoff <= 0:
-            self.share_table_backoff = randint(0, self.max_share_table_backoff)
+            self.share_table_backoff = self.random.randint(0, self.max_share_table_backoff)
             self.sequence += 2
-            self.table[self.id].seq = self.sequence
-            return HighLevelMessage(-1, self.table, 1)
+            self.set_entry(self.id, replace(self.table[self.id], seq=self.sequence))
+            return HighLevelMessage(-1, self.get_update(), 1)
+
+    def next_wakeup(self, simulation_time: int) -> int | float:
+        """
+        Returns the earliest simulation time at which `tick` does more than count down `share_table_backoff` and
+        advance the clock.
+
+        :param simulation_time: current time of the simulation
+        """
+        if self.get_ready_target() is not None:
+            return simulation_time
+
+        wakeup = simulation_time + max(self.share_table_backoff, 1) - 1
+        if self.staleness_deadlines:
+            # The tick at `simulation_time` advances the clock to `self.clock + 1`
+            wakeup = min(wakeup, simulation_time + max(self.staleness_deadlines[0][0] - self.clock - 1, 0))
+
+        return wakeup
+
+    def fast_forward(self, ticks: int):
+        """
+        Counts down `share_table_backoff` and advances the clock by `ticks` without calling `tick`.
+        :param ticks: number of skipped clock ticks
+        """
+        self.share_table_backoff -= ticks
+        self.clock += ticks
+
+    def get_staleness_deadline(self, node: int) -> int:
+        """
+        Returns the clock value at which `node` counts as lost if it is not heard from again.
+        """
+        return self.last_heard[node] + 4 * self.max_share_table_backoff + 1
 
     def check_staleness(self):
-        for node in self.staleness:
-            self.staleness[node] += 1
-            if (self.staleness[node] > 4 * self.max_share_table_backoff
-                    and self.table[node].seq % 2 == 0
-                    and self.table[node].next == node):
+        """
+        Advances the clock and invalidates the routes to direct neighbors that have not been heard from for more than
+        `4 * max_share_table_backoff` ticks. Only the deadlines that are due are looked at.
+        """
+        self.clock += 1
+        while self.staleness_deadlines and self.staleness_deadlines[0][0] <= self.clock:
+            _, node = heapq.heappop(self.staleness_deadlines)
+            deadline = self.get_staleness_deadline(node)
+            if deadline > self.clock:
+                # Heard from again since the deadline was pushed
+                heapq.heappush(self.staleness_deadlines, (deadline, node))
+                continue
+
+            # Only hearing from the node again can turn its entry into a valid direct route, which tracks it again
+            del self.last_heard[node]
+            entry = self.table.get(node)
+            if entry is not None and entry.seq % 2 == 0 and entry.next == node:
                 logging.debug(f'Staleness detected for node {node}; detected by node {self.id}.')
-                self.table[node].seq += 1
-                self.table[node].distance_metric = float('inf')
+                self.set_entry(node, replace(entry, seq=entry.seq + 1, distance_metric=float('inf')))
 
     def reply(self, msg: Message, distance: int) -> HighLevelMessage | None:
         """
@@ -78,7 +238,10 @@ class DSDVRoutingProtocol:
         :return: Either nothing or another message, be it table broadcast or to pass along a route finding messge.
         """
 
-        self.staleness[msg.source] = 0
+        if msg.source not in self.last_heard:
+            heapq.heappush(self.staleness_deadlines,
+                           (self.clock + 4 * self.max_share_table_backoff + 1, msg.source))
+        self.last_heard[msg.source] = self.clock
 
         if msg.get_type() == MessageType.Data:
             # takes care of an actual route that needs to be walked.
@@ -95,22 +258,22 @@ class DSDVRoutingProtocol:
         return self.tick()
 
     def update_tables(self, distance, msg):
-        table: dict[int: DSDVEntry] = msg.content
+        table: DSDVTableSnapshot = msg.content
         # prevent lookup errors.
         for target in table:
             if target not in self.table:
-                self.table[target] = DSDVEntry(-1, float('inf'), -1)
+                self.set_entry(target, DSDVEntry(-1, float('inf'), -1))
         for target, entry in table.items():
             current_entry = self.table[target]
             adjusted_distance = entry.distance_metric + distance
 
             # Check staleness and distance.
             if entry.seq > current_entry.seq and current_entry.distance_metric >= adjusted_distance:
-                self.table[target] = DSDVEntry(msg.source, adjusted_distance, entry.seq)
+                self.set_entry(target, DSDVEntry(msg.source, adjusted_distance, entry.seq))
 
             # Check odd sequence number in case of infinite distance.
             elif entry.seq % 2 == 1 and entry.seq > current_entry.seq:
-                self.table[target] = DSDVEntry(entry.next, entry.distance_metric, entry.seq)
+                self.set_entry(target, entry)
 
 
 class MACProtocol():
@@ -121,6 +284,8 @@ class MACProtocol():
         self.sequence_number = 0
         self.currently_transmitting = None
         self.currently_receiving = None
+        # Set by `Node.set_random_streams`
+        self.random: RandomStream | None = None
 
     # The currently transmitted `Transmission`
     currently_receiving: Message
@@ -139,7 +304,7 @@ class MACProtocol():
     
 
     def set_backoff(self):
-        self.backoff = randint(self.min_backoff, self.max_backoff)
+        self.backoff = self.random.randint(self.min_backoff, self.max_backoff)
         if self.max_backoff < 256:
             self.max_backoff *= 2
 
@@ -155,14 +320,15 @@ class MACProtocol():
 
     def generate_data(self, source_id: int, high_level_message: HighLevelMessage) -> Message:
         return Message(self.next_sequence_number(), high_level_message.target, source_id, high_level_message.content,
-                       high_level_message.length, high_level_message.route_target, high_level_message.route_source)
+                       high_level_message.length, high_level_message.route_target, high_level_message.route_source,
+                       MessageType.Data)
 
     def generate_ack(self, source_id, target_id: int) -> Message:
-        return Message(self.next_sequence_number(), target_id, source_id, "ack", 1)
+        return Message(self.next_sequence_number(), target_id, source_id, "ack", 1, message_type=MessageType.ACK)
 
     def generate_broadcast(self, source_id: int, high_level_message: HighLevelMessage) -> Message:
         return Message(self.next_sequence_number(), high_level_message.target, source_id, high_level_message.content,
-                       high_level_message.length)
+                       high_level_message.length, message_type=MessageType.BROADCAST)
 
 
 class ALOHA(MACProtocol):    
@@ -185,9 +351,13 @@ class RTSCTSALOHA(MACProtocol):
 
     def generate_rts(self, source_id: int, target_id: int, node_distance: int, data_length: int):
         # wait for: propagation time * 3 + message length + CTS + ACK
-        return Message(self.next_sequence_number(), target_id, source_id, f"rts {int(node_distance * 3 + data_length + 1 + 1)} {int(data_length)}", 1)
+        waiting_time = int(node_distance * 3 + data_length + 1 + 1)
+        return Message(self.next_sequence_number(), target_id, source_id, f"rts {waiting_time} {int(data_length)}", 1,
+                       message_type=MessageType.RTS, waiting_time=waiting_time, payload_length=int(data_length))
     
     
     def generate_cts(self, source_id: int, target_id: int, node_distance: int, data_length: int):
         # wait for: propagation time * 2 + message length + ACK
-        return Message(self.next_sequence_number(), target_id, source_id, f"cts {int(node_distance * 2 + data_length + 1)}", 1)
\ No newline at end of file
+        waiting_time = int(node_distance * 2 + data_length + 1)
+        return Message(self.next_sequence_number(), target_id, source_id, f"cts {waiting_time}", 1,
+                       message_type=MessageType.CTS, waiting_time=waiting_time)
\ No newline at end of file
@@ -0,0 +1,75 @@
+"""
+Random number streams of a simulation run.
+
+All randomness of a run is derived from one `numpy.random.SeedSequence`. The scenario draws its send times from its own
+stream and every node has independent child streams for its backoff, mobility and routing, identified by the node id.
+Draws of one node therefore never shift the draws of another, and runs with different seeds are independent even when
+they run in parallel. Nothing depends on the global `random` or `np.random` state.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+# First element of the spawn keys, separates the scenario stream from the node streams
+SCENARIO_STREAM = 0
+NODE_STREAMS = 1
+
+
+class RandomStream:
+    """
+    Draws from its own generator in batches, which is a lot cheaper than drawing values one by one. The generator is
+    only created on the first draw, since most streams of most nodes are never used.
+    """
+
+    def __init__(self, entropy: int, spawn_key: tuple[int, ...], batch_size: int = 256):
+        self.entropy = entropy
+        self.spawn_key = spawn_key
+        self.batch_size = batch_size
+        self.generator: np.random.Generator | None = None
+        self.uniforms: list[float] = []
+        self.normals: list[float] = []
+
+    def get_generator(self) -> np.random.Generator:
+        if self.generator is None:
+            self.generator = np.random.default_rng(np.random.SeedSequence(self.entropy, spawn_key=self.spawn_key))
+        return self.generator
+
+    def randint(self, low: int, high: int) -> int:
+        """
+        Returns a random integer in [low, high], like `random.randint`.
+        """
+        if not self.uniforms:
+            self.uniforms = self.get_generator().random(self.batch_size).tolist()
+        return low + int(self.uniforms.pop() * (high - low + 1))
+
+    def normal(self) -> float:
+        """
+        Returns a sample of the standard normal distribution.
+        """
+        if not self.normals:
+            self.normals = self.get_generator().standard_normal(self.batch_size).tolist()
+        return self.normals.pop()
+
+
+@dataclass(slots=True)
+class NodeStreams:
+    backoff: RandomStream
+    mobility: RandomStream
+    routing: RandomStream
+
+
+class RandomStreams:
+    """
+    All random number streams of one run. Equal seeds give equal streams. Without a seed, a fresh one is drawn from the
+    operating system and kept in `seed_sequence.entropy`, so the run can still be reproduced.
+    """
+
+    def __init__(self, seed: int | None = None):
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self.scenario = self.get_stream(SCENARIO_STREAM)
+
+    def get_stream(self, *key: int) -> RandomStream:
+        return RandomStream(self.seed_sequence.entropy, self.seed_sequence.spawn_key + key)
+
+    def get_node_streams(self, node_id: int) -> NodeStreams:
+        return NodeStreams(*(self.get_stream(NODE_STREAMS, node_id, purpose) for purpose in range(3)))
@@ -0,0 +1,102 @@
+"""
+Columnar store for the results of data sink replications.
+
+Results are buffered in memory and written in batches as uncompressed `.npz` shards, one column per field. Per-node
+counters have a different length per run, they are stored flattened with `node_offsets` marking where every run's
+nodes start, like the rows of a CSR matrix. `load_results` concatenates all shards of a directory into one set of
+columns.
+"""
+import glob
+import os
+import time
+
+import numpy as np
+
+from scenarious import DataSinkResult
+
+RESULT_DIRECTORY = './data/results'
+
+
+class ResultStore:
+    """
+    Buffers results and writes a shard to `directory` every `batch_size` results and on `flush`. Can be used as a
+    context manager that flushes on exit.
+    """
+
+    def __init__(self, directory: str = RESULT_DIRECTORY, batch_size: int = 10_000):
+        self.directory = directory
+        self.batch_size = batch_size
+        self.shard_prefix = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        self.shard_count = 0
+        self.clear()
+
+    def clear(self):
+        self.scenarios: list[str] = []
+        self.seeds: list[int] = []
+        self.completion_times: list[int] = []
+        self.collisions: list[int] = []
+        self.node_offsets: list[int] = [0]
+        self.node_ids: list[int] = []
+        self.node_collisions: list[int] = []
+
+    def add(self, scenario: str, seed: int, result: DataSinkResult):
+        self.scenarios.append(scenario)
+        self.seeds.append(seed)
+        self.completion_times.append(result.completion_time)
+        self.collisions.append(result.collisions)
+        self.node_ids.extend(result.node_ids)
+        self.node_collisions.extend(result.node_collisions)
+        self.node_offsets.append(len(self.node_ids))
+
+        if len(self.scenarios) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.scenarios:
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f'{self.shard_prefix}-{self.shard_count}.npz')
+        # Readers only pick up complete shards, `np.savez` appends `.npz` to names without it
+        temporary_path = path + '.tmp.npz'
+        np.savez(
+            temporary_path,
+            scenario=np.array(self.scenarios),
+            seed=np.array(self.seeds, dtype=np.int64),
+            completion_time=np.array(self.completion_times, dtype=np.int64),
+            collisions=np.array(self.collisions, dtype=np.int64),
+            node_offsets=np.array(self.node_offsets, dtype=np.int64),
+            node_ids=np.array(self.node_ids, dtype=np.int64),
+            node_collisions=np.array(self.node_collisions, dtype=np.int64),
+        )
+        os.replace(temporary_path, path)
+
+        self.shard_count += 1
+        self.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
+
+
+def load_results(directory: str = RESULT_DIRECTORY) -> dict[str, np.ndarray]:
+    """
+    Loads all shards in `directory` into one array per column. `node_offsets` has one more entry than there are
+    results, the per-node counters of result `i` are at `node_offsets[i]:node_offsets[i + 1]`.
+    """
+    paths = sorted(path for path in glob.glob(os.path.join(directory, '*.npz')) if not path.endswith('.tmp.npz'))
+    if not paths:
+        raise FileNotFoundError(f'No results in {directory}')
+    shards = [np.load(path) for path in paths]
+
+    columns = {column: np.concatenate([shard[column] for shard in shards])
+               for column in ('scenario', 'seed', 'completion_time', 'collisions', 'node_ids', 'node_collisions')}
+
+    node_offsets = [np.zeros(1, dtype=np.int64)]
+    for shard in shards:
+        node_offsets.append(shard['node_offsets'][1:] + node_offsets[-1][-1])
+    columns['node_offsets'] = np.concatenate(node_offsets)
+
+    return columns
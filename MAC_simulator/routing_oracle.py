@@ -0,0 +1,97 @@
+"""
+Routing tables computed directly from the neighbor graph, as DSDV would have them once it converged.
+
+`RoutingOracle` searches the shortest routes between all pairs of nodes in one vectorized pass, with the packet travel
+times between neighbors as edge weights like the DSDV distance metric. It only recomputes when the neighbors changed.
+The result can be written into the `DSDVRoutingProtocol.table` of every node, or serve as the reference for the tables
+DSDV built itself. Requires scipy.
+"""
+import numpy as np
+
+from neighbor_index import NeighborIndex
+from protocols import DSDVEntry
+from topology import Topology
+
+
+class RoutingOracle:
+
+    def __init__(self):
+        # Neighbors the routes were computed for, the neighbor index replaces the lists whenever a node moved
+        self.neighbor_indices: list[list[int]] | None = None
+        self.ids: list[int] = []
+        # Length of the shortest route from the node at index i to the node at index j, inf if there is none
+        self.distances = np.empty((0, 0), dtype=np.float64)
+        # Index of the first hop of that route, -1 if there is none
+        self.next_hops = np.empty((0, 0), dtype=np.int64)
+
+    def update(self, topology: Topology, neighbor_index: NeighborIndex) -> bool:
+        """
+        Recomputes the routes if the neighbors changed since the last call. `topology` and `neighbor_index` have to be
+        updated for the same list of nodes.
+
+        :return: whether the routes were recomputed
+        """
+        if neighbor_index.neighbor_indices is self.neighbor_indices:
+            return False
+
+        from scipy.sparse import csr_matrix
+        from scipy.sparse.csgraph import shortest_path
+
+        neighbor_indices = neighbor_index.neighbor_indices
+        node_count = len(neighbor_indices)
+        counts = [len(indices) for indices in neighbor_indices]
+        # A node receives from its neighbors, so every neighbor pair is an edge from the neighbor to the node
+        receivers = np.repeat(np.arange(node_count), counts)
+        senders = np.fromiter((j for indices in neighbor_indices for j in indices), dtype=np.int64, count=sum(counts))
+        weights = topology.travel_times[receivers, senders].astype(np.float64)
+
+        # Searching backwards from every target along the edges from receiver to sender makes the predecessor of a node
+        # its first hop towards the target, `predecessors[target, node]`. Explicit zeros are edges for csgraph,
+        # neighbors closer than one distance unit are kept.
+        reversed_graph = csr_matrix((weights, (receivers, senders)), shape=(node_count, node_count))
+        distances, predecessors = shortest_path(reversed_graph, directed=True, return_predecessors=True)
+
+        next_hops = predecessors.T.astype(np.int64)
+        next_hops[next_hops < 0] = -1
+        np.fill_diagonal(next_hops, np.arange(node_count))
+
+        self.neighbor_indices = neighbor_indices
+        self.ids = topology.ids
+        self.distances = distances.T
+        self.next_hops = next_hops
+        return True
+
+    def fill_tables(self, nodes: list):
+        """
+        Writes the routes into the routing tables of `nodes`, in the same order as passed to the topology. Routes get
+        the current sequence number of their target, like after a broadcast of that target, routes that were lost get
+        an odd one. The own entry of every node is left to its protocol.
+        """
+        sequences = [node.routing_protocol.sequence for node in nodes]
+        for i, node in enumerate(nodes):
+            protocol = node.routing_protocol
+            next_hops = self.next_hops[i].tolist()
+            distances = self.distances[i].tolist()
+            for j, target in enumerate(self.ids):
+                if j == i:
+                    continue
+                if next_hops[j] >= 0:
+                    protocol.set_entry(target, DSDVEntry(self.ids[next_hops[j]], int(distances[j]), sequences[j]))
+                elif target in protocol.table and protocol.table[target].distance_metric != float('inf'):
+                    protocol.set_entry(target, DSDVEntry(-1, float('inf'), sequences[j] + 1))
+
+    def get_suboptimal_routes(self, nodes: list) -> list[tuple[int, int]]:
+        """
+        Compares the routing tables of `nodes` with the shortest routes, e.g. to check DSDV after it had time to
+        converge. Only the distances are compared, as there can be several shortest routes.
+
+        :return: (node id, target id) of every route that is missing or longer than the shortest one
+        """
+        suboptimal_routes = []
+        for i, node in enumerate(nodes):
+            table = node.routing_protocol.table
+            for j, distance in enumerate(self.distances[i].tolist()):
+                entry = table.get(self.ids[j])
+                if distance != float('inf') and (entry is None or entry.distance_metric > distance):
+                    suboptimal_routes.append((node.id, self.ids[j]))
+        return suboptimal_routes
@@ -1,6 +1,15 @@
 from node import *
 
 class RTSCTSNode(Node):
+    state_handler_names = {
+        State.Idle: 'idle_state',
+        State.Receiving: 'receiving_state',
+        State.Sending: 'sending_state',
+        State.BackingOff: 'backing_off_state',
+        State.WaitingForAnswer: 'waiting_for_answer_state',
+        State.ReceivedCTSRTSBackoff: 'received_rts_cts_backoff_state',
+    }
+
     def __init__(self, id: int, radius: float, transceive_range: float, x_pos: float, y_pos: float):
         self.id = id
         self.radius = radius
@@ -60,7 +69,7 @@ class RTSCTSNode(Node):
         logging.debug("\tTransition to {}".format(self.state))
 
 
-    def transition_to_sending(self, simulation_time: int, message_to_send: Message, active_transmissions: list[Transmission]):
+    def transition_to_sending(self, simulation_time: int, message_to_send: Message, active_transmissions: Channel):
         self.state = State.Sending
         self.protocol.backoff = 0
         self.sending_state_counter = message_to_send.length
@@ -89,20 +98,67 @@ class RTSCTSNode(Node):
         logging.debug("\tTransition to {} with backoff={}".format(self.state, self.protocol.backoff))
 
 
-    def execute_state_machine(self, simulation_time: int, active_transmissions: list[Transmission]):
-        logging.debug("node {} - [State: {}]".format(self.id, self.state.name))
+    def get_state_counter(self) -> int:
+        if self.state == State.Sending:
+            return self.sending_state_counter
+        elif self.state == State.Receiving:
+            return self.receiving_state_counter
+        elif self.state == State.BackingOff:
+            return self.protocol.backoff
+        elif self.state == State.WaitingForAnswer:
+            # Same precedence as in `waiting_for_answer_state`
+            if self.wait_for_data_counter != 0:
+                return self.wait_for_data_counter
+            elif self.wait_for_ack_counter != 0:
+                return self.wait_for_ack_counter
+            return self.wait_for_cts_counter
+        elif self.state == State.ReceivedCTSRTSBackoff:
+            return self.received_rts_cts_backoff_state_counter
+
+
+    def next_wakeup(self, simulation_time: int) -> int | float:
         if self.state == State.Idle:
-            self.idle_state(simulation_time, active_transmissions)
+            return simulation_time if self.send_schedule else float('inf')
+
+        # The counter is decremented before it is checked, so it expires `counter - 1` ticks from now
+        return simulation_time + max(self.get_state_counter(), 1) - 1
+
+
+    def fast_forward(self, ticks: int):
+        if self.state == State.Sending:
+            self.sending_state_counter -= ticks
         elif self.state == State.Receiving:
-            self.receiving_state(simulation_time, active_transmissions)
-        elif self.state == State.Sending:
-            self.sending_state(simulation_time)   
+            self.receiving_state_counter -= ticks
         elif self.state == State.BackingOff:
-            self.backing_off_state(simulation_time, active_transmissions)   
+            self.protocol.backoff -= ticks
         elif self.state == State.WaitingForAnswer:
-            self.waiting_for_answer_state(simulation_time, active_transmissions)
+            if self.wait_for_data_counter != 0:
+                self.wait_for_data_counter -= ticks
+            elif self.wait_for_ack_counter != 0:
+                self.wait_for_ack_counter -= ticks
+            elif self.wait_for_cts_counter != 0:
+                self.wait_for_cts_counter -= ticks
         elif self.state == State.ReceivedCTSRTSBackoff:
-            self.received_rts_cts_backoff_state(simulation_time, active_transmissions)
+            self.received_rts_cts_backoff_state_counter -= ticks
+
+
+    def resume_previous_state(self):
+        elapsed = self.protocol.currently_receiving.length - self.receiving_state_counter
+        # If we were waiting for a message, return to waiting
+        if self.wait_for_ack_counter > 0:
+            self.transition_to_wait_for_answer(self.wait_for_ack_counter - elapsed, 0, 0)
+        elif self.wait_for_cts_counter > 0:
+            self.transition_to_wait_for_answer(0, self.wait_for_cts_counter - elapsed, 0)
+        elif self.wait_for_data_counter > 0:
+            self.transition_to_wait_for_answer(0, 0, self.wait_for_data_counter - elapsed)
+        # Just go back in case of collision
+        elif self.received_rts_cts_backoff_state_counter > 0:
+            self.transition_to_received_rts_cts_backoff(self.received_rts_cts_backoff_state_counter - elapsed)
+        # If we were backing off, return to backoff
+        elif self.protocol.backoff > 0:
+            self.transition_to_backoff(self.protocol.backoff - elapsed)
+        else:
+            self.transition_to_idle()
 
 
     #################################################################################################################################
@@ -112,11 +168,11 @@ class RTSCTSNode(Node):
     #################################################################################################################################
 
 
-    def idle_state(self, simulation_time: int, active_transmissions: list['Transmission']):
+    def idle_state(self, simulation_time: int, active_transmissions: Channel):
         # Anything to receive?
         if transmissions := self.get_receivable_messages(simulation_time, active_transmissions):
             match transmissions:
-                case [transmission] if transmission.transmit_time + self.get_packet_travel_time(get_node_by_id(self.neighbors, transmission.message.source)) == simulation_time:
+                case [transmission] if transmission.transmit_time + self.get_packet_travel_time(self.get_neighbor(transmission.message.source)) == simulation_time:
                     self.transition_to_receiving(transmission.message)
                     return
                 case [_, _, *_]:
@@ -141,15 +197,15 @@ class RTSCTSNode(Node):
             return
 
 
-    def sending_state(self, simulation_time: int):
+    def sending_state(self, simulation_time: int, active_transmissions: Channel):
         self.sending_state_counter -= 1
         logging.debug("\tstate_counter: {}".format(self.sending_state_counter))
         if self.sending_state_counter <= 0:
             # Message is fully sent
             message_type = self.protocol.currently_transmitting.get_type()
-            msg = repr(self.protocol.currently_transmitting)
-            if 'DSDV' not in msg:
-                logging.info(f'node {self.id} attempted to send {msg}')
+            # Routing table broadcasts are too noisy to log
+            if message_type != MessageType.BROADCAST:
+                logging.info(f'node {self.id} attempted to send {self.protocol.currently_transmitting!r}')
 
             logging.debug("\tFinished sending [{}]".format(self.protocol.currently_transmitting))
 
@@ -166,104 +222,24 @@ class RTSCTSNode(Node):
                 self.transition_to_idle()
 
 
-    def receiving_state(self, simulation_time: int, active_transmissions: list[Transmission]):
+    def receiving_state(self, simulation_time: int, active_transmissions: Channel):
         # Check for collisions
         if transmissions := self.get_receivable_messages(simulation_time, active_transmissions):
             match transmissions:
-                case [transmission] if transmission.transmit_time + self.get_packet_travel_time(get_node_by_id(self.neighbors, transmission.message.source)) == simulation_time:
+                case [transmission] if transmission.transmit_time + self.get_packet_travel_time(self.get_neighbor(transmission.message.source)) == simulation_time:
                     if transmission.message != self.protocol.currently_receiving:
                         logging.debug("\tCollision with [{}]".format(transmission.message))
                         self.collision_counter += 1
-                        # If we were waiting for a message, return to waiting
-                        if self.wait_for_ack_counter > 0:
-                            new_wait_for_answer_state_counter = self.wait_for_ack_counter - (self.protocol.currently_receiving.length - self.receiving_state_counter)
-                            self.transition_to_wait_for_answer(new_wait_for_answer_state_counter, 0, 0)
-                            return
-                        elif self.wait_for_cts_counter > 0:
-                            new_wait_for_answer_state_counter = self.wait_for_cts_counter - (self.protocol.currently_receiving.length - self.receiving_state_counter)
-                            self.transition_to_wait_for_answer(0, new_wait_for_answer_state_counter, 0)
-                            return
-                        elif self.wait_for_data_counter > 0:
-                            new_wait_for_answer_state_counter = self.wait_for_data_counter - (self.protocol.currently_receiving.length - self.receiving_state_counter)
-                            self.transition_to_wait_for_answer(0, 0, new_wait_for_answer_state_counter)
-                            return
-                        
-                        # Just go back in case of collision
-                        if self.received_rts_cts_backoff_state_counter > 0:
-                            self.transition_to_received_rts_cts_backoff(self.received_rts_cts_backoff_state_counter - (self.protocol.currently_receiving.length - self.receiving_state_counter))
-                            return
-                        
-                        # If we were backing off, return to backoff
-                        if self.protocol.backoff > 0:
-                            new_backoff = self.protocol.backoff - (self.protocol.currently_receiving.length - self.receiving_state_counter)
-                            self.transition_to_backoff(new_backoff)
-                            return
-
-                        self.transition_to_idle()
+                        self.resume_previous_state()
                         return
                 case [_, _, *_]:
                     logging.debug("\tCollision, received more than one Message at the same time.")
                     self.collision_counter += 1
-                    # If we were waiting for a message, return to waiting
-                    if self.wait_for_ack_counter > 0:
-                        new_wait_for_answer_state_counter = self.wait_for_ack_counter - (self.protocol.currently_receiving.length - self.receiving_state_counter)
-                        self.transition_to_wait_for_answer(new_wait_for_answer_state_counter, 0, 0)
-                        return
-                    elif self.wait_for_cts_counter > 0:
-                        new_wait_for_answer_state_counter = self.wait_for_cts_counter - (self.protocol.currently_receiving.length - self.receiving_state_counter)
-                        self.transition_to_wait_for_answer(0, new_wait_for_answer_state_counter, 0)
-                        return
-                    elif self.wait_for_data_counter > 0:
-                        new_wait_for_answer_state_counter = self.wait_for_data_counter - (self.protocol.currently_receiving.length - self.receiving_state_counter)
-                        self.transition_to_wait_for_answer(0, 0, new_wait_for_answer_state_counter)
-                        return
-                    
-                    # Just go back in case of collision
-                    if self.received_rts_cts_backoff_state_counter > 0:
-                        self.transition_to_received_rts_cts_backoff(self.received_rts_cts_backoff_state_counter - (self.protocol.currently_receiving.length - self.receiving_state_counter))
-                        return
-
-                    # If we were backing off, return to backoff
-                    if self.protocol.backoff > 0:
-                        new_backoff = self.protocol.backoff - (self.protocol.currently_receiving.length - self.receiving_state_counter)
-                        self.transition_to_backoff(new_backoff)
-                        return
-
-                    self.transition_to_idle()
+                    self.resume_previous_state()
                     return
                 case []:
                     logging.info('we were receiving but moved out of range.')
-                    # If we were waiting for a message, return to waiting
-                    if self.wait_for_ack_counter > 0:
-                        new_wait_for_answer_state_counter = self.wait_for_ack_counter - (
-                                    self.protocol.currently_receiving.length - self.receiving_state_counter)
-                        self.transition_to_wait_for_answer(new_wait_for_answer_state_counter, 0, 0)
-                        return
-                    elif self.wait_for_cts_counter > 0:
-                        new_wait_for_answer_state_counter = self.wait_for_cts_counter - (
-                                    self.protocol.currently_receiving.length - self.receiving_state_counter)
-                        self.transition_to_wait_for_answer(0, new_wait_for_answer_state_counter, 0)
-                        return
-                    elif self.wait_for_data_counter > 0:
-                        new_wait_for_answer_state_counter = self.wait_for_data_counter - (
-                                    self.protocol.currently_receiving.length - self.receiving_state_counter)
-                        self.transition_to_wait_for_answer(0, 0, new_wait_for_answer_state_counter)
-                        return
-
-                        # Just go back in case of collision
-                    if self.received_rts_cts_backoff_state_counter > 0:
-                        self.transition_to_received_rts_cts_backoff(self.received_rts_cts_backoff_state_counter - (
-                                    self.protocol.currently_receiving.length - self.receiving_state_counter))
-                        return
-
-                        # If we were backing off, return to backoff
-                    if self.protocol.backoff > 0:
-                        new_backoff = self.protocol.backoff - (
-                                    self.protocol.currently_receiving.length - self.receiving_state_counter)
-                        self.transition_to_backoff(new_backoff)
-                        return
-
-                    self.transition_to_idle()
+                    self.resume_previous_state()
                     return
 
 
@@ -273,7 +249,7 @@ class RTSCTSNode(Node):
             self.process_received_message(self.protocol.currently_receiving, simulation_time, active_transmissions)
 
 
-    def process_received_message(self, received_message: Message, simulation_time: int, active_transmissions: list[Transmission]):
+    def process_received_message(self, received_message: Message, simulation_time: int, active_transmissions: Channel):
         self.protocol.currently_receiving = None
         logging.debug("\tFinished receiving [{}]".format(received_message))
 
@@ -290,7 +266,8 @@ class RTSCTSNode(Node):
                     # to try to retransmit the message at any point
                     self.send_schedule.pop(0)
                     # Copy the `receive_buffer` into `received_message`
-                    get_node_by_id(self.neighbors, received_message.source).received_message = get_node_by_id(self.neighbors, received_message.source).receive_buffer
+                    sender = self.get_neighbor(received_message.source)
+                    sender.received_message = sender.receive_buffer
                     self.transition_to_idle()
                 else:
                     # Should only be RTS' that could fall in this branch
@@ -369,7 +346,7 @@ class RTSCTSNode(Node):
                     self.transition_to_idle()
 
 
-    def waiting_for_answer_state(self, simulation_time: int, active_transmissions: list['Transmission']):
+    def waiting_for_answer_state(self, simulation_time: int, active_transmissions: Channel):
         state_count = 0
         backoff_flag = False
         if self.wait_for_data_counter != 0:
@@ -401,14 +378,14 @@ class RTSCTSNode(Node):
         # Anything to receive?
         if transmissions := self.get_receivable_messages(simulation_time, active_transmissions):
             match transmissions:
-                case [transmission] if transmission.transmit_time + self.get_packet_travel_time(get_node_by_id(self.neighbors, transmission.message.source)) == simulation_time:
+                case [transmission] if transmission.transmit_time + self.get_packet_travel_time(self.get_neighbor(transmission.message.source)) == simulation_time:
                     self.transition_to_receiving(transmission.message)
                 case [_, _, *_]:
                     logging.debug("\tCollision, received more than one Message at the same time.")
                     self.collision_counter += 1
                 
 
-    def received_rts_cts_backoff_state(self, simulation_time: int, active_transmissions: list[HighLevelMessage]):
+    def received_rts_cts_backoff_state(self, simulation_time: int, active_transmissions: Channel):
         self.received_rts_cts_backoff_state_counter -= 1
         logging.debug("\tstate_counter: {}".format(self.received_rts_cts_backoff_state_counter))
         if self.received_rts_cts_backoff_state_counter <= 0:
@@ -422,14 +399,14 @@ class RTSCTSNode(Node):
         # Anything to receive?
         if transmissions := self.get_receivable_messages(simulation_time, active_transmissions):
             match transmissions:
-                case [transmission] if transmission.transmit_time + self.get_packet_travel_time(get_node_by_id(self.neighbors, transmission.message.source)) == simulation_time:
+                case [transmission] if transmission.transmit_time + self.get_packet_travel_time(self.get_neighbor(transmission.message.source)) == simulation_time:
                     self.transition_to_receiving(transmission.message)
                 case [_, _, *_]:
                     logging.debug("\tCollision, received more than one Message at the same time.")
                     self.collision_counter += 1
 
 
-    def backing_off_state(self, simulation_time: int, active_transmissions: list[HighLevelMessage]):
+    def backing_off_state(self, simulation_time: int, active_transmissions: Channel):
         self.protocol.backoff -= 1
         logging.debug("\tbackoff {}".format(self.protocol.backoff))
 
@@ -440,7 +417,7 @@ class RTSCTSNode(Node):
         # Anything to receive?
         if transmissions := self.get_receivable_messages(simulation_time, active_transmissions):
             match transmissions:
-                case [transmission] if transmission.transmit_time + self.get_packet_travel_time(get_node_by_id(self.neighbors, transmission.message.source)) == simulation_time:
+                case [transmission] if transmission.transmit_time + self.get_packet_travel_time(self.get_neighbor(transmission.message.source)) == simulation_time:
                     self.transition_to_receiving(transmission.message)
                 case [_, _, *_]:
                     logging.debug("\tCollision, received more than one Message at the same time.")
@@ -0,0 +1,296 @@
+"""
+Runs replications of scenarios in parallel, replacing the old `run_experiment.sh`.
+
+The base scenarios are built and set up once before the worker processes are forked, so the workers share their
+topology and every replication only builds fresh nodes and send times, see `build_warm_scenario`. Results are
+collected in memory and returned per scenario. Data sink results are also written in batches to a `ResultStore`, see
+`result_store.load_results`.
+
+With `--ci-width`, replications are scheduled adaptively instead: scenarios stop once their confidence intervals are
+narrow enough and the remaining replications go to the scenarios with the widest intervals. Only a few replications of
+a scenario are in flight at a time, the ones still queued when it converges are cancelled and the results of those
+already running are dropped, so every scenario returns exactly the replications it converged with.
+
+Usage:
+    python3 run_experiment.py [-n REPETITIONS] [-j WORKERS] [--ci-width WIDTH [--max-pending COUNT]] [--event-driven]
+                              [--vectorized] [SCENARIO ...]
+"""
+import argparse
+import logging
+import math
+import multiprocessing
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from statistics import NormalDist
+
+from main import run_scenario
+from result_store import RESULT_DIRECTORY, ResultStore
+from scenario_registry import build_warm_scenario, warm_up
+from scenarious import DataSinkResult, Scenario as DataSinkScenario
+
+# The sweep `run_experiment.sh` used to run
+DATA_SINK_SCENARIOS = [f'data_sink_{mac}_{length}_random_max_{window}'
+                       for mac in ('aloha', 'rts_cts')
+                       for length in (5, 10, 15, 20, 25)
+                       for window in (25, 50, 75, 100)]
+
+
+@dataclass
+class ReplicationResult:
+    scenario: str
+    seed: int
+    # Whatever `Scenario.run` returned to signal completion
+    result: object
+
+
+def run_replications(name: str, seeds: list[int], event_driven: bool = False,
+                     vectorized: bool = False) -> list[ReplicationResult]:
+    """
+    Runs one replication of scenario `name` per seed. Executed inside the worker processes.
+
+    :param event_driven: skip the ticks at which no node does anything, see `run_scenario`
+    :param vectorized: step the nodes of data sink scenarios with `VectorizedEngine`, other scenarios ignore it
+    """
+    results = []
+    for seed in seeds:
+        # Every replication owns its random number streams, so results do not depend on which worker ran it
+        scenario = build_warm_scenario(name)
+        if vectorized and isinstance(scenario, DataSinkScenario):
+            scenario.vectorized = True
+        results.append(ReplicationResult(name, seed, run_scenario(scenario, event_driven=event_driven, seed=seed)))
+
+    return results
+
+
+@dataclass
+class RunningStatistics:
+    """
+    Mean and variance of a stream of values, updated in constant time per value using Welford's algorithm.
+    """
+    count: int = 0
+    mean: float = 0.0
+    # Sum of the squared differences from the current mean
+    m2: float = 0.0
+
+    def add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def get_variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else float('inf')
+
+    def get_half_width(self, z: float) -> float:
+        """
+        Returns the half width of the confidence interval of the mean, `z` being the quantile of the normal
+        distribution for the confidence level.
+        """
+        return z * math.sqrt(self.get_variance() / self.count) if self.count > 1 else float('inf')
+
+    def get_relative_half_width(self, z: float, additional: int = 0) -> float:
+        """
+        Returns the half width relative to the mean, as expected after `additional` more values with the same
+        variance.
+        """
+        half_width = self.get_half_width(z)
+        if half_width == float('inf'):
+            return half_width
+        half_width *= math.sqrt(self.count / (self.count + additional))
+        if self.mean == 0:
+            return 0.0 if half_width == 0 else float('inf')
+        return half_width / abs(self.mean)
+
+
+@dataclass
+class ScenarioProgress:
+    name: str
+    next_seed: int
+    statistics: dict[str, RunningStatistics] = field(default_factory=lambda: defaultdict(RunningStatistics))
+    finished: int = 0
+    # Replications submitted to the pool that did not finish yet, and the tasks running them
+    pending: int = 0
+    futures: set[Future] = field(default_factory=set)
+    converged: bool = False
+
+    def get_relative_half_width(self, z: float) -> float:
+        """
+        Returns the largest relative half width of all metrics, including the pending replications.
+        """
+        if not self.statistics:
+            return float('inf')
+        return max(statistics.get_relative_half_width(z, self.pending) for statistics in self.statistics.values())
+
+
+def get_metrics(result) -> dict[str, float]:
+    """
+    Returns the values of a replication result whose confidence intervals decide when a scenario is stopped.
+    """
+    if isinstance(result, DataSinkResult):
+        return {'completion_time': result.completion_time, 'collisions': result.collisions}
+    return {}
+
+
+def run_experiment(names: list[str], repetitions: int, workers: int | None = None, chunk_size: int = 5,
+                   base_seed: int = 0, result_directory: str | None = RESULT_DIRECTORY,
+                   ci_width: float | None = None, min_repetitions: int = 10,
+                   confidence: float = 0.95, max_pending_replications: int | None = None,
+                   event_driven: bool = False, vectorized: bool = False) -> dict[str, list[ReplicationResult]]:
+    """
+    Runs replications of every scenario in `names` across a pool of `workers` processes.
+
+    Without `ci_width` every scenario runs `repetitions` replications. With `ci_width` a scenario is stopped once the
+    confidence interval of the mean of each of its metrics, see `get_metrics`, is narrower than `ci_width` times the
+    mean on both sides, and after `min_repetitions`. Free workers always go to the scenario whose widest interval is
+    the furthest from that, so `repetitions` is only the upper limit. The results of a scenario end with the
+    replication it converged with, later ones are cancelled or dropped.
+
+    :param chunk_size: number of replications a worker runs per task
+    :param base_seed: replication `i` of every scenario is seeded with `base_seed + i`
+    :param result_directory: directory of the `ResultStore` shards, None only returns the results
+    :param ci_width: target half width of the confidence intervals relative to the mean, e.g. 0.02 for +-2%
+    :param confidence: confidence level of the intervals
+    :param max_pending_replications: replications of one scenario in flight at a time with `ci_width`, defaults to
+        `min_repetitions`, as all of them beyond the converged sample are wasted
+    :param event_driven: run the replications event-driven, see `run_scenario`
+    :param vectorized: step the nodes of data sink scenarios with `VectorizedEngine`
+    """
+    store = ResultStore(result_directory) if result_directory is not None else None
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+
+    results = {name: [] for name in names}
+    progress = {name: ScenarioProgress(name, base_seed) for name in names}
+    total = len(names) * repetitions
+    if max_pending_replications is None:
+        max_pending_replications = min_repetitions if ci_width is not None else repetitions
+    done = 0
+    start = time.time()
+
+    def get_next_scenario() -> ScenarioProgress | None:
+        candidates = [p for p in progress.values()
+                      if not p.converged and p.finished + p.pending < repetitions
+                      and p.pending < max_pending_replications]
+        if not candidates:
+            return None
+        if ci_width is None:
+            return candidates[0]
+
+        # Every scenario needs a few replications before its variance means anything
+        starting = [p for p in candidates if p.finished + p.pending < min_repetitions]
+        if starting:
+            return starting[0]
+        return max(candidates, key=lambda p: p.get_relative_half_width(z))
+
+    for name in names:
+        warm_up(name)
+    # Forked workers inherit the base scenarios, with other start methods every worker warms up on its own
+    context = multiprocessing.get_context('fork') if 'fork' in multiprocessing.get_all_start_methods() else None
+    # Enough tasks to keep every worker busy, but few enough to adapt to the results as they come in
+    max_pending_tasks = 2 * (workers or os.cpu_count() or 1)
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        futures = {}
+        while True:
+            while len(futures) < max_pending_tasks and (scenario := get_next_scenario()):
+                count = min(chunk_size, repetitions - scenario.finished - scenario.pending,
+                            max_pending_replications - scenario.pending)
+                seeds = list(range(scenario.next_seed, scenario.next_seed + count))
+                scenario.next_seed += count
+                scenario.pending += count
+                future = executor.submit(run_replications, scenario.name, seeds, event_driven, vectorized)
+                futures[future] = (scenario, count)
+                scenario.futures.add(future)
+
+            if not futures:
+                break
+
+            finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in finished:
+                scenario, count = futures.pop(future)
+                scenario.futures.discard(future)
+                scenario.pending -= count
+                if scenario.converged:
+                    # Finished after the scenario converged, only the replications it converged with are kept
+                    continue
+
+                kept = 0
+                for replication in future.result():
+                    kept += 1
+                    scenario.finished += 1
+                    results[scenario.name].append(replication)
+                    for metric, value in get_metrics(replication.result).items():
+                        scenario.statistics[metric].add(value)
+                    # Only this process writes, so shards from parallel workers never interleave
+                    if store and isinstance(replication.result, DataSinkResult):
+                        store.add(replication.scenario, replication.seed, replication.result)
+
+                    if ci_width is not None and scenario.finished >= min_repetitions:
+                        # Only the finished replications count here, pending ones could still widen the interval
+                        widths = [s.get_relative_half_width(z) for s in scenario.statistics.values()]
+                        if widths and max(widths) <= ci_width:
+                            scenario.converged = True
+                            break
+
+                done += kept
+                print(f'[{done}/{total}] {scenario.name} ({time.time() - start:.1f}s)')
+
+                if scenario.converged:
+                    print(f'{scenario.name} converged after {scenario.finished} replications')
+                    # Tasks that did not start yet are cancelled, the results of running ones are dropped above
+                    for pending_future in list(scenario.futures):
+                        if pending_future.cancel():
+                            scenario.futures.discard(pending_future)
+                            scenario.pending -= futures.pop(pending_future)[1]
+
+    if store:
+        store.flush()
+
+    for name in names:
+        results[name].sort(key=lambda r: r.seed)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run replications of scenarios in parallel.')
+    parser.add_argument('scenarios', nargs='*', default=DATA_SINK_SCENARIOS)
+    parser.add_argument('-n', '--repetitions', type=int, default=25,
+                        help='replications per scenario, the maximum with --ci-width')
+    parser.add_argument('-j', '--workers', type=int, default=None, help='defaults to the number of cores')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-o', '--output', default=RESULT_DIRECTORY, help='directory of the result shards')
+    parser.add_argument('--ci-width', type=float, default=None,
+                        help='stop a scenario once the 95%% confidence intervals are within this fraction of the mean')
+    parser.add_argument('--min-repetitions', type=int, default=10)
+    parser.add_argument('--max-pending', type=int, default=None,
+                        help='replications of one scenario in flight at a time with --ci-width, '
+                             'defaults to --min-repetitions')
+    parser.add_argument('--event-driven', action='store_true',
+                        help='skip the ticks at which no node does anything, pays off for large sparse scenarios')
+    parser.add_argument('--vectorized', action='store_true',
+                        help='step the nodes of data sink scenarios with NumPy arrays, pays off for large scenarios')
+    args = parser.parse_args()
+
+    logging.basicConfig(format='%(message)s', level=logging.WARNING)
+
+    results = run_experiment(args.scenarios, args.repetitions, args.workers, base_seed=args.seed,
+                             result_directory=args.output, ci_width=args.ci_width,
+                             min_repetitions=args.min_repetitions, max_pending_replications=args.max_pending,
+                             event_driven=args.event_driven,
+                             vectorized=args.vectorized)
+
+    z = NormalDist().inv_cdf(0.975)
+    for name, replications in results.items():
+        statistics = defaultdict(RunningStatistics)
+        for replication in replications:
+            for metric, value in get_metrics(replication.result).items():
+                statistics[metric].add(value)
+        summary = ', '.join(f'{metric} {s.mean:.1f} +- {s.get_half_width(z):.1f}' for metric, s in statistics.items())
+        print(f'{name}: {len(replications)} replications, {summary}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,311 +0,0 @@
-#!/bin/bash
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_aloha_5_random_max_25
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_aloha_5_random_max_50
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_aloha_5_random_max_75
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_aloha_5_random_max_100
-    echo "Completed iteration $i"
-done
-
-#---------------
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_aloha_10_random_max_25
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_aloha_10_random_max_50
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_aloha_10_random_max_75
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_aloha_10_random_max_100
-    echo "Completed iteration $i"
-done
-
-#---------------
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_aloha_15_random_max_25
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_aloha_15_random_max_50
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_aloha_15_random_max_75
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_aloha_15_random_max_100
-    echo "Completed iteration $i"
-done
-
-#---------------
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_aloha_20_random_max_25
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_aloha_20_random_max_50
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_aloha_20_random_max_75
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_aloha_20_random_max_100
-    echo "Completed iteration $i"
-done
-
-#---------------
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_aloha_25_random_max_25
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_aloha_25_random_max_50
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_aloha_25_random_max_75
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_aloha_25_random_max_100
-    echo "Completed iteration $i"
-done
-
-#--------------------------------------------------------------
-#--------------------------------------------------------------
-#--------------------------------------------------------------
-#--------------------------------------------------------------
-#--------------------------------------------------------------
-#--------------------------------------------------------------
-
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_rts_cts_5_random_max_25
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_rts_cts_5_random_max_50
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_rts_cts_5_random_max_75
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_rts_cts_5_random_max_100
-    echo "Completed iteration $i"
-done
-
-#---------------
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_rts_cts_10_random_max_25
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_rts_cts_10_random_max_50
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_rts_cts_10_random_max_75
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_rts_cts_10_random_max_100
-    echo "Completed iteration $i"
-done
-
-#---------------
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_rts_cts_15_random_max_25
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_rts_cts_15_random_max_50
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_rts_cts_15_random_max_75
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_rts_cts_15_random_max_100
-    echo "Completed iteration $i"
-done
-
-#---------------
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_rts_cts_20_random_max_25
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_rts_cts_20_random_max_50
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_rts_cts_20_random_max_75
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_rts_cts_20_random_max_100
-    echo "Completed iteration $i"
-done
-
-#---------------
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_rts_cts_25_random_max_25
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_rts_cts_25_random_max_50
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_rts_cts_25_random_max_75
-    echo "Completed iteration $i"
-done
-
-for i in {1..25}
-do
-    echo "Running mac.py - Iteration $i"
-    python3 mac.py data_sink_rts_cts_25_random_max_100
-    echo "Completed iteration $i"
-done
-
----------------
-
-
-
-echo "All done."
\ No newline at end of file
@@ -0,0 +1,215 @@
+"""
+Scenarios described by data files instead of Python code.
+
+A scenario file is a JSON or TOML file with the scalar parameters, e.g.
+```
+name = "data_sink_ring_1000"
+kind = "data_sink"          # or "routing"
+mac = "rts_cts"             # or "aloha"
+radius = 0.25
+transceive_range = 11
+arrays = "data_sink_ring_1000.npz"
+```
+next to an `.npz` file with one entry per node, `ids`, `x_pos`, `y_pos` and optionally `radius` and
+`transceive_range`, and one entry per planned transmission, `send_time`, `source`, `target`, `length` and optionally
+`content`.
+
+Data sink scenarios can set `send_window`, every run then draws the send times from its random number streams in
+[0, send_window), like the registered `data_sink_*_random_max_*` scenarios, and `send_time` is ignored. They can also
+set `vectorized = true` to step the nodes with `VectorizedEngine`. Routing scenarios can set `ideal_routing = true` to
+start with converged routing tables.
+
+The distance, travel time and neighbor data derived from the positions is cached in `cache_dir`, keyed by a hash of
+both files, so repeated runs of the same topology skip computing it and map it from `.npy` files instead.
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from functools import partial
+
+import numpy as np
+
+import scenarious
+import scenarious_routing
+from aloha_node import ALOHANode
+from rts_cts_node import RTSCTSNode
+from scenario_registry import register_scenario
+from transmission import HighLevelMessage
+
+MAC_CLASSES = {'aloha': ALOHANode, 'rts_cts': RTSCTSNode}
+SCENARIO_MODULES = {'data_sink': scenarious, 'routing': scenarious_routing}
+SCENARIO_DIRECTORY = './scenarios'
+CACHE_DIRECTORY = './cache'
+# Part of the cache key, increase it whenever the cached data is computed differently
+CACHE_VERSION = 1
+
+
+def read_parameters(path: str) -> dict:
+    if path.endswith('.toml'):
+        import tomllib
+
+        with open(path, 'rb') as file:
+            return tomllib.load(file)
+
+    with open(path) as file:
+        return json.load(file)
+
+
+def get_file_hash(*paths: str) -> str:
+    digest = hashlib.sha256(str(CACHE_VERSION).encode())
+    for path in paths:
+        with open(path, 'rb') as file:
+            while chunk := file.read(1 << 20):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_scenario_file(path: str, cache_dir: str | None = CACHE_DIRECTORY):
+    """
+    Builds the scenario described by the parameter file at `path`.
+
+    :param path: JSON or TOML parameter file, the `arrays` file is relative to it
+    :param cache_dir: directory of the topology cache, None disables caching
+    :return: a `scenarious.Scenario` or a `scenarious_routing.Scenario` depending on `kind`
+    """
+    parameters = read_parameters(path)
+    arrays_path = os.path.join(os.path.dirname(path), parameters['arrays'])
+    module = SCENARIO_MODULES[parameters.get('kind', 'data_sink')]
+    node_class = MAC_CLASSES[parameters['mac']]
+    radius = parameters['radius']
+    transceive_range = parameters['transceive_range']
+
+    arrays = np.load(arrays_path)
+    ids = arrays['ids'].tolist()
+    x_pos = arrays['x_pos'].tolist()
+    y_pos = arrays['y_pos'].tolist()
+    radii = arrays['radius'].tolist() if 'radius' in arrays else [radius] * len(ids)
+    ranges = arrays['transceive_range'].tolist() if 'transceive_range' in arrays else [transceive_range] * len(ids)
+    nodes = [node_class(*node) for node in zip(ids, radii, ranges, x_pos, y_pos)]
+
+    sources = arrays['source'].tolist()
+    contents = arrays['content'].tolist() if 'content' in arrays else [f"Hello from {source}" for source in sources]
+    send_schedule = [
+        module.PlannedTransmission(send_time, HighLevelMessage(target, content, length), source)
+        for send_time, source, target, length, content
+        in zip(arrays['send_time'].tolist(), sources, arrays['target'].tolist(), arrays['length'].tolist(), contents)
+    ]
+
+    name = parameters.get('name', os.path.splitext(os.path.basename(path))[0])
+    if module is scenarious:
+        expected = parameters.get('expected_received_messages', len(send_schedule))
+        scenario = scenarious.Scenario(name, radius, transceive_range, nodes, send_schedule, expected, 0,
+                                       send_window=parameters.get('send_window'),
+                                       vectorized=parameters.get('vectorized', False))
+    else:
+        scenario = scenarious_routing.Scenario(name, radius, transceive_range, nodes, send_schedule,
+                                               ideal_routing=parameters.get('ideal_routing', False))
+
+    if cache_dir is not None:
+        load_topology(scenario, os.path.join(cache_dir, get_file_hash(path, arrays_path)))
+
+    return scenario
+
+
+def load_topology(scenario, cache_path: str):
+    """
+    Attaches the cached topology at `cache_path` to `scenario`, computing and storing it first if it does not exist
+    yet. `Scenario.setup` then finds the topology and neighbors up to date.
+    """
+    if not os.path.isdir(cache_path):
+        logging.info("Computing topology cache {}".format(cache_path))
+        scenario.topology.update(scenario.nodes)
+        scenario.neighbor_index.update(scenario.nodes)
+        store_topology(scenario, cache_path)
+        return
+
+    distances = np.load(os.path.join(cache_path, 'distances.npy'), mmap_mode='r')
+    travel_times = np.load(os.path.join(cache_path, 'travel_times.npy'), mmap_mode='r')
+    offsets = np.load(os.path.join(cache_path, 'neighbor_offsets.npy'), mmap_mode='r').tolist()
+    indices = np.load(os.path.join(cache_path, 'neighbor_indices.npy'), mmap_mode='r').tolist()
+
+    scenario.topology.load(scenario.nodes, distances, travel_times)
+    scenario.neighbor_index.load(scenario.nodes, [indices[start:end] for start, end in zip(offsets, offsets[1:])])
+
+
+def store_topology(scenario, cache_path: str):
+    topology = scenario.topology
+    neighbor_indices = scenario.neighbor_index.neighbor_indices
+    offsets = np.cumsum([0] + [len(indices) for indices in neighbor_indices], dtype=np.int64)
+
+    # Write to a temporary directory first, parallel runs may create the same cache entry at the same time
+    parent = os.path.dirname(cache_path)
+    os.makedirs(parent, exist_ok=True)
+    temporary_path = tempfile.mkdtemp(dir=parent)
+    np.save(os.path.join(temporary_path, 'distances.npy'), topology.distances)
+    np.save(os.path.join(temporary_path, 'travel_times.npy'), topology.travel_times)
+    np.save(os.path.join(temporary_path, 'neighbor_offsets.npy'), offsets)
+    np.save(os.path.join(temporary_path, 'neighbor_indices.npy'),
+            np.array([index for indices in neighbor_indices for index in indices], dtype=np.int64))
+    try:
+        os.rename(temporary_path, cache_path)
+    except OSError:
+        shutil.rmtree(temporary_path)
+
+
+def save_scenario_file(scenario, path: str):
+    """
+    Writes `scenario` as a JSON parameter file to `path` and its arrays next to it, so it can be loaded again with
+    `load_scenario_file`. All nodes need to use the same MAC. The send times of a scenario with a `send_window` are
+    drawn anew by every run, only the window is kept.
+    """
+    macs = {mac for mac, node_class in MAC_CLASSES.items() for node in scenario.nodes if type(node) is node_class}
+    if len(macs) != 1:
+        raise ValueError(f'Scenario {scenario.name} does not use exactly one of the MACs {list(MAC_CLASSES)}')
+
+    arrays_path = os.path.splitext(path)[0] + '.npz'
+    parameters = {
+        'name': scenario.name,
+        'kind': 'data_sink' if isinstance(scenario, scenarious.Scenario) else 'routing',
+        'mac': macs.pop(),
+        'radius': scenario.radius,
+        'transceive_range': scenario.transceive_range,
+        'arrays': os.path.basename(arrays_path),
+    }
+    if isinstance(scenario, scenarious.Scenario):
+        parameters['expected_received_messages'] = scenario.expected_received_messages
+        if scenario.send_window is not None:
+            parameters['send_window'] = scenario.send_window
+        if scenario.vectorized:
+            parameters['vectorized'] = True
+    else:
+        parameters['ideal_routing'] = scenario.ideal_routing
+
+    with open(path, 'w') as file:
+        json.dump(parameters, file, indent=4)
+
+    schedule = scenario.send_schedule
+    np.savez(
+        arrays_path,
+        ids=np.array([node.id for node in scenario.nodes], dtype=np.int64),
+        x_pos=np.array([node.x_pos for node in scenario.nodes], dtype=np.float64),
+        y_pos=np.array([node.y_pos for node in scenario.nodes], dtype=np.float64),
+        radius=np.array([node.radius for node in scenario.nodes], dtype=np.float64),
+        transceive_range=np.array([node.transceive_range for node in scenario.nodes], dtype=np.float64),
+        send_time=np.array([transmission.transmit_time for transmission in schedule], dtype=np.int64),
+        source=np.array([transmission.source_node_id for transmission in schedule], dtype=np.int64),
+        target=np.array([transmission.message.target for transmission in schedule], dtype=np.int64),
+        length=np.array([transmission.message.length for transmission in schedule], dtype=np.int64),
+        content=np.array([str(transmission.message.content) for transmission in schedule]),
+    )
+
+
+def register_scenario_files(directory: str = SCENARIO_DIRECTORY):
+    """
+    Registers every parameter file in `directory` under its file name, without reading it.
+    """
+    if not os.path.isdir(directory):
+        return
+
+    for file_name in sorted(os.listdir(directory)):
+        name, extension = os.path.splitext(file_name)
+        if extension in ('.json', '.toml'):
+            register_scenario(partial(load_scenario_file, os.path.join(directory, file_name)), name)
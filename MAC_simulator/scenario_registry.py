@@ -0,0 +1,66 @@
+"""
+Registry of all scenarios by name. Scenarios are registered as factory functions and only built when requested, so
+every call of `build_scenario` returns a fresh scenario with freshly drawn send times.
+"""
+from typing import Callable
+
+from random_streams import RandomStreams
+
+SCENARIOS: dict[str, Callable] = {}
+# Built and set up scenarios by name, see `build_warm_scenario`
+BASE_SCENARIOS: dict[str, object] = {}
+
+
+def register_scenario(factory: Callable, name: str | None = None) -> Callable:
+    """
+    Decorator registering `factory` under its function name, or under `name` for factories without one.
+    """
+    SCENARIOS[name or factory.__name__] = factory
+    return factory
+
+
+def load_scenarios():
+    # Importing the scenario modules registers their factories, which is cheap since nothing gets built
+    import scenarious
+    import scenarious_routing
+    import scenario_file
+
+    scenario_file.register_scenario_files()
+
+
+def get_scenario_names() -> list[str]:
+    load_scenarios()
+    return list(SCENARIOS)
+
+
+def build_scenario(name: str):
+    load_scenarios()
+    if name not in SCENARIOS:
+        raise KeyError(f'Unknown scenario {name}')
+
+    return SCENARIOS[name]()
+
+
+def warm_up(name: str):
+    """
+    Builds and sets up the base scenario of `name` unless that already happened in this process and returns it.
+    """
+    if name not in BASE_SCENARIOS:
+        base = build_scenario(name)
+        base.setup(RandomStreams())
+        BASE_SCENARIOS[name] = base
+
+    return BASE_SCENARIOS[name]
+
+
+def build_warm_scenario(name: str):
+    """
+    Like `build_scenario`, but the new scenario shares the topology and neighbors of the base scenario of `name`, so
+    its `setup` does not have to compute them again. Falls back to computing them if the node positions differ.
+    """
+    base = warm_up(name)
+    scenario = build_scenario(name)
+    scenario.topology.share(base.topology, scenario.nodes)
+    scenario.neighbor_index.share(base.neighbor_index, scenario.nodes)
+
+    return scenario
@@ -1,8 +1,16 @@
+import bisect
 import logging
-import csv
-import random
+import math
+from functools import partial
 from node import Node
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from channel import Channel
+from neighbor_index import NeighborIndex, GridNeighborIndex
+from topology import Topology
+from vectorized_engine import VectorizedEngine
+from wakeup_queue import NodeWakeupQueue
+from scenario_registry import register_scenario
+from random_streams import RandomStreams
 from transmission import HighLevelMessage, Message
 from rts_cts_node import RTSCTSNode
 from aloha_node import ALOHANode
@@ -15,6 +23,16 @@ class PlannedTransmission:
     source_node_id: int
 
 
+@dataclass
+class DataSinkResult:
+    # Simulation time at which the last expected message arrived
+    completion_time: int
+    collisions: int
+    node_ids: list[int]
+    # `Node.collision_counter` of every node in `node_ids`
+    node_collisions: list[int]
+
+
 @dataclass
 class Scenario:
     name: str
@@ -24,6 +42,12 @@ class Scenario:
     send_schedule: list[PlannedTransmission]
     expected_received_messages: int
     received_message_counter: int
+    neighbor_index: NeighborIndex = field(default_factory=GridNeighborIndex)
+    topology: Topology = field(default_factory=Topology)
+    # Step the nodes with `VectorizedEngine` instead of one by one
+    vectorized: bool = False
+    # If set, every transmission is planned at a random time in [0, send_window) drawn by `setup`
+    send_window: int | None = None
 
 
     def get_collision_count(self):
@@ -34,4189 +58,182 @@ class Scenario:
         return cnt
 
 
-    def report(self, simulation_time: int):
-        with open(f"./data/{self.name}.csv", mode='a+', newline='') as file:
-            writer = csv.writer(file)
-            writer.writerow([simulation_time, self.get_collision_count()])
+    def report(self, simulation_time: int) -> DataSinkResult:
+        return DataSinkResult(simulation_time, self.get_collision_count(), [node.id for node in self.nodes],
+                              [node.collision_counter for node in self.nodes])
 
     
-    def setup(self):
-        for node in self.nodes:
-            node.add_neighbors(self.nodes)
-
-
-    def get_node_by_id(self, id: int) -> Node | None:
+    def setup(self, random_streams: RandomStreams):
+        if self.send_window is not None:
+            for transmission in self.send_schedule:
+                transmission.transmit_time = random_streams.scenario.randint(0, self.send_window - 1)
         for node in self.nodes:
-            if node.id == id:
-                return node
-        
-        return None
-
-
-    def send_messages(self, simulation_time: int):
-        for transmission in self.send_schedule:
-            if simulation_time == transmission.transmit_time:
-                self.get_node_by_id(transmission.source_node_id).send(transmission.message)
-
-
-    def run(self, simulation_time: int, active_transmissions: list[Message]):
-        self.send_messages(simulation_time)
-
-        for node in self.nodes:
-            node.execute_state_machine(simulation_time, active_transmissions)
-
-        for node in self.nodes:
-            msg = node.receive()
-            if msg:
-                logging.info("Node {} received: {}".format(node.id, msg))
-                self.received_message_counter += 1
-
-                if self.received_message_counter == self.expected_received_messages:
-                    self.report(simulation_time)
-                    exit(0)
-
-
-data_sink_aloha_5_random_max_25 = Scenario(
-    "data_sink_aloha_5_random_max_25",
-    0.25, 
-    5,
-    [
-        ALOHANode(0, 0.25, 11, 10, 10), # sink
-        ALOHANode(1, 0.25, 11, 0, 10),
-        ALOHANode(2, 0.25, 11, 0, 12),
-        ALOHANode(3, 0.25, 11, 1, 14),
-        ALOHANode(4, 0.25, 11, 2, 16),
-        ALOHANode(5, 0.25, 11, 4, 18),
-        ALOHANode(6, 0.25, 11, 6, 19),
-        ALOHANode(7, 0.25, 11, 8, 20),
-        ALOHANode(8, 0.25, 11, 10, 20),
-        ALOHANode(9, 0.25, 11, 12, 20),
-        ALOHANode(10, 0.25, 11, 14, 19),
-        ALOHANode(11, 0.25, 11, 16, 18),
-        ALOHANode(12, 0.25, 11, 18, 16),
-        ALOHANode(13, 0.25, 11, 19, 14),
-        ALOHANode(14, 0.25, 11, 20, 12),
-        ALOHANode(15, 0.25, 11, 20, 10),
-        ALOHANode(16, 0.25, 11, 10, 0),
-        ALOHANode(17, 0.25, 11, 12, 0),
-        ALOHANode(18, 0.25, 11, 14, 1),
-        ALOHANode(19, 0.25, 11, 16, 2),
-        ALOHANode(20, 0.25, 11, 18, 4),
-        ALOHANode(21, 0.25, 11, 19, 6),
-        ALOHANode(22, 0.25, 11, 20, 8),
-        ALOHANode(23, 0.25, 11, 20, 10),
-        ALOHANode(24, 0.25, 11, 8, 0),
-        ALOHANode(25, 0.25, 11, 6, 1),
-        ALOHANode(26, 0.25, 11, 4, 2),
-        ALOHANode(27, 0.25, 11, 2, 3),
-        ALOHANode(28, 0.25, 11, 1, 5),
-        ALOHANode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 1", 5), 1),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 2", 5), 2),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 3", 5), 3),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 4", 5), 4),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 5", 5), 5),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 6", 5), 6),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 7", 5), 7),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 8", 5), 8),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 9", 5), 9),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 10", 5), 10),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 11", 5), 11),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 12", 5), 12),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 13", 5), 13),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 14", 5), 14),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 15", 5), 15),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 16", 5), 16),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 17", 5), 17),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 18", 5), 18),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 19", 5), 19),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 20", 5), 20),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 21", 5), 21),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 22", 5), 22),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 23", 5), 23),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 24", 5), 24),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 25", 5), 25),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 26", 5), 26),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 27", 5), 27),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 28", 5), 28),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 29", 5), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_aloha_5_random_max_50 = Scenario(
-    "data_sink_aloha_5_random_max_50",
-    0.25, 
-    5,
-    [
-        ALOHANode(0, 0.25, 11, 10, 10), # sink
-        ALOHANode(1, 0.25, 11, 0, 10),
-        ALOHANode(2, 0.25, 11, 0, 12),
-        ALOHANode(3, 0.25, 11, 1, 14),
-        ALOHANode(4, 0.25, 11, 2, 16),
-        ALOHANode(5, 0.25, 11, 4, 18),
-        ALOHANode(6, 0.25, 11, 6, 19),
-        ALOHANode(7, 0.25, 11, 8, 20),
-        ALOHANode(8, 0.25, 11, 10, 20),
-        ALOHANode(9, 0.25, 11, 12, 20),
-        ALOHANode(10, 0.25, 11, 14, 19),
-        ALOHANode(11, 0.25, 11, 16, 18),
-        ALOHANode(12, 0.25, 11, 18, 16),
-        ALOHANode(13, 0.25, 11, 19, 14),
-        ALOHANode(14, 0.25, 11, 20, 12),
-        ALOHANode(15, 0.25, 11, 20, 10),
-        ALOHANode(16, 0.25, 11, 10, 0),
-        ALOHANode(17, 0.25, 11, 12, 0),
-        ALOHANode(18, 0.25, 11, 14, 1),
-        ALOHANode(19, 0.25, 11, 16, 2),
-        ALOHANode(20, 0.25, 11, 18, 4),
-        ALOHANode(21, 0.25, 11, 19, 6),
-        ALOHANode(22, 0.25, 11, 20, 8),
-        ALOHANode(23, 0.25, 11, 20, 10),
-        ALOHANode(24, 0.25, 11, 8, 0),
-        ALOHANode(25, 0.25, 11, 6, 1),
-        ALOHANode(26, 0.25, 11, 4, 2),
-        ALOHANode(27, 0.25, 11, 2, 3),
-        ALOHANode(28, 0.25, 11, 1, 5),
-        ALOHANode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 1", 5), 1),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 2", 5), 2),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 3", 5), 3),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 4", 5), 4),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 5", 5), 5),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 6", 5), 6),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 7", 5), 7),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 8", 5), 8),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 9", 5), 9),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 10", 5), 10),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 11", 5), 11),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 12", 5), 12),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 13", 5), 13),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 14", 5), 14),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 15", 5), 15),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 16", 5), 16),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 17", 5), 17),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 18", 5), 18),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 19", 5), 19),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 20", 5), 20),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 21", 5), 21),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 22", 5), 22),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 23", 5), 23),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 24", 5), 24),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 25", 5), 25),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 26", 5), 26),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 27", 5), 27),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 28", 5), 28),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 29", 5), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_aloha_5_random_max_75 = Scenario(
-    "data_sink_aloha_5_random_max_75",
-    0.25, 
-    5,
-    [
-        ALOHANode(0, 0.25, 11, 10, 10), # sink
-        ALOHANode(1, 0.25, 11, 0, 10),
-        ALOHANode(2, 0.25, 11, 0, 12),
-        ALOHANode(3, 0.25, 11, 1, 14),
-        ALOHANode(4, 0.25, 11, 2, 16),
-        ALOHANode(5, 0.25, 11, 4, 18),
-        ALOHANode(6, 0.25, 11, 6, 19),
-        ALOHANode(7, 0.25, 11, 8, 20),
-        ALOHANode(8, 0.25, 11, 10, 20),
-        ALOHANode(9, 0.25, 11, 12, 20),
-        ALOHANode(10, 0.25, 11, 14, 19),
-        ALOHANode(11, 0.25, 11, 16, 18),
-        ALOHANode(12, 0.25, 11, 18, 16),
-        ALOHANode(13, 0.25, 11, 19, 14),
-        ALOHANode(14, 0.25, 11, 20, 12),
-        ALOHANode(15, 0.25, 11, 20, 10),
-        ALOHANode(16, 0.25, 11, 10, 0),
-        ALOHANode(17, 0.25, 11, 12, 0),
-        ALOHANode(18, 0.25, 11, 14, 1),
-        ALOHANode(19, 0.25, 11, 16, 2),
-        ALOHANode(20, 0.25, 11, 18, 4),
-        ALOHANode(21, 0.25, 11, 19, 6),
-        ALOHANode(22, 0.25, 11, 20, 8),
-        ALOHANode(23, 0.25, 11, 20, 10),
-        ALOHANode(24, 0.25, 11, 8, 0),
-        ALOHANode(25, 0.25, 11, 6, 1),
-        ALOHANode(26, 0.25, 11, 4, 2),
-        ALOHANode(27, 0.25, 11, 2, 3),
-        ALOHANode(28, 0.25, 11, 1, 5),
-        ALOHANode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 1", 5), 1),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 2", 5), 2),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 3", 5), 3),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 4", 5), 4),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 5", 5), 5),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 6", 5), 6),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 7", 5), 7),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 8", 5), 8),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 9", 5), 9),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 10", 5), 10),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 11", 5), 11),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 12", 5), 12),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 13", 5), 13),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 14", 5), 14),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 15", 5), 15),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 16", 5), 16),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 17", 5), 17),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 18", 5), 18),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 19", 5), 19),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 20", 5), 20),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 21", 5), 21),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 22", 5), 22),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 23", 5), 23),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 24", 5), 24),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 25", 5), 25),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 26", 5), 26),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 27", 5), 27),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 28", 5), 28),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 29", 5), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_aloha_5_random_max_100 = Scenario(
-    "data_sink_aloha_5_random_max_100",
-    0.25, 
-    5,
-    [
-        ALOHANode(0, 0.25, 11, 10, 10), # sink
-        ALOHANode(1, 0.25, 11, 0, 10),
-        ALOHANode(2, 0.25, 11, 0, 12),
-        ALOHANode(3, 0.25, 11, 1, 14),
-        ALOHANode(4, 0.25, 11, 2, 16),
-        ALOHANode(5, 0.25, 11, 4, 18),
-        ALOHANode(6, 0.25, 11, 6, 19),
-        ALOHANode(7, 0.25, 11, 8, 20),
-        ALOHANode(8, 0.25, 11, 10, 20),
-        ALOHANode(9, 0.25, 11, 12, 20),
-        ALOHANode(10, 0.25, 11, 14, 19),
-        ALOHANode(11, 0.25, 11, 16, 18),
-        ALOHANode(12, 0.25, 11, 18, 16),
-        ALOHANode(13, 0.25, 11, 19, 14),
-        ALOHANode(14, 0.25, 11, 20, 12),
-        ALOHANode(15, 0.25, 11, 20, 10),
-        ALOHANode(16, 0.25, 11, 10, 0),
-        ALOHANode(17, 0.25, 11, 12, 0),
-        ALOHANode(18, 0.25, 11, 14, 1),
-        ALOHANode(19, 0.25, 11, 16, 2),
-        ALOHANode(20, 0.25, 11, 18, 4),
-        ALOHANode(21, 0.25, 11, 19, 6),
-        ALOHANode(22, 0.25, 11, 20, 8),
-        ALOHANode(23, 0.25, 11, 20, 10),
-        ALOHANode(24, 0.25, 11, 8, 0),
-        ALOHANode(25, 0.25, 11, 6, 1),
-        ALOHANode(26, 0.25, 11, 4, 2),
-        ALOHANode(27, 0.25, 11, 2, 3),
-        ALOHANode(28, 0.25, 11, 1, 5),
-        ALOHANode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 1", 5), 1),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 2", 5), 2),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 3", 5), 3),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 4", 5), 4),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 5", 5), 5),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 6", 5), 6),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 7", 5), 7),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 8", 5), 8),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 9", 5), 9),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 10", 5), 10),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 11", 5), 11),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 12", 5), 12),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 13", 5), 13),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 14", 5), 14),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 15", 5), 15),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 16", 5), 16),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 17", 5), 17),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 18", 5), 18),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 19", 5), 19),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 20", 5), 20),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 21", 5), 21),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 22", 5), 22),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 23", 5), 23),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 24", 5), 24),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 25", 5), 25),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 26", 5), 26),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 27", 5), 27),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 28", 5), 28),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 29", 5), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_rts_cts_5_random_max_25 = Scenario(
-    "data_sink_rts_cts_5_random_max_25",
-    0.25, 
-    5,
-    [
-        RTSCTSNode(0, 0.25, 11, 10, 10), # sink
-        RTSCTSNode(1, 0.25, 11, 0, 10),
-        RTSCTSNode(2, 0.25, 11, 0, 12),
-        RTSCTSNode(3, 0.25, 11, 1, 14),
-        RTSCTSNode(4, 0.25, 11, 2, 16),
-        RTSCTSNode(5, 0.25, 11, 4, 18),
-        RTSCTSNode(6, 0.25, 11, 6, 19),
-        RTSCTSNode(7, 0.25, 11, 8, 20),
-        RTSCTSNode(8, 0.25, 11, 10, 20),
-        RTSCTSNode(9, 0.25, 11, 12, 20),
-        RTSCTSNode(10, 0.25, 11, 14, 19),
-        RTSCTSNode(11, 0.25, 11, 16, 18),
-        RTSCTSNode(12, 0.25, 11, 18, 16),
-        RTSCTSNode(13, 0.25, 11, 19, 14),
-        RTSCTSNode(14, 0.25, 11, 20, 12),
-        RTSCTSNode(15, 0.25, 11, 20, 10),
-        RTSCTSNode(16, 0.25, 11, 10, 0),
-        RTSCTSNode(17, 0.25, 11, 12, 0),
-        RTSCTSNode(18, 0.25, 11, 14, 1),
-        RTSCTSNode(19, 0.25, 11, 16, 2),
-        RTSCTSNode(20, 0.25, 11, 18, 4),
-        RTSCTSNode(21, 0.25, 11, 19, 6),
-        RTSCTSNode(22, 0.25, 11, 20, 8),
-        RTSCTSNode(23, 0.25, 11, 20, 10),
-        RTSCTSNode(24, 0.25, 11, 8, 0),
-        RTSCTSNode(25, 0.25, 11, 6, 1),
-        RTSCTSNode(26, 0.25, 11, 4, 2),
-        RTSCTSNode(27, 0.25, 11, 2, 3),
-        RTSCTSNode(28, 0.25, 11, 1, 5),
-        RTSCTSNode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 1", 5), 1),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 2", 5), 2),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 3", 5), 3),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 4", 5), 4),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 5", 5), 5),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 6", 5), 6),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 7", 5), 7),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 8", 5), 8),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 9", 5), 9),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 10", 5), 10),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 11", 5), 11),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 12", 5), 12),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 13", 5), 13),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 14", 5), 14),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 15", 5), 15),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 16", 5), 16),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 17", 5), 17),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 18", 5), 18),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 19", 5), 19),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 20", 5), 20),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 21", 5), 21),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 22", 5), 22),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 23", 5), 23),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 24", 5), 24),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 25", 5), 25),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 26", 5), 26),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 27", 5), 27),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 28", 5), 28),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 29", 5), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_rts_cts_5_random_max_50 = Scenario(
-    "data_sink_rts_cts_5_random_max_50",
-    0.25, 
-    5,
-    [
-        RTSCTSNode(0, 0.25, 11, 10, 10), # sink
-        RTSCTSNode(1, 0.25, 11, 0, 10),
-        RTSCTSNode(2, 0.25, 11, 0, 12),
-        RTSCTSNode(3, 0.25, 11, 1, 14),
-        RTSCTSNode(4, 0.25, 11, 2, 16),
-        RTSCTSNode(5, 0.25, 11, 4, 18),
-        RTSCTSNode(6, 0.25, 11, 6, 19),
-        RTSCTSNode(7, 0.25, 11, 8, 20),
-        RTSCTSNode(8, 0.25, 11, 10, 20),
-        RTSCTSNode(9, 0.25, 11, 12, 20),
-        RTSCTSNode(10, 0.25, 11, 14, 19),
-        RTSCTSNode(11, 0.25, 11, 16, 18),
-        RTSCTSNode(12, 0.25, 11, 18, 16),
-        RTSCTSNode(13, 0.25, 11, 19, 14),
-        RTSCTSNode(14, 0.25, 11, 20, 12),
-        RTSCTSNode(15, 0.25, 11, 20, 10),
-        RTSCTSNode(16, 0.25, 11, 10, 0),
-        RTSCTSNode(17, 0.25, 11, 12, 0),
-        RTSCTSNode(18, 0.25, 11, 14, 1),
-        RTSCTSNode(19, 0.25, 11, 16, 2),
-        RTSCTSNode(20, 0.25, 11, 18, 4),
-        RTSCTSNode(21, 0.25, 11, 19, 6),
-        RTSCTSNode(22, 0.25, 11, 20, 8),
-        RTSCTSNode(23, 0.25, 11, 20, 10),
-        RTSCTSNode(24, 0.25, 11, 8, 0),
-        RTSCTSNode(25, 0.25, 11, 6, 1),
-        RTSCTSNode(26, 0.25, 11, 4, 2),
-        RTSCTSNode(27, 0.25, 11, 2, 3),
-        RTSCTSNode(28, 0.25, 11, 1, 5),
-        RTSCTSNode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 1", 5), 1),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 2", 5), 2),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 3", 5), 3),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 4", 5), 4),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 5", 5), 5),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 6", 5), 6),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 7", 5), 7),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 8", 5), 8),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 9", 5), 9),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 10", 5), 10),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 11", 5), 11),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 12", 5), 12),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 13", 5), 13),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 14", 5), 14),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 15", 5), 15),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 16", 5), 16),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 17", 5), 17),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 18", 5), 18),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 19", 5), 19),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 20", 5), 20),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 21", 5), 21),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 22", 5), 22),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 23", 5), 23),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 24", 5), 24),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 25", 5), 25),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 26", 5), 26),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 27", 5), 27),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 28", 5), 28),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 29", 5), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_rts_cts_5_random_max_75 = Scenario(
-    "data_sink_rts_cts_5_random_max_75",
-    0.25, 
-    5,
-    [
-        RTSCTSNode(0, 0.25, 11, 10, 10), # sink
-        RTSCTSNode(1, 0.25, 11, 0, 10),
-        RTSCTSNode(2, 0.25, 11, 0, 12),
-        RTSCTSNode(3, 0.25, 11, 1, 14),
-        RTSCTSNode(4, 0.25, 11, 2, 16),
-        RTSCTSNode(5, 0.25, 11, 4, 18),
-        RTSCTSNode(6, 0.25, 11, 6, 19),
-        RTSCTSNode(7, 0.25, 11, 8, 20),
-        RTSCTSNode(8, 0.25, 11, 10, 20),
-        RTSCTSNode(9, 0.25, 11, 12, 20),
-        RTSCTSNode(10, 0.25, 11, 14, 19),
-        RTSCTSNode(11, 0.25, 11, 16, 18),
-        RTSCTSNode(12, 0.25, 11, 18, 16),
-        RTSCTSNode(13, 0.25, 11, 19, 14),
-        RTSCTSNode(14, 0.25, 11, 20, 12),
-        RTSCTSNode(15, 0.25, 11, 20, 10),
-        RTSCTSNode(16, 0.25, 11, 10, 0),
-        RTSCTSNode(17, 0.25, 11, 12, 0),
-        RTSCTSNode(18, 0.25, 11, 14, 1),
-        RTSCTSNode(19, 0.25, 11, 16, 2),
-        RTSCTSNode(20, 0.25, 11, 18, 4),
-        RTSCTSNode(21, 0.25, 11, 19, 6),
-        RTSCTSNode(22, 0.25, 11, 20, 8),
-        RTSCTSNode(23, 0.25, 11, 20, 10),
-        RTSCTSNode(24, 0.25, 11, 8, 0),
-        RTSCTSNode(25, 0.25, 11, 6, 1),
-        RTSCTSNode(26, 0.25, 11, 4, 2),
-        RTSCTSNode(27, 0.25, 11, 2, 3),
-        RTSCTSNode(28, 0.25, 11, 1, 5),
-        RTSCTSNode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 1", 5), 1),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 2", 5), 2),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 3", 5), 3),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 4", 5), 4),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 5", 5), 5),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 6", 5), 6),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 7", 5), 7),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 8", 5), 8),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 9", 5), 9),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 10", 5), 10),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 11", 5), 11),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 12", 5), 12),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 13", 5), 13),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 14", 5), 14),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 15", 5), 15),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 16", 5), 16),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 17", 5), 17),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 18", 5), 18),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 19", 5), 19),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 20", 5), 20),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 21", 5), 21),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 22", 5), 22),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 23", 5), 23),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 24", 5), 24),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 25", 5), 25),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 26", 5), 26),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 27", 5), 27),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 28", 5), 28),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 29", 5), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_rts_cts_5_random_max_100 = Scenario(
-    "data_sink_rts_cts_5_random_max_100",
-    0.25, 
-    5,
-    [
-        RTSCTSNode(0, 0.25, 11, 10, 10), # sink
-        RTSCTSNode(1, 0.25, 11, 0, 10),
-        RTSCTSNode(2, 0.25, 11, 0, 12),
-        RTSCTSNode(3, 0.25, 11, 1, 14),
-        RTSCTSNode(4, 0.25, 11, 2, 16),
-        RTSCTSNode(5, 0.25, 11, 4, 18),
-        RTSCTSNode(6, 0.25, 11, 6, 19),
-        RTSCTSNode(7, 0.25, 11, 8, 20),
-        RTSCTSNode(8, 0.25, 11, 10, 20),
-        RTSCTSNode(9, 0.25, 11, 12, 20),
-        RTSCTSNode(10, 0.25, 11, 14, 19),
-        RTSCTSNode(11, 0.25, 11, 16, 18),
-        RTSCTSNode(12, 0.25, 11, 18, 16),
-        RTSCTSNode(13, 0.25, 11, 19, 14),
-        RTSCTSNode(14, 0.25, 11, 20, 12),
-        RTSCTSNode(15, 0.25, 11, 20, 10),
-        RTSCTSNode(16, 0.25, 11, 10, 0),
-        RTSCTSNode(17, 0.25, 11, 12, 0),
-        RTSCTSNode(18, 0.25, 11, 14, 1),
-        RTSCTSNode(19, 0.25, 11, 16, 2),
-        RTSCTSNode(20, 0.25, 11, 18, 4),
-        RTSCTSNode(21, 0.25, 11, 19, 6),
-        RTSCTSNode(22, 0.25, 11, 20, 8),
-        RTSCTSNode(23, 0.25, 11, 20, 10),
-        RTSCTSNode(24, 0.25, 11, 8, 0),
-        RTSCTSNode(25, 0.25, 11, 6, 1),
-        RTSCTSNode(26, 0.25, 11, 4, 2),
-        RTSCTSNode(27, 0.25, 11, 2, 3),
-        RTSCTSNode(28, 0.25, 11, 1, 5),
-        RTSCTSNode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 1", 5), 1),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 2", 5), 2),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 3", 5), 3),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 4", 5), 4),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 5", 5), 5),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 6", 5), 6),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 7", 5), 7),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 8", 5), 8),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 9", 5), 9),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 10", 5), 10),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 11", 5), 11),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 12", 5), 12),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 13", 5), 13),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 14", 5), 14),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 15", 5), 15),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 16", 5), 16),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 17", 5), 17),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 18", 5), 18),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 19", 5), 19),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 20", 5), 20),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 21", 5), 21),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 22", 5), 22),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 23", 5), 23),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 24", 5), 24),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 25", 5), 25),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 26", 5), 26),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 27", 5), 27),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 28", 5), 28),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 29", 5), 29),
-    ],
-    29,
-    0
-)
-
-
-data_sink_aloha_10_random_max_25 = Scenario(
-    "data_sink_aloha_10_random_max_25",
-    0.25, 
-    5,
-    [
-        ALOHANode(0, 0.25, 11, 10, 10), # sink
-        ALOHANode(1, 0.25, 11, 0, 10),
-        ALOHANode(2, 0.25, 11, 0, 12),
-        ALOHANode(3, 0.25, 11, 1, 14),
-        ALOHANode(4, 0.25, 11, 2, 16),
-        ALOHANode(5, 0.25, 11, 4, 18),
-        ALOHANode(6, 0.25, 11, 6, 19),
-        ALOHANode(7, 0.25, 11, 8, 20),
-        ALOHANode(8, 0.25, 11, 10, 20),
-        ALOHANode(9, 0.25, 11, 12, 20),
-        ALOHANode(10, 0.25, 11, 14, 19),
-        ALOHANode(11, 0.25, 11, 16, 18),
-        ALOHANode(12, 0.25, 11, 18, 16),
-        ALOHANode(13, 0.25, 11, 19, 14),
-        ALOHANode(14, 0.25, 11, 20, 12),
-        ALOHANode(15, 0.25, 11, 20, 10),
-        ALOHANode(16, 0.25, 11, 10, 0),
-        ALOHANode(17, 0.25, 11, 12, 0),
-        ALOHANode(18, 0.25, 11, 14, 1),
-        ALOHANode(19, 0.25, 11, 16, 2),
-        ALOHANode(20, 0.25, 11, 18, 4),
-        ALOHANode(21, 0.25, 11, 19, 6),
-        ALOHANode(22, 0.25, 11, 20, 8),
-        ALOHANode(23, 0.25, 11, 20, 10),
-        ALOHANode(24, 0.25, 11, 8, 0),
-        ALOHANode(25, 0.25, 11, 6, 1),
-        ALOHANode(26, 0.25, 11, 4, 2),
-        ALOHANode(27, 0.25, 11, 2, 3),
-        ALOHANode(28, 0.25, 11, 1, 5),
-        ALOHANode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 1", 10), 1),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 2", 10), 2),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 3", 10), 3),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 4", 10), 4),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 5", 10), 5),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 6", 10), 6),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 7", 10), 7),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 8", 10), 8),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 9", 10), 9),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 10", 10), 10),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 11", 10), 11),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 12", 10), 12),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 13", 10), 13),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 14", 10), 14),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 15", 10), 15),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 16", 10), 16),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 17", 10), 17),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 18", 10), 18),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 19", 10), 19),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 20", 10), 20),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 21", 10), 21),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 22", 10), 22),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 23", 10), 23),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 24", 10), 24),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 25", 10), 25),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 26", 10), 26),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 27", 10), 27),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 28", 10), 28),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 29", 10), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_aloha_10_random_max_50 = Scenario(
-    "data_sink_aloha_10_random_max_50",
-    0.25, 
-    5,
-    [
-        ALOHANode(0, 0.25, 11, 10, 10), # sink
-        ALOHANode(1, 0.25, 11, 0, 10),
-        ALOHANode(2, 0.25, 11, 0, 12),
-        ALOHANode(3, 0.25, 11, 1, 14),
-        ALOHANode(4, 0.25, 11, 2, 16),
-        ALOHANode(5, 0.25, 11, 4, 18),
-        ALOHANode(6, 0.25, 11, 6, 19),
-        ALOHANode(7, 0.25, 11, 8, 20),
-        ALOHANode(8, 0.25, 11, 10, 20),
-        ALOHANode(9, 0.25, 11, 12, 20),
-        ALOHANode(10, 0.25, 11, 14, 19),
-        ALOHANode(11, 0.25, 11, 16, 18),
-        ALOHANode(12, 0.25, 11, 18, 16),
-        ALOHANode(13, 0.25, 11, 19, 14),
-        ALOHANode(14, 0.25, 11, 20, 12),
-        ALOHANode(15, 0.25, 11, 20, 10),
-        ALOHANode(16, 0.25, 11, 10, 0),
-        ALOHANode(17, 0.25, 11, 12, 0),
-        ALOHANode(18, 0.25, 11, 14, 1),
-        ALOHANode(19, 0.25, 11, 16, 2),
-        ALOHANode(20, 0.25, 11, 18, 4),
-        ALOHANode(21, 0.25, 11, 19, 6),
-        ALOHANode(22, 0.25, 11, 20, 8),
-        ALOHANode(23, 0.25, 11, 20, 10),
-        ALOHANode(24, 0.25, 11, 8, 0),
-        ALOHANode(25, 0.25, 11, 6, 1),
-        ALOHANode(26, 0.25, 11, 4, 2),
-        ALOHANode(27, 0.25, 11, 2, 3),
-        ALOHANode(28, 0.25, 11, 1, 5),
-        ALOHANode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 1", 10), 1),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 2", 10), 2),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 3", 10), 3),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 4", 10), 4),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 5", 10), 5),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 6", 10), 6),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 7", 10), 7),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 8", 10), 8),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 9", 10), 9),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 10", 10), 10),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 11", 10), 11),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 12", 10), 12),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 13", 10), 13),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 14", 10), 14),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 15", 10), 15),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 16", 10), 16),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 17", 10), 17),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 18", 10), 18),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 19", 10), 19),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 20", 10), 20),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 21", 10), 21),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 22", 10), 22),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 23", 10), 23),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 24", 10), 24),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 25", 10), 25),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 26", 10), 26),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 27", 10), 27),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 28", 10), 28),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 29", 10), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_aloha_10_random_max_75 = Scenario(
-    "data_sink_aloha_10_random_max_75",
-    0.25, 
-    5,
-    [
-        ALOHANode(0, 0.25, 11, 10, 10), # sink
-        ALOHANode(1, 0.25, 11, 0, 10),
-        ALOHANode(2, 0.25, 11, 0, 12),
-        ALOHANode(3, 0.25, 11, 1, 14),
-        ALOHANode(4, 0.25, 11, 2, 16),
-        ALOHANode(5, 0.25, 11, 4, 18),
-        ALOHANode(6, 0.25, 11, 6, 19),
-        ALOHANode(7, 0.25, 11, 8, 20),
-        ALOHANode(8, 0.25, 11, 10, 20),
-        ALOHANode(9, 0.25, 11, 12, 20),
-        ALOHANode(10, 0.25, 11, 14, 19),
-        ALOHANode(11, 0.25, 11, 16, 18),
-        ALOHANode(12, 0.25, 11, 18, 16),
-        ALOHANode(13, 0.25, 11, 19, 14),
-        ALOHANode(14, 0.25, 11, 20, 12),
-        ALOHANode(15, 0.25, 11, 20, 10),
-        ALOHANode(16, 0.25, 11, 10, 0),
-        ALOHANode(17, 0.25, 11, 12, 0),
-        ALOHANode(18, 0.25, 11, 14, 1),
-        ALOHANode(19, 0.25, 11, 16, 2),
-        ALOHANode(20, 0.25, 11, 18, 4),
-        ALOHANode(21, 0.25, 11, 19, 6),
-        ALOHANode(22, 0.25, 11, 20, 8),
-        ALOHANode(23, 0.25, 11, 20, 10),
-        ALOHANode(24, 0.25, 11, 8, 0),
-        ALOHANode(25, 0.25, 11, 6, 1),
-        ALOHANode(26, 0.25, 11, 4, 2),
-        ALOHANode(27, 0.25, 11, 2, 3),
-        ALOHANode(28, 0.25, 11, 1, 5),
-        ALOHANode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 1", 10), 1),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 2", 10), 2),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 3", 10), 3),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 4", 10), 4),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 5", 10), 5),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 6", 10), 6),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 7", 10), 7),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 8", 10), 8),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 9", 10), 9),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 10", 10), 10),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 11", 10), 11),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 12", 10), 12),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 13", 10), 13),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 14", 10), 14),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 15", 10), 15),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 16", 10), 16),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 17", 10), 17),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 18", 10), 18),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 19", 10), 19),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 20", 10), 20),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 21", 10), 21),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 22", 10), 22),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 23", 10), 23),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 24", 10), 24),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 25", 10), 25),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 26", 10), 26),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 27", 10), 27),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 28", 10), 28),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 29", 10), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_aloha_10_random_max_100 = Scenario(
-    "data_sink_aloha_10_random_max_100",
-    0.25, 
-    5,
-    [
-        ALOHANode(0, 0.25, 11, 10, 10), # sink
-        ALOHANode(1, 0.25, 11, 0, 10),
-        ALOHANode(2, 0.25, 11, 0, 12),
-        ALOHANode(3, 0.25, 11, 1, 14),
-        ALOHANode(4, 0.25, 11, 2, 16),
-        ALOHANode(5, 0.25, 11, 4, 18),
-        ALOHANode(6, 0.25, 11, 6, 19),
-        ALOHANode(7, 0.25, 11, 8, 20),
-        ALOHANode(8, 0.25, 11, 10, 20),
-        ALOHANode(9, 0.25, 11, 12, 20),
-        ALOHANode(10, 0.25, 11, 14, 19),
-        ALOHANode(11, 0.25, 11, 16, 18),
-        ALOHANode(12, 0.25, 11, 18, 16),
-        ALOHANode(13, 0.25, 11, 19, 14),
-        ALOHANode(14, 0.25, 11, 20, 12),
-        ALOHANode(15, 0.25, 11, 20, 10),
-        ALOHANode(16, 0.25, 11, 10, 0),
-        ALOHANode(17, 0.25, 11, 12, 0),
-        ALOHANode(18, 0.25, 11, 14, 1),
-        ALOHANode(19, 0.25, 11, 16, 2),
-        ALOHANode(20, 0.25, 11, 18, 4),
-        ALOHANode(21, 0.25, 11, 19, 6),
-        ALOHANode(22, 0.25, 11, 20, 8),
-        ALOHANode(23, 0.25, 11, 20, 10),
-        ALOHANode(24, 0.25, 11, 8, 0),
-        ALOHANode(25, 0.25, 11, 6, 1),
-        ALOHANode(26, 0.25, 11, 4, 2),
-        ALOHANode(27, 0.25, 11, 2, 3),
-        ALOHANode(28, 0.25, 11, 1, 5),
-        ALOHANode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 1", 10), 1),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 2", 10), 2),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 3", 10), 3),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 4", 10), 4),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 5", 10), 5),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 6", 10), 6),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 7", 10), 7),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 8", 10), 8),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 9", 10), 9),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 10", 10), 10),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 11", 10), 11),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 12", 10), 12),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 13", 10), 13),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 14", 10), 14),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 15", 10), 15),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 16", 10), 16),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 17", 10), 17),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 18", 10), 18),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 19", 10), 19),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 20", 10), 20),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 21", 10), 21),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 22", 10), 22),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 23", 10), 23),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 24", 10), 24),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 25", 10), 25),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 26", 10), 26),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 27", 10), 27),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 28", 10), 28),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 29", 10), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_rts_cts_10_random_max_25 = Scenario(
-    "data_sink_rts_cts_10_random_max_25",
-    0.25, 
-    5,
-    [
-        RTSCTSNode(0, 0.25, 11, 10, 10), # sink
-        RTSCTSNode(1, 0.25, 11, 0, 10),
-        RTSCTSNode(2, 0.25, 11, 0, 12),
-        RTSCTSNode(3, 0.25, 11, 1, 14),
-        RTSCTSNode(4, 0.25, 11, 2, 16),
-        RTSCTSNode(5, 0.25, 11, 4, 18),
-        RTSCTSNode(6, 0.25, 11, 6, 19),
-        RTSCTSNode(7, 0.25, 11, 8, 20),
-        RTSCTSNode(8, 0.25, 11, 10, 20),
-        RTSCTSNode(9, 0.25, 11, 12, 20),
-        RTSCTSNode(10, 0.25, 11, 14, 19),
-        RTSCTSNode(11, 0.25, 11, 16, 18),
-        RTSCTSNode(12, 0.25, 11, 18, 16),
-        RTSCTSNode(13, 0.25, 11, 19, 14),
-        RTSCTSNode(14, 0.25, 11, 20, 12),
-        RTSCTSNode(15, 0.25, 11, 20, 10),
-        RTSCTSNode(16, 0.25, 11, 10, 0),
-        RTSCTSNode(17, 0.25, 11, 12, 0),
-        RTSCTSNode(18, 0.25, 11, 14, 1),
-        RTSCTSNode(19, 0.25, 11, 16, 2),
-        RTSCTSNode(20, 0.25, 11, 18, 4),
-        RTSCTSNode(21, 0.25, 11, 19, 6),
-        RTSCTSNode(22, 0.25, 11, 20, 8),
-        RTSCTSNode(23, 0.25, 11, 20, 10),
-        RTSCTSNode(24, 0.25, 11, 8, 0),
-        RTSCTSNode(25, 0.25, 11, 6, 1),
-        RTSCTSNode(26, 0.25, 11, 4, 2),
-        RTSCTSNode(27, 0.25, 11, 2, 3),
-        RTSCTSNode(28, 0.25, 11, 1, 5),
-        RTSCTSNode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 1", 10), 1),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 2", 10), 2),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 3", 10), 3),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 4", 10), 4),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 5", 10), 5),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 6", 10), 6),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 7", 10), 7),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 8", 10), 8),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 9", 10), 9),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 10", 10), 10),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 11", 10), 11),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 12", 10), 12),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 13", 10), 13),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 14", 10), 14),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 15", 10), 15),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 16", 10), 16),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 17", 10), 17),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 18", 10), 18),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 19", 10), 19),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 20", 10), 20),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 21", 10), 21),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 22", 10), 22),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 23", 10), 23),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 24", 10), 24),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 25", 10), 25),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 26", 10), 26),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 27", 10), 27),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 28", 10), 28),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 29", 10), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_rts_cts_10_random_max_50 = Scenario(
-    "data_sink_rts_cts_10_random_max_50",
-    0.25, 
-    5,
-    [
-        RTSCTSNode(0, 0.25, 11, 10, 10), # sink
-        RTSCTSNode(1, 0.25, 11, 0, 10),
-        RTSCTSNode(2, 0.25, 11, 0, 12),
-        RTSCTSNode(3, 0.25, 11, 1, 14),
-        RTSCTSNode(4, 0.25, 11, 2, 16),
-        RTSCTSNode(5, 0.25, 11, 4, 18),
-        RTSCTSNode(6, 0.25, 11, 6, 19),
-        RTSCTSNode(7, 0.25, 11, 8, 20),
-        RTSCTSNode(8, 0.25, 11, 10, 20),
-        RTSCTSNode(9, 0.25, 11, 12, 20),
-        RTSCTSNode(10, 0.25, 11, 14, 19),
-        RTSCTSNode(11, 0.25, 11, 16, 18),
-        RTSCTSNode(12, 0.25, 11, 18, 16),
-        RTSCTSNode(13, 0.25, 11, 19, 14),
-        RTSCTSNode(14, 0.25, 11, 20, 12),
-        RTSCTSNode(15, 0.25, 11, 20, 10),
-        RTSCTSNode(16, 0.25, 11, 10, 0),
-        RTSCTSNode(17, 0.25, 11, 12, 0),
-        RTSCTSNode(18, 0.25, 11, 14, 1),
-        RTSCTSNode(19, 0.25, 11, 16, 2),
-        RTSCTSNode(20, 0.25, 11, 18, 4),
-        RTSCTSNode(21, 0.25, 11, 19, 6),
-        RTSCTSNode(22, 0.25, 11, 20, 8),
-        RTSCTSNode(23, 0.25, 11, 20, 10),
-        RTSCTSNode(24, 0.25, 11, 8, 0),
-        RTSCTSNode(25, 0.25, 11, 6, 1),
-        RTSCTSNode(26, 0.25, 11, 4, 2),
-        RTSCTSNode(27, 0.25, 11, 2, 3),
-        RTSCTSNode(28, 0.25, 11, 1, 5),
-        RTSCTSNode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 1", 10), 1),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 2", 10), 2),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 3", 10), 3),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 4", 10), 4),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 5", 10), 5),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 6", 10), 6),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 7", 10), 7),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 8", 10), 8),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 9", 10), 9),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 10", 10), 10),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 11", 10), 11),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 12", 10), 12),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 13", 10), 13),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 14", 10), 14),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 15", 10), 15),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 16", 10), 16),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 17", 10), 17),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 18", 10), 18),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 19", 10), 19),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 20", 10), 20),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 21", 10), 21),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 22", 10), 22),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 23", 10), 23),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 24", 10), 24),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 25", 10), 25),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 26", 10), 26),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 27", 10), 27),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 28", 10), 28),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 29", 10), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_rts_cts_10_random_max_75 = Scenario(
-    "data_sink_rts_cts_10_random_max_75",
-    0.25, 
-    5,
-    [
-        RTSCTSNode(0, 0.25, 11, 10, 10), # sink
-        RTSCTSNode(1, 0.25, 11, 0, 10),
-        RTSCTSNode(2, 0.25, 11, 0, 12),
-        RTSCTSNode(3, 0.25, 11, 1, 14),
-        RTSCTSNode(4, 0.25, 11, 2, 16),
-        RTSCTSNode(5, 0.25, 11, 4, 18),
-        RTSCTSNode(6, 0.25, 11, 6, 19),
-        RTSCTSNode(7, 0.25, 11, 8, 20),
-        RTSCTSNode(8, 0.25, 11, 10, 20),
-        RTSCTSNode(9, 0.25, 11, 12, 20),
-        RTSCTSNode(10, 0.25, 11, 14, 19),
-        RTSCTSNode(11, 0.25, 11, 16, 18),
-        RTSCTSNode(12, 0.25, 11, 18, 16),
-        RTSCTSNode(13, 0.25, 11, 19, 14),
-        RTSCTSNode(14, 0.25, 11, 20, 12),
-        RTSCTSNode(15, 0.25, 11, 20, 10),
-        RTSCTSNode(16, 0.25, 11, 10, 0),
-        RTSCTSNode(17, 0.25, 11, 12, 0),
-        RTSCTSNode(18, 0.25, 11, 14, 1),
-        RTSCTSNode(19, 0.25, 11, 16, 2),
-        RTSCTSNode(20, 0.25, 11, 18, 4),
-        RTSCTSNode(21, 0.25, 11, 19, 6),
-        RTSCTSNode(22, 0.25, 11, 20, 8),
-        RTSCTSNode(23, 0.25, 11, 20, 10),
-        RTSCTSNode(24, 0.25, 11, 8, 0),
-        RTSCTSNode(25, 0.25, 11, 6, 1),
-        RTSCTSNode(26, 0.25, 11, 4, 2),
-        RTSCTSNode(27, 0.25, 11, 2, 3),
-        RTSCTSNode(28, 0.25, 11, 1, 5),
-        RTSCTSNode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 1", 10), 1),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 2", 10), 2),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 3", 10), 3),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 4", 10), 4),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 5", 10), 5),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 6", 10), 6),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 7", 10), 7),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 8", 10), 8),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 9", 10), 9),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 10", 10), 10),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 11", 10), 11),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 12", 10), 12),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 13", 10), 13),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 14", 10), 14),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 15", 10), 15),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 16", 10), 16),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 17", 10), 17),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 18", 10), 18),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 19", 10), 19),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 20", 10), 20),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 21", 10), 21),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 22", 10), 22),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 23", 10), 23),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 24", 10), 24),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 25", 10), 25),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 26", 10), 26),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 27", 10), 27),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 28", 10), 28),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 29", 10), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_rts_cts_10_random_max_100 = Scenario(
-    "data_sink_rts_cts_10_random_max_100",
-    0.25, 
-    5,
-    [
-        RTSCTSNode(0, 0.25, 11, 10, 10), # sink
-        RTSCTSNode(1, 0.25, 11, 0, 10),
-        RTSCTSNode(2, 0.25, 11, 0, 12),
-        RTSCTSNode(3, 0.25, 11, 1, 14),
-        RTSCTSNode(4, 0.25, 11, 2, 16),
-        RTSCTSNode(5, 0.25, 11, 4, 18),
-        RTSCTSNode(6, 0.25, 11, 6, 19),
-        RTSCTSNode(7, 0.25, 11, 8, 20),
-        RTSCTSNode(8, 0.25, 11, 10, 20),
-        RTSCTSNode(9, 0.25, 11, 12, 20),
-        RTSCTSNode(10, 0.25, 11, 14, 19),
-        RTSCTSNode(11, 0.25, 11, 16, 18),
-        RTSCTSNode(12, 0.25, 11, 18, 16),
-        RTSCTSNode(13, 0.25, 11, 19, 14),
-        RTSCTSNode(14, 0.25, 11, 20, 12),
-        RTSCTSNode(15, 0.25, 11, 20, 10),
-        RTSCTSNode(16, 0.25, 11, 10, 0),
-        RTSCTSNode(17, 0.25, 11, 12, 0),
-        RTSCTSNode(18, 0.25, 11, 14, 1),
-        RTSCTSNode(19, 0.25, 11, 16, 2),
-        RTSCTSNode(20, 0.25, 11, 18, 4),
-        RTSCTSNode(21, 0.25, 11, 19, 6),
-        RTSCTSNode(22, 0.25, 11, 20, 8),
-        RTSCTSNode(23, 0.25, 11, 20, 10),
-        RTSCTSNode(24, 0.25, 11, 8, 0),
-        RTSCTSNode(25, 0.25, 11, 6, 1),
-        RTSCTSNode(26, 0.25, 11, 4, 2),
-        RTSCTSNode(27, 0.25, 11, 2, 3),
-        RTSCTSNode(28, 0.25, 11, 1, 5),
-        RTSCTSNode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 1", 10), 1),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 2", 10), 2),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 3", 10), 3),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 4", 10), 4),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 5", 10), 5),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 6", 10), 6),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 7", 10), 7),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 8", 10), 8),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 9", 10), 9),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 10", 10), 10),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 11", 10), 11),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 12", 10), 12),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 13", 10), 13),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 14", 10), 14),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 15", 10), 15),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 16", 10), 16),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 17", 10), 17),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 18", 10), 18),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 19", 10), 19),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 20", 10), 20),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 21", 10), 21),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 22", 10), 22),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 23", 10), 23),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 24", 10), 24),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 25", 10), 25),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 26", 10), 26),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 27", 10), 27),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 28", 10), 28),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 29", 10), 29),
-    ],
-    29,
-    0
-)
-
-
-data_sink_aloha_15_random_max_25 = Scenario(
-    "data_sink_aloha_15_random_max_25",
-    0.25, 
-    5,
-    [
-        ALOHANode(0, 0.25, 11, 10, 10), # sink
-        ALOHANode(1, 0.25, 11, 0, 10),
-        ALOHANode(2, 0.25, 11, 0, 12),
-        ALOHANode(3, 0.25, 11, 1, 14),
-        ALOHANode(4, 0.25, 11, 2, 16),
-        ALOHANode(5, 0.25, 11, 4, 18),
-        ALOHANode(6, 0.25, 11, 6, 19),
-        ALOHANode(7, 0.25, 11, 8, 20),
-        ALOHANode(8, 0.25, 11, 10, 20),
-        ALOHANode(9, 0.25, 11, 12, 20),
-        ALOHANode(10, 0.25, 11, 14, 19),
-        ALOHANode(11, 0.25, 11, 16, 18),
-        ALOHANode(12, 0.25, 11, 18, 16),
-        ALOHANode(13, 0.25, 11, 19, 14),
-        ALOHANode(14, 0.25, 11, 20, 12),
-        ALOHANode(15, 0.25, 11, 20, 10),
-        ALOHANode(16, 0.25, 11, 10, 0),
-        ALOHANode(17, 0.25, 11, 12, 0),
-        ALOHANode(18, 0.25, 11, 14, 1),
-        ALOHANode(19, 0.25, 11, 16, 2),
-        ALOHANode(20, 0.25, 11, 18, 4),
-        ALOHANode(21, 0.25, 11, 19, 6),
-        ALOHANode(22, 0.25, 11, 20, 8),
-        ALOHANode(23, 0.25, 11, 20, 10),
-        ALOHANode(24, 0.25, 11, 8, 0),
-        ALOHANode(25, 0.25, 11, 6, 1),
-        ALOHANode(26, 0.25, 11, 4, 2),
-        ALOHANode(27, 0.25, 11, 2, 3),
-        ALOHANode(28, 0.25, 11, 1, 5),
-        ALOHANode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 1", 15), 1),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 2", 15), 2),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 3", 15), 3),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 4", 15), 4),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 5", 15), 5),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 6", 15), 6),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 7", 15), 7),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 8", 15), 8),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 9", 15), 9),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 10", 15), 10),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 11", 15), 11),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 12", 15), 12),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 13", 15), 13),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 14", 15), 14),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 15", 15), 15),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 16", 15), 16),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 17", 15), 17),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 18", 15), 18),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 19", 15), 19),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 20", 15), 20),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 21", 15), 21),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 22", 15), 22),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 23", 15), 23),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 24", 15), 24),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 25", 15), 25),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 26", 15), 26),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 27", 15), 27),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 28", 15), 28),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 29", 15), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_aloha_15_random_max_50 = Scenario(
-    "data_sink_aloha_15_random_max_50",
-    0.25, 
-    5,
-    [
-        ALOHANode(0, 0.25, 11, 10, 10), # sink
-        ALOHANode(1, 0.25, 11, 0, 10),
-        ALOHANode(2, 0.25, 11, 0, 12),
-        ALOHANode(3, 0.25, 11, 1, 14),
-        ALOHANode(4, 0.25, 11, 2, 16),
-        ALOHANode(5, 0.25, 11, 4, 18),
-        ALOHANode(6, 0.25, 11, 6, 19),
-        ALOHANode(7, 0.25, 11, 8, 20),
-        ALOHANode(8, 0.25, 11, 10, 20),
-        ALOHANode(9, 0.25, 11, 12, 20),
-        ALOHANode(10, 0.25, 11, 14, 19),
-        ALOHANode(11, 0.25, 11, 16, 18),
-        ALOHANode(12, 0.25, 11, 18, 16),
-        ALOHANode(13, 0.25, 11, 19, 14),
-        ALOHANode(14, 0.25, 11, 20, 12),
-        ALOHANode(15, 0.25, 11, 20, 10),
-        ALOHANode(16, 0.25, 11, 10, 0),
-        ALOHANode(17, 0.25, 11, 12, 0),
-        ALOHANode(18, 0.25, 11, 14, 1),
-        ALOHANode(19, 0.25, 11, 16, 2),
-        ALOHANode(20, 0.25, 11, 18, 4),
-        ALOHANode(21, 0.25, 11, 19, 6),
-        ALOHANode(22, 0.25, 11, 20, 8),
-        ALOHANode(23, 0.25, 11, 20, 10),
-        ALOHANode(24, 0.25, 11, 8, 0),
-        ALOHANode(25, 0.25, 11, 6, 1),
-        ALOHANode(26, 0.25, 11, 4, 2),
-        ALOHANode(27, 0.25, 11, 2, 3),
-        ALOHANode(28, 0.25, 11, 1, 5),
-        ALOHANode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 1", 15), 1),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 2", 15), 2),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 3", 15), 3),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 4", 15), 4),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 5", 15), 5),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 6", 15), 6),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 7", 15), 7),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 8", 15), 8),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 9", 15), 9),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 10", 15), 10),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 11", 15), 11),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 12", 15), 12),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 13", 15), 13),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 14", 15), 14),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 15", 15), 15),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 16", 15), 16),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 17", 15), 17),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 18", 15), 18),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 19", 15), 19),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 20", 15), 20),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 21", 15), 21),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 22", 15), 22),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 23", 15), 23),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 24", 15), 24),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 25", 15), 25),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 26", 15), 26),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 27", 15), 27),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 28", 15), 28),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 29", 15), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_aloha_15_random_max_75 = Scenario(
-    "data_sink_aloha_15_random_max_75",
-    0.25, 
-    5,
-    [
-        ALOHANode(0, 0.25, 11, 10, 10), # sink
-        ALOHANode(1, 0.25, 11, 0, 10),
-        ALOHANode(2, 0.25, 11, 0, 12),
-        ALOHANode(3, 0.25, 11, 1, 14),
-        ALOHANode(4, 0.25, 11, 2, 16),
-        ALOHANode(5, 0.25, 11, 4, 18),
-        ALOHANode(6, 0.25, 11, 6, 19),
-        ALOHANode(7, 0.25, 11, 8, 20),
-        ALOHANode(8, 0.25, 11, 10, 20),
-        ALOHANode(9, 0.25, 11, 12, 20),
-        ALOHANode(10, 0.25, 11, 14, 19),
-        ALOHANode(11, 0.25, 11, 16, 18),
-        ALOHANode(12, 0.25, 11, 18, 16),
-        ALOHANode(13, 0.25, 11, 19, 14),
-        ALOHANode(14, 0.25, 11, 20, 12),
-        ALOHANode(15, 0.25, 11, 20, 10),
-        ALOHANode(16, 0.25, 11, 10, 0),
-        ALOHANode(17, 0.25, 11, 12, 0),
-        ALOHANode(18, 0.25, 11, 14, 1),
-        ALOHANode(19, 0.25, 11, 16, 2),
-        ALOHANode(20, 0.25, 11, 18, 4),
-        ALOHANode(21, 0.25, 11, 19, 6),
-        ALOHANode(22, 0.25, 11, 20, 8),
-        ALOHANode(23, 0.25, 11, 20, 10),
-        ALOHANode(24, 0.25, 11, 8, 0),
-        ALOHANode(25, 0.25, 11, 6, 1),
-        ALOHANode(26, 0.25, 11, 4, 2),
-        ALOHANode(27, 0.25, 11, 2, 3),
-        ALOHANode(28, 0.25, 11, 1, 5),
-        ALOHANode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 1", 15), 1),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 2", 15), 2),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 3", 15), 3),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 4", 15), 4),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 5", 15), 5),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 6", 15), 6),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 7", 15), 7),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 8", 15), 8),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 9", 15), 9),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 10", 15), 10),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 11", 15), 11),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 12", 15), 12),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 13", 15), 13),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 14", 15), 14),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 15", 15), 15),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 16", 15), 16),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 17", 15), 17),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 18", 15), 18),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 19", 15), 19),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 20", 15), 20),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 21", 15), 21),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 22", 15), 22),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 23", 15), 23),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 24", 15), 24),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 25", 15), 25),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 26", 15), 26),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 27", 15), 27),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 28", 15), 28),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 29", 15), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_aloha_15_random_max_100 = Scenario(
-    "data_sink_aloha_15_random_max_100",
-    0.25, 
-    5,
-    [
-        ALOHANode(0, 0.25, 11, 10, 10), # sink
-        ALOHANode(1, 0.25, 11, 0, 10),
-        ALOHANode(2, 0.25, 11, 0, 12),
-        ALOHANode(3, 0.25, 11, 1, 14),
-        ALOHANode(4, 0.25, 11, 2, 16),
-        ALOHANode(5, 0.25, 11, 4, 18),
-        ALOHANode(6, 0.25, 11, 6, 19),
-        ALOHANode(7, 0.25, 11, 8, 20),
-        ALOHANode(8, 0.25, 11, 10, 20),
-        ALOHANode(9, 0.25, 11, 12, 20),
-        ALOHANode(10, 0.25, 11, 14, 19),
-        ALOHANode(11, 0.25, 11, 16, 18),
-        ALOHANode(12, 0.25, 11, 18, 16),
-        ALOHANode(13, 0.25, 11, 19, 14),
-        ALOHANode(14, 0.25, 11, 20, 12),
-        ALOHANode(15, 0.25, 11, 20, 10),
-        ALOHANode(16, 0.25, 11, 10, 0),
-        ALOHANode(17, 0.25, 11, 12, 0),
-        ALOHANode(18, 0.25, 11, 14, 1),
-        ALOHANode(19, 0.25, 11, 16, 2),
-        ALOHANode(20, 0.25, 11, 18, 4),
-        ALOHANode(21, 0.25, 11, 19, 6),
-        ALOHANode(22, 0.25, 11, 20, 8),
-        ALOHANode(23, 0.25, 11, 20, 10),
-        ALOHANode(24, 0.25, 11, 8, 0),
-        ALOHANode(25, 0.25, 11, 6, 1),
-        ALOHANode(26, 0.25, 11, 4, 2),
-        ALOHANode(27, 0.25, 11, 2, 3),
-        ALOHANode(28, 0.25, 11, 1, 5),
-        ALOHANode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 1", 15), 1),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 2", 15), 2),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 3", 15), 3),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 4", 15), 4),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 5", 15), 5),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 6", 15), 6),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 7", 15), 7),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 8", 15), 8),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 9", 15), 9),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 10", 15), 10),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 11", 15), 11),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 12", 15), 12),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 13", 15), 13),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 14", 15), 14),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 15", 15), 15),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 16", 15), 16),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 17", 15), 17),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 18", 15), 18),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 19", 15), 19),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 20", 15), 20),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 21", 15), 21),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 22", 15), 22),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 23", 15), 23),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 24", 15), 24),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 25", 15), 25),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 26", 15), 26),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 27", 15), 27),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 28", 15), 28),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 29", 15), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_rts_cts_15_random_max_25 = Scenario(
-    "data_sink_rts_cts_15_random_max_25",
-    0.25, 
-    5,
-    [
-        RTSCTSNode(0, 0.25, 11, 10, 10), # sink
-        RTSCTSNode(1, 0.25, 11, 0, 10),
-        RTSCTSNode(2, 0.25, 11, 0, 12),
-        RTSCTSNode(3, 0.25, 11, 1, 14),
-        RTSCTSNode(4, 0.25, 11, 2, 16),
-        RTSCTSNode(5, 0.25, 11, 4, 18),
-        RTSCTSNode(6, 0.25, 11, 6, 19),
-        RTSCTSNode(7, 0.25, 11, 8, 20),
-        RTSCTSNode(8, 0.25, 11, 10, 20),
-        RTSCTSNode(9, 0.25, 11, 12, 20),
-        RTSCTSNode(10, 0.25, 11, 14, 19),
-        RTSCTSNode(11, 0.25, 11, 16, 18),
-        RTSCTSNode(12, 0.25, 11, 18, 16),
-        RTSCTSNode(13, 0.25, 11, 19, 14),
-        RTSCTSNode(14, 0.25, 11, 20, 12),
-        RTSCTSNode(15, 0.25, 11, 20, 10),
-        RTSCTSNode(16, 0.25, 11, 10, 0),
-        RTSCTSNode(17, 0.25, 11, 12, 0),
-        RTSCTSNode(18, 0.25, 11, 14, 1),
-        RTSCTSNode(19, 0.25, 11, 16, 2),
-        RTSCTSNode(20, 0.25, 11, 18, 4),
-        RTSCTSNode(21, 0.25, 11, 19, 6),
-        RTSCTSNode(22, 0.25, 11, 20, 8),
-        RTSCTSNode(23, 0.25, 11, 20, 10),
-        RTSCTSNode(24, 0.25, 11, 8, 0),
-        RTSCTSNode(25, 0.25, 11, 6, 1),
-        RTSCTSNode(26, 0.25, 11, 4, 2),
-        RTSCTSNode(27, 0.25, 11, 2, 3),
-        RTSCTSNode(28, 0.25, 11, 1, 5),
-        RTSCTSNode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 1", 15), 1),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 2", 15), 2),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 3", 15), 3),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 4", 15), 4),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 5", 15), 5),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 6", 15), 6),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 7", 15), 7),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 8", 15), 8),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 9", 15), 9),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 10", 15), 10),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 11", 15), 11),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 12", 15), 12),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 13", 15), 13),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 14", 15), 14),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 15", 15), 15),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 16", 15), 16),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 17", 15), 17),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 18", 15), 18),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 19", 15), 19),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 20", 15), 20),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 21", 15), 21),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 22", 15), 22),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 23", 15), 23),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 24", 15), 24),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 25", 15), 25),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 26", 15), 26),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 27", 15), 27),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 28", 15), 28),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 29", 15), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_rts_cts_15_random_max_50 = Scenario(
-    "data_sink_rts_cts_15_random_max_50",
-    0.25, 
-    5,
-    [
-        RTSCTSNode(0, 0.25, 11, 10, 10), # sink
-        RTSCTSNode(1, 0.25, 11, 0, 10),
-        RTSCTSNode(2, 0.25, 11, 0, 12),
-        RTSCTSNode(3, 0.25, 11, 1, 14),
-        RTSCTSNode(4, 0.25, 11, 2, 16),
-        RTSCTSNode(5, 0.25, 11, 4, 18),
-        RTSCTSNode(6, 0.25, 11, 6, 19),
-        RTSCTSNode(7, 0.25, 11, 8, 20),
-        RTSCTSNode(8, 0.25, 11, 10, 20),
-        RTSCTSNode(9, 0.25, 11, 12, 20),
-        RTSCTSNode(10, 0.25, 11, 14, 19),
-        RTSCTSNode(11, 0.25, 11, 16, 18),
-        RTSCTSNode(12, 0.25, 11, 18, 16),
-        RTSCTSNode(13, 0.25, 11, 19, 14),
-        RTSCTSNode(14, 0.25, 11, 20, 12),
-        RTSCTSNode(15, 0.25, 11, 20, 10),
-        RTSCTSNode(16, 0.25, 11, 10, 0),
-        RTSCTSNode(17, 0.25, 11, 12, 0),
-        RTSCTSNode(18, 0.25, 11, 14, 1),
-        RTSCTSNode(19, 0.25, 11, 16, 2),
-        RTSCTSNode(20, 0.25, 11, 18, 4),
-        RTSCTSNode(21, 0.25, 11, 19, 6),
-        RTSCTSNode(22, 0.25, 11, 20, 8),
-        RTSCTSNode(23, 0.25, 11, 20, 10),
-        RTSCTSNode(24, 0.25, 11, 8, 0),
-        RTSCTSNode(25, 0.25, 11, 6, 1),
-        RTSCTSNode(26, 0.25, 11, 4, 2),
-        RTSCTSNode(27, 0.25, 11, 2, 3),
-        RTSCTSNode(28, 0.25, 11, 1, 5),
-        RTSCTSNode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 1", 15), 1),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 2", 15), 2),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 3", 15), 3),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 4", 15), 4),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 5", 15), 5),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 6", 15), 6),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 7", 15), 7),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 8", 15), 8),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 9", 15), 9),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 10", 15), 10),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 11", 15), 11),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 12", 15), 12),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 13", 15), 13),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 14", 15), 14),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 15", 15), 15),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 16", 15), 16),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 17", 15), 17),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 18", 15), 18),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 19", 15), 19),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 20", 15), 20),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 21", 15), 21),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 22", 15), 22),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 23", 15), 23),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 24", 15), 24),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 25", 15), 25),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 26", 15), 26),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 27", 15), 27),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 28", 15), 28),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 29", 15), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_rts_cts_15_random_max_75 = Scenario(
-    "data_sink_rts_cts_15_random_max_75",
-    0.25, 
-    5,
-    [
-        RTSCTSNode(0, 0.25, 11, 10, 10), # sink
-        RTSCTSNode(1, 0.25, 11, 0, 10),
-        RTSCTSNode(2, 0.25, 11, 0, 12),
-        RTSCTSNode(3, 0.25, 11, 1, 14),
-        RTSCTSNode(4, 0.25, 11, 2, 16),
-        RTSCTSNode(5, 0.25, 11, 4, 18),
-        RTSCTSNode(6, 0.25, 11, 6, 19),
-        RTSCTSNode(7, 0.25, 11, 8, 20),
-        RTSCTSNode(8, 0.25, 11, 10, 20),
-        RTSCTSNode(9, 0.25, 11, 12, 20),
-        RTSCTSNode(10, 0.25, 11, 14, 19),
-        RTSCTSNode(11, 0.25, 11, 16, 18),
-        RTSCTSNode(12, 0.25, 11, 18, 16),
-        RTSCTSNode(13, 0.25, 11, 19, 14),
-        RTSCTSNode(14, 0.25, 11, 20, 12),
-        RTSCTSNode(15, 0.25, 11, 20, 10),
-        RTSCTSNode(16, 0.25, 11, 10, 0),
-        RTSCTSNode(17, 0.25, 11, 12, 0),
-        RTSCTSNode(18, 0.25, 11, 14, 1),
-        RTSCTSNode(19, 0.25, 11, 16, 2),
-        RTSCTSNode(20, 0.25, 11, 18, 4),
-        RTSCTSNode(21, 0.25, 11, 19, 6),
-        RTSCTSNode(22, 0.25, 11, 20, 8),
-        RTSCTSNode(23, 0.25, 11, 20, 10),
-        RTSCTSNode(24, 0.25, 11, 8, 0),
-        RTSCTSNode(25, 0.25, 11, 6, 1),
-        RTSCTSNode(26, 0.25, 11, 4, 2),
-        RTSCTSNode(27, 0.25, 11, 2, 3),
-        RTSCTSNode(28, 0.25, 11, 1, 5),
-        RTSCTSNode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 1", 15), 1),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 2", 15), 2),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 3", 15), 3),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 4", 15), 4),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 5", 15), 5),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 6", 15), 6),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 7", 15), 7),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 8", 15), 8),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 9", 15), 9),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 10", 15), 10),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 11", 15), 11),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 12", 15), 12),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 13", 15), 13),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 14", 15), 14),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 15", 15), 15),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 16", 15), 16),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 17", 15), 17),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 18", 15), 18),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 19", 15), 19),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 20", 15), 20),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 21", 15), 21),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 22", 15), 22),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 23", 15), 23),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 24", 15), 24),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 25", 15), 25),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 26", 15), 26),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 27", 15), 27),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 28", 15), 28),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 29", 15), 29),
-    ],
-    29,
-    0
-)
+            node.set_random_streams(random_streams.get_node_streams(node.id))
+        # Planned transmissions by send time, so a tick only looks at the transmissions planned for it
+        self.transmissions_by_time = get_transmissions_by_time(self.send_schedule)
+        self.send_times = sorted(self.transmissions_by_time)
 
-data_sink_rts_cts_15_random_max_100 = Scenario(
-    "data_sink_rts_cts_15_random_max_100",
-    0.25, 
-    5,
-    [
-        RTSCTSNode(0, 0.25, 11, 10, 10), # sink
-        RTSCTSNode(1, 0.25, 11, 0, 10),
-        RTSCTSNode(2, 0.25, 11, 0, 12),
-        RTSCTSNode(3, 0.25, 11, 1, 14),
-        RTSCTSNode(4, 0.25, 11, 2, 16),
-        RTSCTSNode(5, 0.25, 11, 4, 18),
-        RTSCTSNode(6, 0.25, 11, 6, 19),
-        RTSCTSNode(7, 0.25, 11, 8, 20),
-        RTSCTSNode(8, 0.25, 11, 10, 20),
-        RTSCTSNode(9, 0.25, 11, 12, 20),
-        RTSCTSNode(10, 0.25, 11, 14, 19),
-        RTSCTSNode(11, 0.25, 11, 16, 18),
-        RTSCTSNode(12, 0.25, 11, 18, 16),
-        RTSCTSNode(13, 0.25, 11, 19, 14),
-        RTSCTSNode(14, 0.25, 11, 20, 12),
-        RTSCTSNode(15, 0.25, 11, 20, 10),
-        RTSCTSNode(16, 0.25, 11, 10, 0),
-        RTSCTSNode(17, 0.25, 11, 12, 0),
-        RTSCTSNode(18, 0.25, 11, 14, 1),
-        RTSCTSNode(19, 0.25, 11, 16, 2),
-        RTSCTSNode(20, 0.25, 11, 18, 4),
-        RTSCTSNode(21, 0.25, 11, 19, 6),
-        RTSCTSNode(22, 0.25, 11, 20, 8),
-        RTSCTSNode(23, 0.25, 11, 20, 10),
-        RTSCTSNode(24, 0.25, 11, 8, 0),
-        RTSCTSNode(25, 0.25, 11, 6, 1),
-        RTSCTSNode(26, 0.25, 11, 4, 2),
-        RTSCTSNode(27, 0.25, 11, 2, 3),
-        RTSCTSNode(28, 0.25, 11, 1, 5),
-        RTSCTSNode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 1", 15), 1),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 2", 15), 2),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 3", 15), 3),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 4", 15), 4),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 5", 15), 5),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 6", 15), 6),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 7", 15), 7),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 8", 15), 8),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 9", 15), 9),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 10", 15), 10),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 11", 15), 11),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 12", 15), 12),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 13", 15), 13),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 14", 15), 14),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 15", 15), 15),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 16", 15), 16),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 17", 15), 17),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 18", 15), 18),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 19", 15), 19),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 20", 15), 20),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 21", 15), 21),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 22", 15), 22),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 23", 15), 23),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 24", 15), 24),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 25", 15), 25),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 26", 15), 26),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 27", 15), 27),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 28", 15), 28),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 29", 15), 29),
-    ],
-    29,
-    0
-)
+        self.topology.update(self.nodes)
+        self.neighbor_index.update(self.nodes)
+        self.engine = VectorizedEngine(self.nodes) if self.vectorized else None
+        self.wakeup_queue = None
 
 
-data_sink_aloha_20_random_max_25 = Scenario(
-    "data_sink_aloha_20_random_max_25",
-    0.25, 
-    5,
-    [
-        ALOHANode(0, 0.25, 11, 10, 10), # sink
-        ALOHANode(1, 0.25, 11, 0, 10),
-        ALOHANode(2, 0.25, 11, 0, 12),
-        ALOHANode(3, 0.25, 11, 1, 14),
-        ALOHANode(4, 0.25, 11, 2, 16),
-        ALOHANode(5, 0.25, 11, 4, 18),
-        ALOHANode(6, 0.25, 11, 6, 19),
-        ALOHANode(7, 0.25, 11, 8, 20),
-        ALOHANode(8, 0.25, 11, 10, 20),
-        ALOHANode(9, 0.25, 11, 12, 20),
-        ALOHANode(10, 0.25, 11, 14, 19),
-        ALOHANode(11, 0.25, 11, 16, 18),
-        ALOHANode(12, 0.25, 11, 18, 16),
-        ALOHANode(13, 0.25, 11, 19, 14),
-        ALOHANode(14, 0.25, 11, 20, 12),
-        ALOHANode(15, 0.25, 11, 20, 10),
-        ALOHANode(16, 0.25, 11, 10, 0),
-        ALOHANode(17, 0.25, 11, 12, 0),
-        ALOHANode(18, 0.25, 11, 14, 1),
-        ALOHANode(19, 0.25, 11, 16, 2),
-        ALOHANode(20, 0.25, 11, 18, 4),
-        ALOHANode(21, 0.25, 11, 19, 6),
-        ALOHANode(22, 0.25, 11, 20, 8),
-        ALOHANode(23, 0.25, 11, 20, 10),
-        ALOHANode(24, 0.25, 11, 8, 0),
-        ALOHANode(25, 0.25, 11, 6, 1),
-        ALOHANode(26, 0.25, 11, 4, 2),
-        ALOHANode(27, 0.25, 11, 2, 3),
-        ALOHANode(28, 0.25, 11, 1, 5),
-        ALOHANode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 1", 20), 1),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 2", 20), 2),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 3", 20), 3),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 4", 20), 4),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 5", 20), 5),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 6", 20), 6),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 7", 20), 7),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 8", 20), 8),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 9", 20), 9),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 10", 20), 10),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 11", 20), 11),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 12", 20), 12),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 13", 20), 13),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 14", 20), 14),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 15", 20), 15),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 16", 20), 16),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 17", 20), 17),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 18", 20), 18),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 19", 20), 19),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 20", 20), 20),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 21", 20), 21),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 22", 20), 22),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 23", 20), 23),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 24", 20), 24),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 25", 20), 25),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 26", 20), 26),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 27", 20), 27),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 28", 20), 28),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 29", 20), 29),
-    ],
-    29,
-    0
-)
+    def set_event_driven(self, event_driven: bool, simulation_time: int, active_transmissions: Channel):
+        """
+        Starts keeping track of the wake-up times of the nodes for `next_event_time`, or stops and executes every node
+        on every tick again. `VectorizedEngine` keeps track of them on its own.
+        """
+        if event_driven and not self.engine and not self.wakeup_queue:
+            self.wakeup_queue = NodeWakeupQueue(self.nodes, simulation_time, active_transmissions)
+        elif not event_driven and self.wakeup_queue:
+            self.wakeup_queue.stop(simulation_time, active_transmissions)
+            self.wakeup_queue = None
 
-data_sink_aloha_20_random_max_50 = Scenario(
-    "data_sink_aloha_20_random_max_50",
-    0.25, 
-    5,
-    [
-        ALOHANode(0, 0.25, 11, 10, 10), # sink
-        ALOHANode(1, 0.25, 11, 0, 10),
-        ALOHANode(2, 0.25, 11, 0, 12),
-        ALOHANode(3, 0.25, 11, 1, 14),
-        ALOHANode(4, 0.25, 11, 2, 16),
-        ALOHANode(5, 0.25, 11, 4, 18),
-        ALOHANode(6, 0.25, 11, 6, 19),
-        ALOHANode(7, 0.25, 11, 8, 20),
-        ALOHANode(8, 0.25, 11, 10, 20),
-        ALOHANode(9, 0.25, 11, 12, 20),
-        ALOHANode(10, 0.25, 11, 14, 19),
-        ALOHANode(11, 0.25, 11, 16, 18),
-        ALOHANode(12, 0.25, 11, 18, 16),
-        ALOHANode(13, 0.25, 11, 19, 14),
-        ALOHANode(14, 0.25, 11, 20, 12),
-        ALOHANode(15, 0.25, 11, 20, 10),
-        ALOHANode(16, 0.25, 11, 10, 0),
-        ALOHANode(17, 0.25, 11, 12, 0),
-        ALOHANode(18, 0.25, 11, 14, 1),
-        ALOHANode(19, 0.25, 11, 16, 2),
-        ALOHANode(20, 0.25, 11, 18, 4),
-        ALOHANode(21, 0.25, 11, 19, 6),
-        ALOHANode(22, 0.25, 11, 20, 8),
-        ALOHANode(23, 0.25, 11, 20, 10),
-        ALOHANode(24, 0.25, 11, 8, 0),
-        ALOHANode(25, 0.25, 11, 6, 1),
-        ALOHANode(26, 0.25, 11, 4, 2),
-        ALOHANode(27, 0.25, 11, 2, 3),
-        ALOHANode(28, 0.25, 11, 1, 5),
-        ALOHANode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 1", 20), 1),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 2", 20), 2),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 3", 20), 3),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 4", 20), 4),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 5", 20), 5),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 6", 20), 6),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 7", 20), 7),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 8", 20), 8),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 9", 20), 9),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 10", 20), 10),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 11", 20), 11),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 12", 20), 12),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 13", 20), 13),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 14", 20), 14),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 15", 20), 15),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 16", 20), 16),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 17", 20), 17),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 18", 20), 18),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 19", 20), 19),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 20", 20), 20),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 21", 20), 21),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 22", 20), 22),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 23", 20), 23),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 24", 20), 24),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 25", 20), 25),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 26", 20), 26),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 27", 20), 27),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 28", 20), 28),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 29", 20), 29),
-    ],
-    29,
-    0
-)
 
-data_sink_aloha_20_random_max_75 = Scenario(
-    "data_sink_aloha_20_random_max_75",
-    0.25, 
-    5,
-    [
-        ALOHANode(0, 0.25, 11, 10, 10), # sink
-        ALOHANode(1, 0.25, 11, 0, 10),
-        ALOHANode(2, 0.25, 11, 0, 12),
-        ALOHANode(3, 0.25, 11, 1, 14),
-        ALOHANode(4, 0.25, 11, 2, 16),
-        ALOHANode(5, 0.25, 11, 4, 18),
-        ALOHANode(6, 0.25, 11, 6, 19),
-        ALOHANode(7, 0.25, 11, 8, 20),
-        ALOHANode(8, 0.25, 11, 10, 20),
-        ALOHANode(9, 0.25, 11, 12, 20),
-        ALOHANode(10, 0.25, 11, 14, 19),
-        ALOHANode(11, 0.25, 11, 16, 18),
-        ALOHANode(12, 0.25, 11, 18, 16),
-        ALOHANode(13, 0.25, 11, 19, 14),
-        ALOHANode(14, 0.25, 11, 20, 12),
-        ALOHANode(15, 0.25, 11, 20, 10),
-        ALOHANode(16, 0.25, 11, 10, 0),
-        ALOHANode(17, 0.25, 11, 12, 0),
-        ALOHANode(18, 0.25, 11, 14, 1),
-        ALOHANode(19, 0.25, 11, 16, 2),
-        ALOHANode(20, 0.25, 11, 18, 4),
-        ALOHANode(21, 0.25, 11, 19, 6),
-        ALOHANode(22, 0.25, 11, 20, 8),
-        ALOHANode(23, 0.25, 11, 20, 10),
-        ALOHANode(24, 0.25, 11, 8, 0),
-        ALOHANode(25, 0.25, 11, 6, 1),
-        ALOHANode(26, 0.25, 11, 4, 2),
-        ALOHANode(27, 0.25, 11, 2, 3),
-        ALOHANode(28, 0.25, 11, 1, 5),
-        ALOHANode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 1", 20), 1),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 2", 20), 2),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 3", 20), 3),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 4", 20), 4),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 5", 20), 5),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 6", 20), 6),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 7", 20), 7),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 8", 20), 8),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 9", 20), 9),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 10", 20), 10),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 11", 20), 11),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 12", 20), 12),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 13", 20), 13),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 14", 20), 14),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 15", 20), 15),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 16", 20), 16),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 17", 20), 17),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 18", 20), 18),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 19", 20), 19),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 20", 20), 20),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 21", 20), 21),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 22", 20), 22),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 23", 20), 23),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 24", 20), 24),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 25", 20), 25),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 26", 20), 26),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 27", 20), 27),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 28", 20), 28),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 29", 20), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_aloha_20_random_max_100 = Scenario(
-    "data_sink_aloha_20_random_max_100",
-    0.25, 
-    5,
-    [
-        ALOHANode(0, 0.25, 11, 10, 10), # sink
-        ALOHANode(1, 0.25, 11, 0, 10),
-        ALOHANode(2, 0.25, 11, 0, 12),
-        ALOHANode(3, 0.25, 11, 1, 14),
-        ALOHANode(4, 0.25, 11, 2, 16),
-        ALOHANode(5, 0.25, 11, 4, 18),
-        ALOHANode(6, 0.25, 11, 6, 19),
-        ALOHANode(7, 0.25, 11, 8, 20),
-        ALOHANode(8, 0.25, 11, 10, 20),
-        ALOHANode(9, 0.25, 11, 12, 20),
-        ALOHANode(10, 0.25, 11, 14, 19),
-        ALOHANode(11, 0.25, 11, 16, 18),
-        ALOHANode(12, 0.25, 11, 18, 16),
-        ALOHANode(13, 0.25, 11, 19, 14),
-        ALOHANode(14, 0.25, 11, 20, 12),
-        ALOHANode(15, 0.25, 11, 20, 10),
-        ALOHANode(16, 0.25, 11, 10, 0),
-        ALOHANode(17, 0.25, 11, 12, 0),
-        ALOHANode(18, 0.25, 11, 14, 1),
-        ALOHANode(19, 0.25, 11, 16, 2),
-        ALOHANode(20, 0.25, 11, 18, 4),
-        ALOHANode(21, 0.25, 11, 19, 6),
-        ALOHANode(22, 0.25, 11, 20, 8),
-        ALOHANode(23, 0.25, 11, 20, 10),
-        ALOHANode(24, 0.25, 11, 8, 0),
-        ALOHANode(25, 0.25, 11, 6, 1),
-        ALOHANode(26, 0.25, 11, 4, 2),
-        ALOHANode(27, 0.25, 11, 2, 3),
-        ALOHANode(28, 0.25, 11, 1, 5),
-        ALOHANode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 1", 20), 1),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 2", 20), 2),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 3", 20), 3),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 4", 20), 4),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 5", 20), 5),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 6", 20), 6),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 7", 20), 7),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 8", 20), 8),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 9", 20), 9),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 10", 20), 10),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 11", 20), 11),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 12", 20), 12),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 13", 20), 13),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 14", 20), 14),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 15", 20), 15),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 16", 20), 16),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 17", 20), 17),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 18", 20), 18),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 19", 20), 19),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 20", 20), 20),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 21", 20), 21),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 22", 20), 22),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 23", 20), 23),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 24", 20), 24),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 25", 20), 25),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 26", 20), 26),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 27", 20), 27),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 28", 20), 28),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 29", 20), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_rts_cts_20_random_max_25 = Scenario(
-    "data_sink_rts_cts_20_random_max_25",
-    0.25, 
-    5,
-    [
-        RTSCTSNode(0, 0.25, 11, 10, 10), # sink
-        RTSCTSNode(1, 0.25, 11, 0, 10),
-        RTSCTSNode(2, 0.25, 11, 0, 12),
-        RTSCTSNode(3, 0.25, 11, 1, 14),
-        RTSCTSNode(4, 0.25, 11, 2, 16),
-        RTSCTSNode(5, 0.25, 11, 4, 18),
-        RTSCTSNode(6, 0.25, 11, 6, 19),
-        RTSCTSNode(7, 0.25, 11, 8, 20),
-        RTSCTSNode(8, 0.25, 11, 10, 20),
-        RTSCTSNode(9, 0.25, 11, 12, 20),
-        RTSCTSNode(10, 0.25, 11, 14, 19),
-        RTSCTSNode(11, 0.25, 11, 16, 18),
-        RTSCTSNode(12, 0.25, 11, 18, 16),
-        RTSCTSNode(13, 0.25, 11, 19, 14),
-        RTSCTSNode(14, 0.25, 11, 20, 12),
-        RTSCTSNode(15, 0.25, 11, 20, 10),
-        RTSCTSNode(16, 0.25, 11, 10, 0),
-        RTSCTSNode(17, 0.25, 11, 12, 0),
-        RTSCTSNode(18, 0.25, 11, 14, 1),
-        RTSCTSNode(19, 0.25, 11, 16, 2),
-        RTSCTSNode(20, 0.25, 11, 18, 4),
-        RTSCTSNode(21, 0.25, 11, 19, 6),
-        RTSCTSNode(22, 0.25, 11, 20, 8),
-        RTSCTSNode(23, 0.25, 11, 20, 10),
-        RTSCTSNode(24, 0.25, 11, 8, 0),
-        RTSCTSNode(25, 0.25, 11, 6, 1),
-        RTSCTSNode(26, 0.25, 11, 4, 2),
-        RTSCTSNode(27, 0.25, 11, 2, 3),
-        RTSCTSNode(28, 0.25, 11, 1, 5),
-        RTSCTSNode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 1", 20), 1),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 2", 20), 2),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 3", 20), 3),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 4", 20), 4),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 5", 20), 5),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 6", 20), 6),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 7", 20), 7),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 8", 20), 8),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 9", 20), 9),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 10", 20), 10),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 11", 20), 11),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 12", 20), 12),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 13", 20), 13),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 14", 20), 14),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 15", 20), 15),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 16", 20), 16),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 17", 20), 17),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 18", 20), 18),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 19", 20), 19),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 20", 20), 20),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 21", 20), 21),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 22", 20), 22),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 23", 20), 23),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 24", 20), 24),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 25", 20), 25),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 26", 20), 26),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 27", 20), 27),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 28", 20), 28),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 29", 20), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_rts_cts_20_random_max_50 = Scenario(
-    "data_sink_rts_cts_20_random_max_50",
-    0.25, 
-    5,
-    [
-        RTSCTSNode(0, 0.25, 11, 10, 10), # sink
-        RTSCTSNode(1, 0.25, 11, 0, 10),
-        RTSCTSNode(2, 0.25, 11, 0, 12),
-        RTSCTSNode(3, 0.25, 11, 1, 14),
-        RTSCTSNode(4, 0.25, 11, 2, 16),
-        RTSCTSNode(5, 0.25, 11, 4, 18),
-        RTSCTSNode(6, 0.25, 11, 6, 19),
-        RTSCTSNode(7, 0.25, 11, 8, 20),
-        RTSCTSNode(8, 0.25, 11, 10, 20),
-        RTSCTSNode(9, 0.25, 11, 12, 20),
-        RTSCTSNode(10, 0.25, 11, 14, 19),
-        RTSCTSNode(11, 0.25, 11, 16, 18),
-        RTSCTSNode(12, 0.25, 11, 18, 16),
-        RTSCTSNode(13, 0.25, 11, 19, 14),
-        RTSCTSNode(14, 0.25, 11, 20, 12),
-        RTSCTSNode(15, 0.25, 11, 20, 10),
-        RTSCTSNode(16, 0.25, 11, 10, 0),
-        RTSCTSNode(17, 0.25, 11, 12, 0),
-        RTSCTSNode(18, 0.25, 11, 14, 1),
-        RTSCTSNode(19, 0.25, 11, 16, 2),
-        RTSCTSNode(20, 0.25, 11, 18, 4),
-        RTSCTSNode(21, 0.25, 11, 19, 6),
-        RTSCTSNode(22, 0.25, 11, 20, 8),
-        RTSCTSNode(23, 0.25, 11, 20, 10),
-        RTSCTSNode(24, 0.25, 11, 8, 0),
-        RTSCTSNode(25, 0.25, 11, 6, 1),
-        RTSCTSNode(26, 0.25, 11, 4, 2),
-        RTSCTSNode(27, 0.25, 11, 2, 3),
-        RTSCTSNode(28, 0.25, 11, 1, 5),
-        RTSCTSNode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 1", 20), 1),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 2", 20), 2),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 3", 20), 3),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 4", 20), 4),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 5", 20), 5),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 6", 20), 6),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 7", 20), 7),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 8", 20), 8),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 9", 20), 9),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 10", 20), 10),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 11", 20), 11),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 12", 20), 12),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 13", 20), 13),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 14", 20), 14),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 15", 20), 15),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 16", 20), 16),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 17", 20), 17),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 18", 20), 18),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 19", 20), 19),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 20", 20), 20),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 21", 20), 21),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 22", 20), 22),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 23", 20), 23),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 24", 20), 24),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 25", 20), 25),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 26", 20), 26),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 27", 20), 27),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 28", 20), 28),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 29", 20), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_rts_cts_20_random_max_75 = Scenario(
-    "data_sink_rts_cts_20_random_max_75",
-    0.25, 
-    5,
-    [
-        RTSCTSNode(0, 0.25, 11, 10, 10), # sink
-        RTSCTSNode(1, 0.25, 11, 0, 10),
-        RTSCTSNode(2, 0.25, 11, 0, 12),
-        RTSCTSNode(3, 0.25, 11, 1, 14),
-        RTSCTSNode(4, 0.25, 11, 2, 16),
-        RTSCTSNode(5, 0.25, 11, 4, 18),
-        RTSCTSNode(6, 0.25, 11, 6, 19),
-        RTSCTSNode(7, 0.25, 11, 8, 20),
-        RTSCTSNode(8, 0.25, 11, 10, 20),
-        RTSCTSNode(9, 0.25, 11, 12, 20),
-        RTSCTSNode(10, 0.25, 11, 14, 19),
-        RTSCTSNode(11, 0.25, 11, 16, 18),
-        RTSCTSNode(12, 0.25, 11, 18, 16),
-        RTSCTSNode(13, 0.25, 11, 19, 14),
-        RTSCTSNode(14, 0.25, 11, 20, 12),
-        RTSCTSNode(15, 0.25, 11, 20, 10),
-        RTSCTSNode(16, 0.25, 11, 10, 0),
-        RTSCTSNode(17, 0.25, 11, 12, 0),
-        RTSCTSNode(18, 0.25, 11, 14, 1),
-        RTSCTSNode(19, 0.25, 11, 16, 2),
-        RTSCTSNode(20, 0.25, 11, 18, 4),
-        RTSCTSNode(21, 0.25, 11, 19, 6),
-        RTSCTSNode(22, 0.25, 11, 20, 8),
-        RTSCTSNode(23, 0.25, 11, 20, 10),
-        RTSCTSNode(24, 0.25, 11, 8, 0),
-        RTSCTSNode(25, 0.25, 11, 6, 1),
-        RTSCTSNode(26, 0.25, 11, 4, 2),
-        RTSCTSNode(27, 0.25, 11, 2, 3),
-        RTSCTSNode(28, 0.25, 11, 1, 5),
-        RTSCTSNode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 1", 20), 1),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 2", 20), 2),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 3", 20), 3),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 4", 20), 4),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 5", 20), 5),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 6", 20), 6),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 7", 20), 7),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 8", 20), 8),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 9", 20), 9),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 10", 20), 10),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 11", 20), 11),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 12", 20), 12),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 13", 20), 13),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 14", 20), 14),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 15", 20), 15),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 16", 20), 16),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 17", 20), 17),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 18", 20), 18),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 19", 20), 19),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 20", 20), 20),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 21", 20), 21),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 22", 20), 22),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 23", 20), 23),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 24", 20), 24),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 25", 20), 25),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 26", 20), 26),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 27", 20), 27),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 28", 20), 28),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 29", 20), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_rts_cts_20_random_max_100 = Scenario(
-    "data_sink_rts_cts_20_random_max_100",
-    0.25, 
-    5,
-    [
-        RTSCTSNode(0, 0.25, 11, 10, 10), # sink
-        RTSCTSNode(1, 0.25, 11, 0, 10),
-        RTSCTSNode(2, 0.25, 11, 0, 12),
-        RTSCTSNode(3, 0.25, 11, 1, 14),
-        RTSCTSNode(4, 0.25, 11, 2, 16),
-        RTSCTSNode(5, 0.25, 11, 4, 18),
-        RTSCTSNode(6, 0.25, 11, 6, 19),
-        RTSCTSNode(7, 0.25, 11, 8, 20),
-        RTSCTSNode(8, 0.25, 11, 10, 20),
-        RTSCTSNode(9, 0.25, 11, 12, 20),
-        RTSCTSNode(10, 0.25, 11, 14, 19),
-        RTSCTSNode(11, 0.25, 11, 16, 18),
-        RTSCTSNode(12, 0.25, 11, 18, 16),
-        RTSCTSNode(13, 0.25, 11, 19, 14),
-        RTSCTSNode(14, 0.25, 11, 20, 12),
-        RTSCTSNode(15, 0.25, 11, 20, 10),
-        RTSCTSNode(16, 0.25, 11, 10, 0),
-        RTSCTSNode(17, 0.25, 11, 12, 0),
-        RTSCTSNode(18, 0.25, 11, 14, 1),
-        RTSCTSNode(19, 0.25, 11, 16, 2),
-        RTSCTSNode(20, 0.25, 11, 18, 4),
-        RTSCTSNode(21, 0.25, 11, 19, 6),
-        RTSCTSNode(22, 0.25, 11, 20, 8),
-        RTSCTSNode(23, 0.25, 11, 20, 10),
-        RTSCTSNode(24, 0.25, 11, 8, 0),
-        RTSCTSNode(25, 0.25, 11, 6, 1),
-        RTSCTSNode(26, 0.25, 11, 4, 2),
-        RTSCTSNode(27, 0.25, 11, 2, 3),
-        RTSCTSNode(28, 0.25, 11, 1, 5),
-        RTSCTSNode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 1", 20), 1),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 2", 20), 2),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 3", 20), 3),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 4", 20), 4),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 5", 20), 5),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 6", 20), 6),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 7", 20), 7),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 8", 20), 8),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 9", 20), 9),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 10", 20), 10),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 11", 20), 11),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 12", 20), 12),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 13", 20), 13),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 14", 20), 14),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 15", 20), 15),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 16", 20), 16),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 17", 20), 17),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 18", 20), 18),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 19", 20), 19),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 20", 20), 20),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 21", 20), 21),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 22", 20), 22),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 23", 20), 23),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 24", 20), 24),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 25", 20), 25),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 26", 20), 26),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 27", 20), 27),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 28", 20), 28),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 29", 20), 29),
-    ],
-    29,
-    0
-)
-
-
-data_sink_aloha_25_random_max_25 = Scenario(
-    "data_sink_aloha_25_random_max_25",
-    0.25, 
-    5,
-    [
-        ALOHANode(0, 0.25, 11, 10, 10), # sink
-        ALOHANode(1, 0.25, 11, 0, 10),
-        ALOHANode(2, 0.25, 11, 0, 12),
-        ALOHANode(3, 0.25, 11, 1, 14),
-        ALOHANode(4, 0.25, 11, 2, 16),
-        ALOHANode(5, 0.25, 11, 4, 18),
-        ALOHANode(6, 0.25, 11, 6, 19),
-        ALOHANode(7, 0.25, 11, 8, 20),
-        ALOHANode(8, 0.25, 11, 10, 20),
-        ALOHANode(9, 0.25, 11, 12, 20),
-        ALOHANode(10, 0.25, 11, 14, 19),
-        ALOHANode(11, 0.25, 11, 16, 18),
-        ALOHANode(12, 0.25, 11, 18, 16),
-        ALOHANode(13, 0.25, 11, 19, 14),
-        ALOHANode(14, 0.25, 11, 20, 12),
-        ALOHANode(15, 0.25, 11, 20, 10),
-        ALOHANode(16, 0.25, 11, 10, 0),
-        ALOHANode(17, 0.25, 11, 12, 0),
-        ALOHANode(18, 0.25, 11, 14, 1),
-        ALOHANode(19, 0.25, 11, 16, 2),
-        ALOHANode(20, 0.25, 11, 18, 4),
-        ALOHANode(21, 0.25, 11, 19, 6),
-        ALOHANode(22, 0.25, 11, 20, 8),
-        ALOHANode(23, 0.25, 11, 20, 10),
-        ALOHANode(24, 0.25, 11, 8, 0),
-        ALOHANode(25, 0.25, 11, 6, 1),
-        ALOHANode(26, 0.25, 11, 4, 2),
-        ALOHANode(27, 0.25, 11, 2, 3),
-        ALOHANode(28, 0.25, 11, 1, 5),
-        ALOHANode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 1", 25), 1),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 2", 25), 2),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 3", 25), 3),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 4", 25), 4),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 5", 25), 5),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 6", 25), 6),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 7", 25), 7),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 8", 25), 8),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 9", 25), 9),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 10", 25), 10),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 11", 25), 11),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 12", 25), 12),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 13", 25), 13),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 14", 25), 14),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 15", 25), 15),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 16", 25), 16),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 17", 25), 17),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 18", 25), 18),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 19", 25), 19),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 20", 25), 20),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 21", 25), 21),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 22", 25), 22),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 23", 25), 23),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 24", 25), 24),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 25", 25), 25),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 26", 25), 26),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 27", 25), 27),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 28", 25), 28),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 29", 25), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_aloha_25_random_max_50 = Scenario(
-    "data_sink_aloha_25_random_max_50",
-    0.25, 
-    5,
-    [
-        ALOHANode(0, 0.25, 11, 10, 10), # sink
-        ALOHANode(1, 0.25, 11, 0, 10),
-        ALOHANode(2, 0.25, 11, 0, 12),
-        ALOHANode(3, 0.25, 11, 1, 14),
-        ALOHANode(4, 0.25, 11, 2, 16),
-        ALOHANode(5, 0.25, 11, 4, 18),
-        ALOHANode(6, 0.25, 11, 6, 19),
-        ALOHANode(7, 0.25, 11, 8, 20),
-        ALOHANode(8, 0.25, 11, 10, 20),
-        ALOHANode(9, 0.25, 11, 12, 20),
-        ALOHANode(10, 0.25, 11, 14, 19),
-        ALOHANode(11, 0.25, 11, 16, 18),
-        ALOHANode(12, 0.25, 11, 18, 16),
-        ALOHANode(13, 0.25, 11, 19, 14),
-        ALOHANode(14, 0.25, 11, 20, 12),
-        ALOHANode(15, 0.25, 11, 20, 10),
-        ALOHANode(16, 0.25, 11, 10, 0),
-        ALOHANode(17, 0.25, 11, 12, 0),
-        ALOHANode(18, 0.25, 11, 14, 1),
-        ALOHANode(19, 0.25, 11, 16, 2),
-        ALOHANode(20, 0.25, 11, 18, 4),
-        ALOHANode(21, 0.25, 11, 19, 6),
-        ALOHANode(22, 0.25, 11, 20, 8),
-        ALOHANode(23, 0.25, 11, 20, 10),
-        ALOHANode(24, 0.25, 11, 8, 0),
-        ALOHANode(25, 0.25, 11, 6, 1),
-        ALOHANode(26, 0.25, 11, 4, 2),
-        ALOHANode(27, 0.25, 11, 2, 3),
-        ALOHANode(28, 0.25, 11, 1, 5),
-        ALOHANode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 1", 25), 1),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 2", 25), 2),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 3", 25), 3),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 4", 25), 4),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 5", 25), 5),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 6", 25), 6),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 7", 25), 7),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 8", 25), 8),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 9", 25), 9),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 10", 25), 10),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 11", 25), 11),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 12", 25), 12),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 13", 25), 13),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 14", 25), 14),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 15", 25), 15),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 16", 25), 16),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 17", 25), 17),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 18", 25), 18),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 19", 25), 19),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 20", 25), 20),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 21", 25), 21),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 22", 25), 22),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 23", 25), 23),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 24", 25), 24),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 25", 25), 25),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 26", 25), 26),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 27", 25), 27),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 28", 25), 28),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 29", 25), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_aloha_25_random_max_75 = Scenario(
-    "data_sink_aloha_25_random_max_75",
-    0.25, 
-    5,
-    [
-        ALOHANode(0, 0.25, 11, 10, 10), # sink
-        ALOHANode(1, 0.25, 11, 0, 10),
-        ALOHANode(2, 0.25, 11, 0, 12),
-        ALOHANode(3, 0.25, 11, 1, 14),
-        ALOHANode(4, 0.25, 11, 2, 16),
-        ALOHANode(5, 0.25, 11, 4, 18),
-        ALOHANode(6, 0.25, 11, 6, 19),
-        ALOHANode(7, 0.25, 11, 8, 20),
-        ALOHANode(8, 0.25, 11, 10, 20),
-        ALOHANode(9, 0.25, 11, 12, 20),
-        ALOHANode(10, 0.25, 11, 14, 19),
-        ALOHANode(11, 0.25, 11, 16, 18),
-        ALOHANode(12, 0.25, 11, 18, 16),
-        ALOHANode(13, 0.25, 11, 19, 14),
-        ALOHANode(14, 0.25, 11, 20, 12),
-        ALOHANode(15, 0.25, 11, 20, 10),
-        ALOHANode(16, 0.25, 11, 10, 0),
-        ALOHANode(17, 0.25, 11, 12, 0),
-        ALOHANode(18, 0.25, 11, 14, 1),
-        ALOHANode(19, 0.25, 11, 16, 2),
-        ALOHANode(20, 0.25, 11, 18, 4),
-        ALOHANode(21, 0.25, 11, 19, 6),
-        ALOHANode(22, 0.25, 11, 20, 8),
-        ALOHANode(23, 0.25, 11, 20, 10),
-        ALOHANode(24, 0.25, 11, 8, 0),
-        ALOHANode(25, 0.25, 11, 6, 1),
-        ALOHANode(26, 0.25, 11, 4, 2),
-        ALOHANode(27, 0.25, 11, 2, 3),
-        ALOHANode(28, 0.25, 11, 1, 5),
-        ALOHANode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 1", 25), 1),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 2", 25), 2),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 3", 25), 3),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 4", 25), 4),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 5", 25), 5),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 6", 25), 6),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 7", 25), 7),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 8", 25), 8),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 9", 25), 9),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 10", 25), 10),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 11", 25), 11),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 12", 25), 12),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 13", 25), 13),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 14", 25), 14),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 15", 25), 15),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 16", 25), 16),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 17", 25), 17),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 18", 25), 18),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 19", 25), 19),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 20", 25), 20),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 21", 25), 21),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 22", 25), 22),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 23", 25), 23),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 24", 25), 24),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 25", 25), 25),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 26", 25), 26),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 27", 25), 27),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 28", 25), 28),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 29", 25), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_aloha_25_random_max_100 = Scenario(
-    "data_sink_aloha_25_random_max_100",
-    0.25, 
-    5,
-    [
-        ALOHANode(0, 0.25, 11, 10, 10), # sink
-        ALOHANode(1, 0.25, 11, 0, 10),
-        ALOHANode(2, 0.25, 11, 0, 12),
-        ALOHANode(3, 0.25, 11, 1, 14),
-        ALOHANode(4, 0.25, 11, 2, 16),
-        ALOHANode(5, 0.25, 11, 4, 18),
-        ALOHANode(6, 0.25, 11, 6, 19),
-        ALOHANode(7, 0.25, 11, 8, 20),
-        ALOHANode(8, 0.25, 11, 10, 20),
-        ALOHANode(9, 0.25, 11, 12, 20),
-        ALOHANode(10, 0.25, 11, 14, 19),
-        ALOHANode(11, 0.25, 11, 16, 18),
-        ALOHANode(12, 0.25, 11, 18, 16),
-        ALOHANode(13, 0.25, 11, 19, 14),
-        ALOHANode(14, 0.25, 11, 20, 12),
-        ALOHANode(15, 0.25, 11, 20, 10),
-        ALOHANode(16, 0.25, 11, 10, 0),
-        ALOHANode(17, 0.25, 11, 12, 0),
-        ALOHANode(18, 0.25, 11, 14, 1),
-        ALOHANode(19, 0.25, 11, 16, 2),
-        ALOHANode(20, 0.25, 11, 18, 4),
-        ALOHANode(21, 0.25, 11, 19, 6),
-        ALOHANode(22, 0.25, 11, 20, 8),
-        ALOHANode(23, 0.25, 11, 20, 10),
-        ALOHANode(24, 0.25, 11, 8, 0),
-        ALOHANode(25, 0.25, 11, 6, 1),
-        ALOHANode(26, 0.25, 11, 4, 2),
-        ALOHANode(27, 0.25, 11, 2, 3),
-        ALOHANode(28, 0.25, 11, 1, 5),
-        ALOHANode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 1", 25), 1),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 2", 25), 2),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 3", 25), 3),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 4", 25), 4),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 5", 25), 5),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 6", 25), 6),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 7", 25), 7),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 8", 25), 8),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 9", 25), 9),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 10", 25), 10),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 11", 25), 11),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 12", 25), 12),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 13", 25), 13),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 14", 25), 14),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 15", 25), 15),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 16", 25), 16),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 17", 25), 17),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 18", 25), 18),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 19", 25), 19),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 20", 25), 20),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 21", 25), 21),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 22", 25), 22),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 23", 25), 23),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 24", 25), 24),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 25", 25), 25),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 26", 25), 26),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 27", 25), 27),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 28", 25), 28),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 29", 25), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_rts_cts_25_random_max_25 = Scenario(
-    "data_sink_rts_cts_25_random_max_25",
-    0.25, 
-    5,
-    [
-        RTSCTSNode(0, 0.25, 11, 10, 10), # sink
-        RTSCTSNode(1, 0.25, 11, 0, 10),
-        RTSCTSNode(2, 0.25, 11, 0, 12),
-        RTSCTSNode(3, 0.25, 11, 1, 14),
-        RTSCTSNode(4, 0.25, 11, 2, 16),
-        RTSCTSNode(5, 0.25, 11, 4, 18),
-        RTSCTSNode(6, 0.25, 11, 6, 19),
-        RTSCTSNode(7, 0.25, 11, 8, 20),
-        RTSCTSNode(8, 0.25, 11, 10, 20),
-        RTSCTSNode(9, 0.25, 11, 12, 20),
-        RTSCTSNode(10, 0.25, 11, 14, 19),
-        RTSCTSNode(11, 0.25, 11, 16, 18),
-        RTSCTSNode(12, 0.25, 11, 18, 16),
-        RTSCTSNode(13, 0.25, 11, 19, 14),
-        RTSCTSNode(14, 0.25, 11, 20, 12),
-        RTSCTSNode(15, 0.25, 11, 20, 10),
-        RTSCTSNode(16, 0.25, 11, 10, 0),
-        RTSCTSNode(17, 0.25, 11, 12, 0),
-        RTSCTSNode(18, 0.25, 11, 14, 1),
-        RTSCTSNode(19, 0.25, 11, 16, 2),
-        RTSCTSNode(20, 0.25, 11, 18, 4),
-        RTSCTSNode(21, 0.25, 11, 19, 6),
-        RTSCTSNode(22, 0.25, 11, 20, 8),
-        RTSCTSNode(23, 0.25, 11, 20, 10),
-        RTSCTSNode(24, 0.25, 11, 8, 0),
-        RTSCTSNode(25, 0.25, 11, 6, 1),
-        RTSCTSNode(26, 0.25, 11, 4, 2),
-        RTSCTSNode(27, 0.25, 11, 2, 3),
-        RTSCTSNode(28, 0.25, 11, 1, 5),
-        RTSCTSNode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 1", 25), 1),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 2", 25), 2),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 3", 25), 3),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 4", 25), 4),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 5", 25), 5),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 6", 25), 6),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 7", 25), 7),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 8", 25), 8),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 9", 25), 9),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 10", 25), 10),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 11", 25), 11),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 12", 25), 12),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 13", 25), 13),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 14", 25), 14),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 15", 25), 15),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 16", 25), 16),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 17", 25), 17),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 18", 25), 18),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 19", 25), 19),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 20", 25), 20),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 21", 25), 21),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 22", 25), 22),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 23", 25), 23),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 24", 25), 24),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 25", 25), 25),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 26", 25), 26),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 27", 25), 27),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 28", 25), 28),
-        PlannedTransmission(random.randrange(0, 25), HighLevelMessage(0, "Hello from 29", 25), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_rts_cts_25_random_max_50 = Scenario(
-    "data_sink_rts_cts_25_random_max_50",
-    0.25, 
-    5,
-    [
-        RTSCTSNode(0, 0.25, 11, 10, 10), # sink
-        RTSCTSNode(1, 0.25, 11, 0, 10),
-        RTSCTSNode(2, 0.25, 11, 0, 12),
-        RTSCTSNode(3, 0.25, 11, 1, 14),
-        RTSCTSNode(4, 0.25, 11, 2, 16),
-        RTSCTSNode(5, 0.25, 11, 4, 18),
-        RTSCTSNode(6, 0.25, 11, 6, 19),
-        RTSCTSNode(7, 0.25, 11, 8, 20),
-        RTSCTSNode(8, 0.25, 11, 10, 20),
-        RTSCTSNode(9, 0.25, 11, 12, 20),
-        RTSCTSNode(10, 0.25, 11, 14, 19),
-        RTSCTSNode(11, 0.25, 11, 16, 18),
-        RTSCTSNode(12, 0.25, 11, 18, 16),
-        RTSCTSNode(13, 0.25, 11, 19, 14),
-        RTSCTSNode(14, 0.25, 11, 20, 12),
-        RTSCTSNode(15, 0.25, 11, 20, 10),
-        RTSCTSNode(16, 0.25, 11, 10, 0),
-        RTSCTSNode(17, 0.25, 11, 12, 0),
-        RTSCTSNode(18, 0.25, 11, 14, 1),
-        RTSCTSNode(19, 0.25, 11, 16, 2),
-        RTSCTSNode(20, 0.25, 11, 18, 4),
-        RTSCTSNode(21, 0.25, 11, 19, 6),
-        RTSCTSNode(22, 0.25, 11, 20, 8),
-        RTSCTSNode(23, 0.25, 11, 20, 10),
-        RTSCTSNode(24, 0.25, 11, 8, 0),
-        RTSCTSNode(25, 0.25, 11, 6, 1),
-        RTSCTSNode(26, 0.25, 11, 4, 2),
-        RTSCTSNode(27, 0.25, 11, 2, 3),
-        RTSCTSNode(28, 0.25, 11, 1, 5),
-        RTSCTSNode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 1", 25), 1),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 2", 25), 2),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 3", 25), 3),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 4", 25), 4),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 5", 25), 5),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 6", 25), 6),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 7", 25), 7),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 8", 25), 8),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 9", 25), 9),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 10", 25), 10),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 11", 25), 11),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 12", 25), 12),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 13", 25), 13),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 14", 25), 14),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 15", 25), 15),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 16", 25), 16),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 17", 25), 17),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 18", 25), 18),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 19", 25), 19),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 20", 25), 20),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 21", 25), 21),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 22", 25), 22),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 23", 25), 23),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 24", 25), 24),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 25", 25), 25),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 26", 25), 26),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 27", 25), 27),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 28", 25), 28),
-        PlannedTransmission(random.randrange(0, 50), HighLevelMessage(0, "Hello from 29", 25), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_rts_cts_25_random_max_75 = Scenario(
-    "data_sink_rts_cts_25_random_max_75",
-    0.25, 
-    5,
-    [
-        RTSCTSNode(0, 0.25, 11, 10, 10), # sink
-        RTSCTSNode(1, 0.25, 11, 0, 10),
-        RTSCTSNode(2, 0.25, 11, 0, 12),
-        RTSCTSNode(3, 0.25, 11, 1, 14),
-        RTSCTSNode(4, 0.25, 11, 2, 16),
-        RTSCTSNode(5, 0.25, 11, 4, 18),
-        RTSCTSNode(6, 0.25, 11, 6, 19),
-        RTSCTSNode(7, 0.25, 11, 8, 20),
-        RTSCTSNode(8, 0.25, 11, 10, 20),
-        RTSCTSNode(9, 0.25, 11, 12, 20),
-        RTSCTSNode(10, 0.25, 11, 14, 19),
-        RTSCTSNode(11, 0.25, 11, 16, 18),
-        RTSCTSNode(12, 0.25, 11, 18, 16),
-        RTSCTSNode(13, 0.25, 11, 19, 14),
-        RTSCTSNode(14, 0.25, 11, 20, 12),
-        RTSCTSNode(15, 0.25, 11, 20, 10),
-        RTSCTSNode(16, 0.25, 11, 10, 0),
-        RTSCTSNode(17, 0.25, 11, 12, 0),
-        RTSCTSNode(18, 0.25, 11, 14, 1),
-        RTSCTSNode(19, 0.25, 11, 16, 2),
-        RTSCTSNode(20, 0.25, 11, 18, 4),
-        RTSCTSNode(21, 0.25, 11, 19, 6),
-        RTSCTSNode(22, 0.25, 11, 20, 8),
-        RTSCTSNode(23, 0.25, 11, 20, 10),
-        RTSCTSNode(24, 0.25, 11, 8, 0),
-        RTSCTSNode(25, 0.25, 11, 6, 1),
-        RTSCTSNode(26, 0.25, 11, 4, 2),
-        RTSCTSNode(27, 0.25, 11, 2, 3),
-        RTSCTSNode(28, 0.25, 11, 1, 5),
-        RTSCTSNode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 1", 25), 1),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 2", 25), 2),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 3", 25), 3),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 4", 25), 4),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 5", 25), 5),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 6", 25), 6),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 7", 25), 7),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 8", 25), 8),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 9", 25), 9),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 10", 25), 10),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 11", 25), 11),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 12", 25), 12),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 13", 25), 13),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 14", 25), 14),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 15", 25), 15),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 16", 25), 16),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 17", 25), 17),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 18", 25), 18),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 19", 25), 19),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 20", 25), 20),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 21", 25), 21),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 22", 25), 22),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 23", 25), 23),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 24", 25), 24),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 25", 25), 25),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 26", 25), 26),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 27", 25), 27),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 28", 25), 28),
-        PlannedTransmission(random.randrange(0, 75), HighLevelMessage(0, "Hello from 29", 25), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_rts_cts_25_random_max_100 = Scenario(
-    "data_sink_rts_cts_25_random_max_100",
-    0.25, 
-    5,
-    [
-        RTSCTSNode(0, 0.25, 11, 10, 10), # sink
-        RTSCTSNode(1, 0.25, 11, 0, 10),
-        RTSCTSNode(2, 0.25, 11, 0, 12),
-        RTSCTSNode(3, 0.25, 11, 1, 14),
-        RTSCTSNode(4, 0.25, 11, 2, 16),
-        RTSCTSNode(5, 0.25, 11, 4, 18),
-        RTSCTSNode(6, 0.25, 11, 6, 19),
-        RTSCTSNode(7, 0.25, 11, 8, 20),
-        RTSCTSNode(8, 0.25, 11, 10, 20),
-        RTSCTSNode(9, 0.25, 11, 12, 20),
-        RTSCTSNode(10, 0.25, 11, 14, 19),
-        RTSCTSNode(11, 0.25, 11, 16, 18),
-        RTSCTSNode(12, 0.25, 11, 18, 16),
-        RTSCTSNode(13, 0.25, 11, 19, 14),
-        RTSCTSNode(14, 0.25, 11, 20, 12),
-        RTSCTSNode(15, 0.25, 11, 20, 10),
-        RTSCTSNode(16, 0.25, 11, 10, 0),
-        RTSCTSNode(17, 0.25, 11, 12, 0),
-        RTSCTSNode(18, 0.25, 11, 14, 1),
-        RTSCTSNode(19, 0.25, 11, 16, 2),
-        RTSCTSNode(20, 0.25, 11, 18, 4),
-        RTSCTSNode(21, 0.25, 11, 19, 6),
-        RTSCTSNode(22, 0.25, 11, 20, 8),
-        RTSCTSNode(23, 0.25, 11, 20, 10),
-        RTSCTSNode(24, 0.25, 11, 8, 0),
-        RTSCTSNode(25, 0.25, 11, 6, 1),
-        RTSCTSNode(26, 0.25, 11, 4, 2),
-        RTSCTSNode(27, 0.25, 11, 2, 3),
-        RTSCTSNode(28, 0.25, 11, 1, 5),
-        RTSCTSNode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 1", 25), 1),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 2", 25), 2),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 3", 25), 3),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 4", 25), 4),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 5", 25), 5),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 6", 25), 6),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 7", 25), 7),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 8", 25), 8),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 9", 25), 9),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 10", 25), 10),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 11", 25), 11),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 12", 25), 12),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 13", 25), 13),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 14", 25), 14),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 15", 25), 15),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 16", 25), 16),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 17", 25), 17),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 18", 25), 18),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 19", 25), 19),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 20", 25), 20),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 21", 25), 21),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 22", 25), 22),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 23", 25), 23),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 24", 25), 24),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 25", 25), 25),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 26", 25), 26),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 27", 25), 27),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 28", 25), 28),
-        PlannedTransmission(random.randrange(0, 100), HighLevelMessage(0, "Hello from 29", 25), 29),
-    ],
-    29,
-    0
-)
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-data_sink_rts_cts_5 = Scenario(
-    "data_sink_rts_cts_5",
-    0.25, 
-    5,
-    [
-        RTSCTSNode(0, 0.25, 11, 10, 10), # sink
-        RTSCTSNode(1, 0.25, 11, 0, 10),
-        RTSCTSNode(2, 0.25, 11, 0, 12),
-        RTSCTSNode(3, 0.25, 11, 1, 14),
-        RTSCTSNode(4, 0.25, 11, 2, 16),
-        RTSCTSNode(5, 0.25, 11, 4, 18),
-        RTSCTSNode(6, 0.25, 11, 6, 19),
-        RTSCTSNode(7, 0.25, 11, 8, 20),
-        RTSCTSNode(8, 0.25, 11, 10, 20),
-        RTSCTSNode(9, 0.25, 11, 12, 20),
-        RTSCTSNode(10, 0.25, 11, 14, 19),
-        RTSCTSNode(11, 0.25, 11, 16, 18),
-        RTSCTSNode(12, 0.25, 11, 18, 16),
-        RTSCTSNode(13, 0.25, 11, 19, 14),
-        RTSCTSNode(14, 0.25, 11, 20, 12),
-        RTSCTSNode(15, 0.25, 11, 20, 10),
-        RTSCTSNode(16, 0.25, 11, 10, 0),
-        RTSCTSNode(17, 0.25, 11, 12, 0),
-        RTSCTSNode(18, 0.25, 11, 14, 1),
-        RTSCTSNode(19, 0.25, 11, 16, 2),
-        RTSCTSNode(20, 0.25, 11, 18, 4),
-        RTSCTSNode(21, 0.25, 11, 19, 6),
-        RTSCTSNode(22, 0.25, 11, 20, 8),
-        RTSCTSNode(23, 0.25, 11, 20, 10),
-        RTSCTSNode(24, 0.25, 11, 8, 0),
-        RTSCTSNode(25, 0.25, 11, 6, 1),
-        RTSCTSNode(26, 0.25, 11, 4, 2),
-        RTSCTSNode(27, 0.25, 11, 2, 3),
-        RTSCTSNode(28, 0.25, 11, 1, 5),
-        RTSCTSNode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 1", 5), 1),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 2", 5), 2),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 3", 5), 3),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 4", 5), 4),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 5", 5), 5),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 6", 5), 6),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 7", 5), 7),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 8", 5), 8),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 9", 5), 9),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 10", 5), 10),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 11", 5), 11),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 12", 5), 12),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 13", 5), 13),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 14", 5), 14),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 15", 5), 15),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 16", 5), 16),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 17", 5), 17),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 18", 5), 18),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 19", 5), 19),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 20", 5), 20),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 21", 5), 21),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 22", 5), 22),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 23", 5), 23),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 24", 5), 24),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 25", 5), 25),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 26", 5), 26),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 27", 5), 27),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 28", 5), 28),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 29", 5), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_rts_cts_25 = Scenario(
-    "data_sink_rts_cts_25",
-    0.25, 
-    5,
-    [
-        RTSCTSNode(0, 0.25, 11, 10, 10), # sink
-        RTSCTSNode(1, 0.25, 11, 0, 10),
-        RTSCTSNode(2, 0.25, 11, 0, 12),
-        RTSCTSNode(3, 0.25, 11, 1, 14),
-        RTSCTSNode(4, 0.25, 11, 2, 16),
-        RTSCTSNode(5, 0.25, 11, 4, 18),
-        RTSCTSNode(6, 0.25, 11, 6, 19),
-        RTSCTSNode(7, 0.25, 11, 8, 20),
-        RTSCTSNode(8, 0.25, 11, 10, 20),
-        RTSCTSNode(9, 0.25, 11, 12, 20),
-        RTSCTSNode(10, 0.25, 11, 14, 19),
-        RTSCTSNode(11, 0.25, 11, 16, 18),
-        RTSCTSNode(12, 0.25, 11, 18, 16),
-        RTSCTSNode(13, 0.25, 11, 19, 14),
-        RTSCTSNode(14, 0.25, 11, 20, 12),
-        RTSCTSNode(15, 0.25, 11, 20, 10),
-        RTSCTSNode(16, 0.25, 11, 10, 0),
-        RTSCTSNode(17, 0.25, 11, 12, 0),
-        RTSCTSNode(18, 0.25, 11, 14, 1),
-        RTSCTSNode(19, 0.25, 11, 16, 2),
-        RTSCTSNode(20, 0.25, 11, 18, 4),
-        RTSCTSNode(21, 0.25, 11, 19, 6),
-        RTSCTSNode(22, 0.25, 11, 20, 8),
-        RTSCTSNode(23, 0.25, 11, 20, 10),
-        RTSCTSNode(24, 0.25, 11, 8, 0),
-        RTSCTSNode(25, 0.25, 11, 6, 1),
-        RTSCTSNode(26, 0.25, 11, 4, 2),
-        RTSCTSNode(27, 0.25, 11, 2, 3),
-        RTSCTSNode(28, 0.25, 11, 1, 5),
-        RTSCTSNode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 1", 25), 1),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 2", 25), 2),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 3", 25), 3),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 4", 25), 4),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 5", 25), 5),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 6", 25), 6),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 7", 25), 7),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 8", 25), 8),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 9", 25), 9),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 10", 25), 10),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 11", 25), 11),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 12", 25), 12),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 13", 25), 13),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 14", 25), 14),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 15", 25), 15),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 16", 25), 16),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 17", 25), 17),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 18", 25), 18),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 19", 25), 19),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 20", 25), 20),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 21", 25), 21),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 22", 25), 22),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 23", 25), 23),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 24", 25), 24),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 25", 25), 25),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 26", 25), 26),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 27", 25), 27),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 28", 25), 28),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 29", 25), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_rts_cts_50 = Scenario(
-    "data_sink_rts_cts_50",
-    0.25, 
-    5,
-    [
-        RTSCTSNode(0, 0.25, 11, 10, 10), # sink
-        RTSCTSNode(1, 0.25, 11, 0, 10),
-        RTSCTSNode(2, 0.25, 11, 0, 12),
-        RTSCTSNode(3, 0.25, 11, 1, 14),
-        RTSCTSNode(4, 0.25, 11, 2, 16),
-        RTSCTSNode(5, 0.25, 11, 4, 18),
-        RTSCTSNode(6, 0.25, 11, 6, 19),
-        RTSCTSNode(7, 0.25, 11, 8, 20),
-        RTSCTSNode(8, 0.25, 11, 10, 20),
-        RTSCTSNode(9, 0.25, 11, 12, 20),
-        RTSCTSNode(10, 0.25, 11, 14, 19),
-        RTSCTSNode(11, 0.25, 11, 16, 18),
-        RTSCTSNode(12, 0.25, 11, 18, 16),
-        RTSCTSNode(13, 0.25, 11, 19, 14),
-        RTSCTSNode(14, 0.25, 11, 20, 12),
-        RTSCTSNode(15, 0.25, 11, 20, 10),
-        RTSCTSNode(16, 0.25, 11, 10, 0),
-        RTSCTSNode(17, 0.25, 11, 12, 0),
-        RTSCTSNode(18, 0.25, 11, 14, 1),
-        RTSCTSNode(19, 0.25, 11, 16, 2),
-        RTSCTSNode(20, 0.25, 11, 18, 4),
-        RTSCTSNode(21, 0.25, 11, 19, 6),
-        RTSCTSNode(22, 0.25, 11, 20, 8),
-        RTSCTSNode(23, 0.25, 11, 20, 10),
-        RTSCTSNode(24, 0.25, 11, 8, 0),
-        RTSCTSNode(25, 0.25, 11, 6, 1),
-        RTSCTSNode(26, 0.25, 11, 4, 2),
-        RTSCTSNode(27, 0.25, 11, 2, 3),
-        RTSCTSNode(28, 0.25, 11, 1, 5),
-        RTSCTSNode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 1", 50), 1),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 2", 50), 2),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 3", 50), 3),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 4", 50), 4),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 5", 50), 5),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 6", 50), 6),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 7", 50), 7),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 8", 50), 8),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 9", 50), 9),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 10", 50), 10),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 11", 50), 11),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 12", 50), 12),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 13", 50), 13),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 14", 50), 14),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 15", 50), 15),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 16", 50), 16),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 17", 50), 17),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 18", 50), 18),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 19", 50), 19),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 20", 50), 20),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 21", 50), 21),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 22", 50), 22),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 23", 50), 23),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 24", 50), 24),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 25", 50), 25),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 26", 50), 26),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 27", 50), 27),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 28", 50), 28),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 29", 50), 29),
-    ],
-    29,
-    0
-)
-
-data_sink_rts_cts_75 = Scenario(
-    "data_sink_rts_cts_75",
-    0.25, 
-    5,
-    [
-        RTSCTSNode(0, 0.25, 11, 10, 10), # sink
-        RTSCTSNode(1, 0.25, 11, 0, 10),
-        RTSCTSNode(2, 0.25, 11, 0, 12),
-        RTSCTSNode(3, 0.25, 11, 1, 14),
-        RTSCTSNode(4, 0.25, 11, 2, 16),
-        RTSCTSNode(5, 0.25, 11, 4, 18),
-        RTSCTSNode(6, 0.25, 11, 6, 19),
-        RTSCTSNode(7, 0.25, 11, 8, 20),
-        RTSCTSNode(8, 0.25, 11, 10, 20),
-        RTSCTSNode(9, 0.25, 11, 12, 20),
-        RTSCTSNode(10, 0.25, 11, 14, 19),
-        RTSCTSNode(11, 0.25, 11, 16, 18),
-        RTSCTSNode(12, 0.25, 11, 18, 16),
-        RTSCTSNode(13, 0.25, 11, 19, 14),
-        RTSCTSNode(14, 0.25, 11, 20, 12),
-        RTSCTSNode(15, 0.25, 11, 20, 10),
-        RTSCTSNode(16, 0.25, 11, 10, 0),
-        RTSCTSNode(17, 0.25, 11, 12, 0),
-        RTSCTSNode(18, 0.25, 11, 14, 1),
-        RTSCTSNode(19, 0.25, 11, 16, 2),
-        RTSCTSNode(20, 0.25, 11, 18, 4),
-        RTSCTSNode(21, 0.25, 11, 19, 6),
-        RTSCTSNode(22, 0.25, 11, 20, 8),
-        RTSCTSNode(23, 0.25, 11, 20, 10),
-        RTSCTSNode(24, 0.25, 11, 8, 0),
-        RTSCTSNode(25, 0.25, 11, 6, 1),
-        RTSCTSNode(26, 0.25, 11, 4, 2),
-        RTSCTSNode(27, 0.25, 11, 2, 3),
-        RTSCTSNode(28, 0.25, 11, 1, 5),
-        RTSCTSNode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 1", 75), 1),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 2", 75), 2),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 3", 75), 3),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 4", 75), 4),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 5", 75), 5),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 6", 75), 6),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 7", 75), 7),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 8", 75), 8),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 9", 75), 9),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 10", 75), 10),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 11", 75), 11),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 12", 75), 12),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 13", 75), 13),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 14", 75), 14),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 15", 75), 15),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 16", 75), 16),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 17", 75), 17),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 18", 75), 18),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 19", 75), 19),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 20", 75), 20),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 21", 75), 21),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 22", 75), 22),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 23", 75), 23),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 24", 75), 24),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 25", 75), 25),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 26", 75), 26),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 27", 75), 27),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 28", 75), 28),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 29", 75), 29),
-    ],
-    29,
-    0
-)
+    def get_node_by_id(self, id: int) -> Node | None:
+        return self.topology.get_node(id)
 
-data_sink_rts_cts_100 = Scenario(
-    "data_sink_rts_cts_100",
-    0.25, 
-    5,
-    [
-        RTSCTSNode(0, 0.25, 11, 10, 10), # sink
-        RTSCTSNode(1, 0.25, 11, 0, 10),
-        RTSCTSNode(2, 0.25, 11, 0, 12),
-        RTSCTSNode(3, 0.25, 11, 1, 14),
-        RTSCTSNode(4, 0.25, 11, 2, 16),
-        RTSCTSNode(5, 0.25, 11, 4, 18),
-        RTSCTSNode(6, 0.25, 11, 6, 19),
-        RTSCTSNode(7, 0.25, 11, 8, 20),
-        RTSCTSNode(8, 0.25, 11, 10, 20),
-        RTSCTSNode(9, 0.25, 11, 12, 20),
-        RTSCTSNode(10, 0.25, 11, 14, 19),
-        RTSCTSNode(11, 0.25, 11, 16, 18),
-        RTSCTSNode(12, 0.25, 11, 18, 16),
-        RTSCTSNode(13, 0.25, 11, 19, 14),
-        RTSCTSNode(14, 0.25, 11, 20, 12),
-        RTSCTSNode(15, 0.25, 11, 20, 10),
-        RTSCTSNode(16, 0.25, 11, 10, 0),
-        RTSCTSNode(17, 0.25, 11, 12, 0),
-        RTSCTSNode(18, 0.25, 11, 14, 1),
-        RTSCTSNode(19, 0.25, 11, 16, 2),
-        RTSCTSNode(20, 0.25, 11, 18, 4),
-        RTSCTSNode(21, 0.25, 11, 19, 6),
-        RTSCTSNode(22, 0.25, 11, 20, 8),
-        RTSCTSNode(23, 0.25, 11, 20, 10),
-        RTSCTSNode(24, 0.25, 11, 8, 0),
-        RTSCTSNode(25, 0.25, 11, 6, 1),
-        RTSCTSNode(26, 0.25, 11, 4, 2),
-        RTSCTSNode(27, 0.25, 11, 2, 3),
-        RTSCTSNode(28, 0.25, 11, 1, 5),
-        RTSCTSNode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 1",  100), 1),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 2",  100), 2),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 3",  100), 3),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 4",  100), 4),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 5",  100), 5),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 6",  100), 6),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 7",  100), 7),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 8",  100), 8),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 9",  100), 9),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 10", 100), 10),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 11", 100), 11),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 12", 100), 12),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 13", 100), 13),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 14", 100), 14),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 15", 100), 15),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 16", 100), 16),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 17", 100), 17),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 18", 100), 18),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 19", 100), 19),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 20", 100), 20),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 21", 100), 21),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 22", 100), 22),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 23", 100), 23),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 24", 100), 24),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 25", 100), 25),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 26", 100), 26),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 27", 100), 27),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 28", 100), 28),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 29", 100), 29),
-    ],
-    29,
-    0
-)
 
-data_sink_rts_cts_125 = Scenario(
-    "data_sink_rts_cts_125",
-    0.25, 
-    5,
-    [
-        RTSCTSNode(0, 0.25, 11, 10, 10), # sink
-        RTSCTSNode(1, 0.25, 11, 0, 10),
-        RTSCTSNode(2, 0.25, 11, 0, 12),
-        RTSCTSNode(3, 0.25, 11, 1, 14),
-        RTSCTSNode(4, 0.25, 11, 2, 16),
-        RTSCTSNode(5, 0.25, 11, 4, 18),
-        RTSCTSNode(6, 0.25, 11, 6, 19),
-        RTSCTSNode(7, 0.25, 11, 8, 20),
-        RTSCTSNode(8, 0.25, 11, 10, 20),
-        RTSCTSNode(9, 0.25, 11, 12, 20),
-        RTSCTSNode(10, 0.25, 11, 14, 19),
-        RTSCTSNode(11, 0.25, 11, 16, 18),
-        RTSCTSNode(12, 0.25, 11, 18, 16),
-        RTSCTSNode(13, 0.25, 11, 19, 14),
-        RTSCTSNode(14, 0.25, 11, 20, 12),
-        RTSCTSNode(15, 0.25, 11, 20, 10),
-        RTSCTSNode(16, 0.25, 11, 10, 0),
-        RTSCTSNode(17, 0.25, 11, 12, 0),
-        RTSCTSNode(18, 0.25, 11, 14, 1),
-        RTSCTSNode(19, 0.25, 11, 16, 2),
-        RTSCTSNode(20, 0.25, 11, 18, 4),
-        RTSCTSNode(21, 0.25, 11, 19, 6),
-        RTSCTSNode(22, 0.25, 11, 20, 8),
-        RTSCTSNode(23, 0.25, 11, 20, 10),
-        RTSCTSNode(24, 0.25, 11, 8, 0),
-        RTSCTSNode(25, 0.25, 11, 6, 1),
-        RTSCTSNode(26, 0.25, 11, 4, 2),
-        RTSCTSNode(27, 0.25, 11, 2, 3),
-        RTSCTSNode(28, 0.25, 11, 1, 5),
-        RTSCTSNode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 1",  125), 1),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 2",  125), 2),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 3",  125), 3),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 4",  125), 4),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 5",  125), 5),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 6",  125), 6),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 7",  125), 7),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 8",  125), 8),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 9",  125), 9),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 10", 125), 10),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 11", 125), 11),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 12", 125), 12),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 13", 125), 13),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 14", 125), 14),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 15", 125), 15),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 16", 125), 16),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 17", 125), 17),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 18", 125), 18),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 19", 125), 19),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 20", 125), 20),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 21", 125), 21),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 22", 125), 22),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 23", 125), 23),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 24", 125), 24),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 25", 125), 25),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 26", 125), 26),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 27", 125), 27),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 28", 125), 28),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 29", 125), 29),
-    ],
-    29,
-    0
-)
+    def send_messages(self, simulation_time: int):
+        for transmission in self.transmissions_by_time.get(simulation_time, ()):
+            node = self.get_node_by_id(transmission.source_node_id)
+            node.send(transmission.message)
+            if self.engine:
+                self.engine.mark_pending(node)
+            if self.wakeup_queue:
+                self.wakeup_queue.refresh(self.topology.get_index(node.id), simulation_time)
 
-data_sink_rts_cts_150 = Scenario(
-    "data_sink_rts_cts_150",
-    0.25, 
-    5,
-    [
-        RTSCTSNode(0, 0.25, 11, 10, 10), # sink
-        RTSCTSNode(1, 0.25, 11, 0, 10),
-        RTSCTSNode(2, 0.25, 11, 0, 12),
-        RTSCTSNode(3, 0.25, 11, 1, 14),
-        RTSCTSNode(4, 0.25, 11, 2, 16),
-        RTSCTSNode(5, 0.25, 11, 4, 18),
-        RTSCTSNode(6, 0.25, 11, 6, 19),
-        RTSCTSNode(7, 0.25, 11, 8, 20),
-        RTSCTSNode(8, 0.25, 11, 10, 20),
-        RTSCTSNode(9, 0.25, 11, 12, 20),
-        RTSCTSNode(10, 0.25, 11, 14, 19),
-        RTSCTSNode(11, 0.25, 11, 16, 18),
-        RTSCTSNode(12, 0.25, 11, 18, 16),
-        RTSCTSNode(13, 0.25, 11, 19, 14),
-        RTSCTSNode(14, 0.25, 11, 20, 12),
-        RTSCTSNode(15, 0.25, 11, 20, 10),
-        RTSCTSNode(16, 0.25, 11, 10, 0),
-        RTSCTSNode(17, 0.25, 11, 12, 0),
-        RTSCTSNode(18, 0.25, 11, 14, 1),
-        RTSCTSNode(19, 0.25, 11, 16, 2),
-        RTSCTSNode(20, 0.25, 11, 18, 4),
-        RTSCTSNode(21, 0.25, 11, 19, 6),
-        RTSCTSNode(22, 0.25, 11, 20, 8),
-        RTSCTSNode(23, 0.25, 11, 20, 10),
-        RTSCTSNode(24, 0.25, 11, 8, 0),
-        RTSCTSNode(25, 0.25, 11, 6, 1),
-        RTSCTSNode(26, 0.25, 11, 4, 2),
-        RTSCTSNode(27, 0.25, 11, 2, 3),
-        RTSCTSNode(28, 0.25, 11, 1, 5),
-        RTSCTSNode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 1",  150), 1),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 2",  150), 2),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 3",  150), 3),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 4",  150), 4),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 5",  150), 5),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 6",  150), 6),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 7",  150), 7),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 8",  150), 8),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 9",  150), 9),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 10", 150), 10),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 11", 150), 11),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 12", 150), 12),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 13", 150), 13),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 14", 150), 14),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 15", 150), 15),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 16", 150), 16),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 17", 150), 17),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 18", 150), 18),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 19", 150), 19),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 20", 150), 20),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 21", 150), 21),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 22", 150), 22),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 23", 150), 23),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 24", 150), 24),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 25", 150), 25),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 26", 150), 26),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 27", 150), 27),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 28", 150), 28),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 29", 150), 29),
-    ],
-    29,
-    0
-)
 
-data_sink_rts_cts_175 = Scenario(
-    "data_sink_rts_cts_175",
-    0.25, 
-    5,
-    [
-        RTSCTSNode(0, 0.25, 11, 10, 10), # sink
-        RTSCTSNode(1, 0.25, 11, 0, 10),
-        RTSCTSNode(2, 0.25, 11, 0, 12),
-        RTSCTSNode(3, 0.25, 11, 1, 14),
-        RTSCTSNode(4, 0.25, 11, 2, 16),
-        RTSCTSNode(5, 0.25, 11, 4, 18),
-        RTSCTSNode(6, 0.25, 11, 6, 19),
-        RTSCTSNode(7, 0.25, 11, 8, 20),
-        RTSCTSNode(8, 0.25, 11, 10, 20),
-        RTSCTSNode(9, 0.25, 11, 12, 20),
-        RTSCTSNode(10, 0.25, 11, 14, 19),
-        RTSCTSNode(11, 0.25, 11, 16, 18),
-        RTSCTSNode(12, 0.25, 11, 18, 16),
-        RTSCTSNode(13, 0.25, 11, 19, 14),
-        RTSCTSNode(14, 0.25, 11, 20, 12),
-        RTSCTSNode(15, 0.25, 11, 20, 10),
-        RTSCTSNode(16, 0.25, 11, 10, 0),
-        RTSCTSNode(17, 0.25, 11, 12, 0),
-        RTSCTSNode(18, 0.25, 11, 14, 1),
-        RTSCTSNode(19, 0.25, 11, 16, 2),
-        RTSCTSNode(20, 0.25, 11, 18, 4),
-        RTSCTSNode(21, 0.25, 11, 19, 6),
-        RTSCTSNode(22, 0.25, 11, 20, 8),
-        RTSCTSNode(23, 0.25, 11, 20, 10),
-        RTSCTSNode(24, 0.25, 11, 8, 0),
-        RTSCTSNode(25, 0.25, 11, 6, 1),
-        RTSCTSNode(26, 0.25, 11, 4, 2),
-        RTSCTSNode(27, 0.25, 11, 2, 3),
-        RTSCTSNode(28, 0.25, 11, 1, 5),
-        RTSCTSNode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 1",  175), 1),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 2",  175), 2),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 3",  175), 3),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 4",  175), 4),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 5",  175), 5),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 6",  175), 6),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 7",  175), 7),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 8",  175), 8),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 9",  175), 9),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 10", 175), 10),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 11", 175), 11),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 12", 175), 12),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 13", 175), 13),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 14", 175), 14),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 15", 175), 15),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 16", 175), 16),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 17", 175), 17),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 18", 175), 18),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 19", 175), 19),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 20", 175), 20),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 21", 175), 21),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 22", 175), 22),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 23", 175), 23),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 24", 175), 24),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 25", 175), 25),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 26", 175), 26),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 27", 175), 27),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 28", 175), 28),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 29", 175), 29),
-    ],
-    29,
-    0
-)
+    def get_next_send_time(self, simulation_time: int) -> int | float:
+        index = bisect.bisect_left(self.send_times, simulation_time)
+        return self.send_times[index] if index < len(self.send_times) else float('inf')
 
-data_sink_rts_cts_200 = Scenario(
-    "data_sink_rts_cts_200",
-    0.25, 
-    5,
-    [
-        RTSCTSNode(0, 0.25, 11, 10, 10), # sink
-        RTSCTSNode(1, 0.25, 11, 0, 10),
-        RTSCTSNode(2, 0.25, 11, 0, 12),
-        RTSCTSNode(3, 0.25, 11, 1, 14),
-        RTSCTSNode(4, 0.25, 11, 2, 16),
-        RTSCTSNode(5, 0.25, 11, 4, 18),
-        RTSCTSNode(6, 0.25, 11, 6, 19),
-        RTSCTSNode(7, 0.25, 11, 8, 20),
-        RTSCTSNode(8, 0.25, 11, 10, 20),
-        RTSCTSNode(9, 0.25, 11, 12, 20),
-        RTSCTSNode(10, 0.25, 11, 14, 19),
-        RTSCTSNode(11, 0.25, 11, 16, 18),
-        RTSCTSNode(12, 0.25, 11, 18, 16),
-        RTSCTSNode(13, 0.25, 11, 19, 14),
-        RTSCTSNode(14, 0.25, 11, 20, 12),
-        RTSCTSNode(15, 0.25, 11, 20, 10),
-        RTSCTSNode(16, 0.25, 11, 10, 0),
-        RTSCTSNode(17, 0.25, 11, 12, 0),
-        RTSCTSNode(18, 0.25, 11, 14, 1),
-        RTSCTSNode(19, 0.25, 11, 16, 2),
-        RTSCTSNode(20, 0.25, 11, 18, 4),
-        RTSCTSNode(21, 0.25, 11, 19, 6),
-        RTSCTSNode(22, 0.25, 11, 20, 8),
-        RTSCTSNode(23, 0.25, 11, 20, 10),
-        RTSCTSNode(24, 0.25, 11, 8, 0),
-        RTSCTSNode(25, 0.25, 11, 6, 1),
-        RTSCTSNode(26, 0.25, 11, 4, 2),
-        RTSCTSNode(27, 0.25, 11, 2, 3),
-        RTSCTSNode(28, 0.25, 11, 1, 5),
-        RTSCTSNode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 1",  200), 1),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 2",  200), 2),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 3",  200), 3),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 4",  200), 4),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 5",  200), 5),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 6",  200), 6),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 7",  200), 7),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 8",  200), 8),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 9",  200), 9),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 10", 200), 10),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 11", 200), 11),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 12", 200), 12),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 13", 200), 13),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 14", 200), 14),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 15", 200), 15),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 16", 200), 16),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 17", 200), 17),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 18", 200), 18),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 19", 200), 19),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 20", 200), 20),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 21", 200), 21),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 22", 200), 22),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 23", 200), 23),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 24", 200), 24),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 25", 200), 25),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 26", 200), 26),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 27", 200), 27),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 28", 200), 28),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 29", 200), 29),
-    ],
-    29,
-    0
-)
 
+    def next_event_time(self, simulation_time: int, active_transmissions: Channel) -> int | float:
+        """
+        Returns the next simulation time at which any node or the send schedule can change state.
+        All ticks before that only count down timers and can be skipped using `fast_forward`.
+        Requires `set_event_driven`.
+        """
+        next_event_time = self.get_next_send_time(simulation_time)
+        if self.wakeup_queue:
+            return min(next_event_time, self.wakeup_queue.next_wakeup())
 
-data_sink_aloha_5 = Scenario(
-    "data_sink_aloha_5",
-    0.25, 
-    5,
-    [
-        ALOHANode(0, 0.25, 11, 10, 10), # sink
-        ALOHANode(1, 0.25, 11, 0, 10),
-        ALOHANode(2, 0.25, 11, 0, 12),
-        ALOHANode(3, 0.25, 11, 1, 14),
-        ALOHANode(4, 0.25, 11, 2, 16),
-        ALOHANode(5, 0.25, 11, 4, 18),
-        ALOHANode(6, 0.25, 11, 6, 19),
-        ALOHANode(7, 0.25, 11, 8, 20),
-        ALOHANode(8, 0.25, 11, 10, 20),
-        ALOHANode(9, 0.25, 11, 12, 20),
-        ALOHANode(10, 0.25, 11, 14, 19),
-        ALOHANode(11, 0.25, 11, 16, 18),
-        ALOHANode(12, 0.25, 11, 18, 16),
-        ALOHANode(13, 0.25, 11, 19, 14),
-        ALOHANode(14, 0.25, 11, 20, 12),
-        ALOHANode(15, 0.25, 11, 20, 10),
-        ALOHANode(16, 0.25, 11, 10, 0),
-        ALOHANode(17, 0.25, 11, 12, 0),
-        ALOHANode(18, 0.25, 11, 14, 1),
-        ALOHANode(19, 0.25, 11, 16, 2),
-        ALOHANode(20, 0.25, 11, 18, 4),
-        ALOHANode(21, 0.25, 11, 19, 6),
-        ALOHANode(22, 0.25, 11, 20, 8),
-        ALOHANode(23, 0.25, 11, 20, 10),
-        ALOHANode(24, 0.25, 11, 8, 0),
-        ALOHANode(25, 0.25, 11, 6, 1),
-        ALOHANode(26, 0.25, 11, 4, 2),
-        ALOHANode(27, 0.25, 11, 2, 3),
-        ALOHANode(28, 0.25, 11, 1, 5),
-        ALOHANode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 1", 5), 1),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 2", 5), 2),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 3", 5), 3),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 4", 5), 4),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 5", 5), 5),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 6", 5), 6),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 7", 5), 7),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 8", 5), 8),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 9", 5), 9),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 10", 5), 10),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 11", 5), 11),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 12", 5), 12),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 13", 5), 13),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 14", 5), 14),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 15", 5), 15),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 16", 5), 16),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 17", 5), 17),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 18", 5), 18),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 19", 5), 19),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 20", 5), 20),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 21", 5), 21),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 22", 5), 22),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 23", 5), 23),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 24", 5), 24),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 25", 5), 25),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 26", 5), 26),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 27", 5), 27),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 28", 5), 28),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 29", 5), 29),
-    ],
-    29,
-    0
-)
+        next_event_time = min(next_event_time, self.engine.next_wakeup(simulation_time))
+        # Arrivals are the expensive part, only look at them if nothing else happens right away
+        if next_event_time > simulation_time:
+            for node in self.nodes:
+                next_event_time = min(next_event_time, node.next_arrival(simulation_time, active_transmissions))
 
-data_sink_aloha_25 = Scenario(
-    "data_sink_aloha_25",
-    0.25, 
-    5,
-    [
-        ALOHANode(0, 0.25, 11, 10, 10), # sink
-        ALOHANode(1, 0.25, 11, 0, 10),
-        ALOHANode(2, 0.25, 11, 0, 12),
-        ALOHANode(3, 0.25, 11, 1, 14),
-        ALOHANode(4, 0.25, 11, 2, 16),
-        ALOHANode(5, 0.25, 11, 4, 18),
-        ALOHANode(6, 0.25, 11, 6, 19),
-        ALOHANode(7, 0.25, 11, 8, 20),
-        ALOHANode(8, 0.25, 11, 10, 20),
-        ALOHANode(9, 0.25, 11, 12, 20),
-        ALOHANode(10, 0.25, 11, 14, 19),
-        ALOHANode(11, 0.25, 11, 16, 18),
-        ALOHANode(12, 0.25, 11, 18, 16),
-        ALOHANode(13, 0.25, 11, 19, 14),
-        ALOHANode(14, 0.25, 11, 20, 12),
-        ALOHANode(15, 0.25, 11, 20, 10),
-        ALOHANode(16, 0.25, 11, 10, 0),
-        ALOHANode(17, 0.25, 11, 12, 0),
-        ALOHANode(18, 0.25, 11, 14, 1),
-        ALOHANode(19, 0.25, 11, 16, 2),
-        ALOHANode(20, 0.25, 11, 18, 4),
-        ALOHANode(21, 0.25, 11, 19, 6),
-        ALOHANode(22, 0.25, 11, 20, 8),
-        ALOHANode(23, 0.25, 11, 20, 10),
-        ALOHANode(24, 0.25, 11, 8, 0),
-        ALOHANode(25, 0.25, 11, 6, 1),
-        ALOHANode(26, 0.25, 11, 4, 2),
-        ALOHANode(27, 0.25, 11, 2, 3),
-        ALOHANode(28, 0.25, 11, 1, 5),
-        ALOHANode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 1", 25), 1),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 2", 25), 2),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 3", 25), 3),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 4", 25), 4),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 5", 25), 5),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 6", 25), 6),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 7", 25), 7),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 8", 25), 8),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 9", 25), 9),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 10", 25), 10),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 11", 25), 11),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 12", 25), 12),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 13", 25), 13),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 14", 25), 14),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 15", 25), 15),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 16", 25), 16),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 17", 25), 17),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 18", 25), 18),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 19", 25), 19),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 20", 25), 20),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 21", 25), 21),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 22", 25), 22),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 23", 25), 23),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 24", 25), 24),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 25", 25), 25),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 26", 25), 26),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 27", 25), 27),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 28", 25), 28),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 29", 25), 29),
-    ],
-    29,
-    0
-)
+        return next_event_time
 
-data_sink_aloha_50 = Scenario(
-    "data_sink_aloha_50",
-    0.25, 
-    5,
-    [
-        ALOHANode(0, 0.25, 11, 10, 10), # sink
-        ALOHANode(1, 0.25, 11, 0, 10),
-        ALOHANode(2, 0.25, 11, 0, 12),
-        ALOHANode(3, 0.25, 11, 1, 14),
-        ALOHANode(4, 0.25, 11, 2, 16),
-        ALOHANode(5, 0.25, 11, 4, 18),
-        ALOHANode(6, 0.25, 11, 6, 19),
-        ALOHANode(7, 0.25, 11, 8, 20),
-        ALOHANode(8, 0.25, 11, 10, 20),
-        ALOHANode(9, 0.25, 11, 12, 20),
-        ALOHANode(10, 0.25, 11, 14, 19),
-        ALOHANode(11, 0.25, 11, 16, 18),
-        ALOHANode(12, 0.25, 11, 18, 16),
-        ALOHANode(13, 0.25, 11, 19, 14),
-        ALOHANode(14, 0.25, 11, 20, 12),
-        ALOHANode(15, 0.25, 11, 20, 10),
-        ALOHANode(16, 0.25, 11, 10, 0),
-        ALOHANode(17, 0.25, 11, 12, 0),
-        ALOHANode(18, 0.25, 11, 14, 1),
-        ALOHANode(19, 0.25, 11, 16, 2),
-        ALOHANode(20, 0.25, 11, 18, 4),
-        ALOHANode(21, 0.25, 11, 19, 6),
-        ALOHANode(22, 0.25, 11, 20, 8),
-        ALOHANode(23, 0.25, 11, 20, 10),
-        ALOHANode(24, 0.25, 11, 8, 0),
-        ALOHANode(25, 0.25, 11, 6, 1),
-        ALOHANode(26, 0.25, 11, 4, 2),
-        ALOHANode(27, 0.25, 11, 2, 3),
-        ALOHANode(28, 0.25, 11, 1, 5),
-        ALOHANode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 1", 50), 1),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 2", 50), 2),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 3", 50), 3),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 4", 50), 4),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 5", 50), 5),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 6", 50), 6),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 7", 50), 7),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 8", 50), 8),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 9", 50), 9),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 10", 50), 10),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 11", 50), 11),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 12", 50), 12),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 13", 50), 13),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 14", 50), 14),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 15", 50), 15),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 16", 50), 16),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 17", 50), 17),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 18", 50), 18),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 19", 50), 19),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 20", 50), 20),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 21", 50), 21),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 22", 50), 22),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 23", 50), 23),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 24", 50), 24),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 25", 50), 25),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 26", 50), 26),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 27", 50), 27),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 28", 50), 28),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 29", 50), 29),
-    ],
-    29,
-    0
-)
 
-data_sink_aloha_75 = Scenario(
-    "data_sink_aloha_75",
-    0.25, 
-    5,
-    [
-        ALOHANode(0, 0.25, 11, 10, 10), # sink
-        ALOHANode(1, 0.25, 11, 0, 10),
-        ALOHANode(2, 0.25, 11, 0, 12),
-        ALOHANode(3, 0.25, 11, 1, 14),
-        ALOHANode(4, 0.25, 11, 2, 16),
-        ALOHANode(5, 0.25, 11, 4, 18),
-        ALOHANode(6, 0.25, 11, 6, 19),
-        ALOHANode(7, 0.25, 11, 8, 20),
-        ALOHANode(8, 0.25, 11, 10, 20),
-        ALOHANode(9, 0.25, 11, 12, 20),
-        ALOHANode(10, 0.25, 11, 14, 19),
-        ALOHANode(11, 0.25, 11, 16, 18),
-        ALOHANode(12, 0.25, 11, 18, 16),
-        ALOHANode(13, 0.25, 11, 19, 14),
-        ALOHANode(14, 0.25, 11, 20, 12),
-        ALOHANode(15, 0.25, 11, 20, 10),
-        ALOHANode(16, 0.25, 11, 10, 0),
-        ALOHANode(17, 0.25, 11, 12, 0),
-        ALOHANode(18, 0.25, 11, 14, 1),
-        ALOHANode(19, 0.25, 11, 16, 2),
-        ALOHANode(20, 0.25, 11, 18, 4),
-        ALOHANode(21, 0.25, 11, 19, 6),
-        ALOHANode(22, 0.25, 11, 20, 8),
-        ALOHANode(23, 0.25, 11, 20, 10),
-        ALOHANode(24, 0.25, 11, 8, 0),
-        ALOHANode(25, 0.25, 11, 6, 1),
-        ALOHANode(26, 0.25, 11, 4, 2),
-        ALOHANode(27, 0.25, 11, 2, 3),
-        ALOHANode(28, 0.25, 11, 1, 5),
-        ALOHANode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 1", 75), 1),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 2", 75), 2),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 3", 75), 3),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 4", 75), 4),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 5", 75), 5),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 6", 75), 6),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 7", 75), 7),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 8", 75), 8),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 9", 75), 9),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 10", 75), 10),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 11", 75), 11),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 12", 75), 12),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 13", 75), 13),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 14", 75), 14),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 15", 75), 15),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 16", 75), 16),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 17", 75), 17),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 18", 75), 18),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 19", 75), 19),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 20", 75), 20),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 21", 75), 21),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 22", 75), 22),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 23", 75), 23),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 24", 75), 24),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 25", 75), 25),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 26", 75), 26),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 27", 75), 27),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 28", 75), 28),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 29", 75), 29),
-    ],
-    29,
-    0
-)
+    def fast_forward(self, simulation_time: int, ticks: int):
+        # The wake-up queue fast-forwards every node on its own once it executes again
+        if self.engine:
+            self.engine.fast_forward(ticks)
 
-data_sink_aloha_100 = Scenario(
-    "data_sink_aloha_100",
-    0.25, 
-    5,
-    [
-        ALOHANode(0, 0.25, 11, 10, 10), # sink
-        ALOHANode(1, 0.25, 11, 0, 10),
-        ALOHANode(2, 0.25, 11, 0, 12),
-        ALOHANode(3, 0.25, 11, 1, 14),
-        ALOHANode(4, 0.25, 11, 2, 16),
-        ALOHANode(5, 0.25, 11, 4, 18),
-        ALOHANode(6, 0.25, 11, 6, 19),
-        ALOHANode(7, 0.25, 11, 8, 20),
-        ALOHANode(8, 0.25, 11, 10, 20),
-        ALOHANode(9, 0.25, 11, 12, 20),
-        ALOHANode(10, 0.25, 11, 14, 19),
-        ALOHANode(11, 0.25, 11, 16, 18),
-        ALOHANode(12, 0.25, 11, 18, 16),
-        ALOHANode(13, 0.25, 11, 19, 14),
-        ALOHANode(14, 0.25, 11, 20, 12),
-        ALOHANode(15, 0.25, 11, 20, 10),
-        ALOHANode(16, 0.25, 11, 10, 0),
-        ALOHANode(17, 0.25, 11, 12, 0),
-        ALOHANode(18, 0.25, 11, 14, 1),
-        ALOHANode(19, 0.25, 11, 16, 2),
-        ALOHANode(20, 0.25, 11, 18, 4),
-        ALOHANode(21, 0.25, 11, 19, 6),
-        ALOHANode(22, 0.25, 11, 20, 8),
-        ALOHANode(23, 0.25, 11, 20, 10),
-        ALOHANode(24, 0.25, 11, 8, 0),
-        ALOHANode(25, 0.25, 11, 6, 1),
-        ALOHANode(26, 0.25, 11, 4, 2),
-        ALOHANode(27, 0.25, 11, 2, 3),
-        ALOHANode(28, 0.25, 11, 1, 5),
-        ALOHANode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 1",  100), 1),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 2",  100), 2),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 3",  100), 3),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 4",  100), 4),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 5",  100), 5),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 6",  100), 6),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 7",  100), 7),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 8",  100), 8),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 9",  100), 9),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 10", 100), 10),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 11", 100), 11),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 12", 100), 12),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 13", 100), 13),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 14", 100), 14),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 15", 100), 15),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 16", 100), 16),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 17", 100), 17),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 18", 100), 18),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 19", 100), 19),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 20", 100), 20),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 21", 100), 21),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 22", 100), 22),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 23", 100), 23),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 24", 100), 24),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 25", 100), 25),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 26", 100), 26),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 27", 100), 27),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 28", 100), 28),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 29", 100), 29),
-    ],
-    29,
-    0
-)
 
-data_sink_aloha_125 = Scenario(
-    "data_sink_aloha_125",
-    0.25, 
-    5,
-    [
-        ALOHANode(0, 0.25, 11, 10, 10), # sink
-        ALOHANode(1, 0.25, 11, 0, 10),
-        ALOHANode(2, 0.25, 11, 0, 12),
-        ALOHANode(3, 0.25, 11, 1, 14),
-        ALOHANode(4, 0.25, 11, 2, 16),
-        ALOHANode(5, 0.25, 11, 4, 18),
-        ALOHANode(6, 0.25, 11, 6, 19),
-        ALOHANode(7, 0.25, 11, 8, 20),
-        ALOHANode(8, 0.25, 11, 10, 20),
-        ALOHANode(9, 0.25, 11, 12, 20),
-        ALOHANode(10, 0.25, 11, 14, 19),
-        ALOHANode(11, 0.25, 11, 16, 18),
-        ALOHANode(12, 0.25, 11, 18, 16),
-        ALOHANode(13, 0.25, 11, 19, 14),
-        ALOHANode(14, 0.25, 11, 20, 12),
-        ALOHANode(15, 0.25, 11, 20, 10),
-        ALOHANode(16, 0.25, 11, 10, 0),
-        ALOHANode(17, 0.25, 11, 12, 0),
-        ALOHANode(18, 0.25, 11, 14, 1),
-        ALOHANode(19, 0.25, 11, 16, 2),
-        ALOHANode(20, 0.25, 11, 18, 4),
-        ALOHANode(21, 0.25, 11, 19, 6),
-        ALOHANode(22, 0.25, 11, 20, 8),
-        ALOHANode(23, 0.25, 11, 20, 10),
-        ALOHANode(24, 0.25, 11, 8, 0),
-        ALOHANode(25, 0.25, 11, 6, 1),
-        ALOHANode(26, 0.25, 11, 4, 2),
-        ALOHANode(27, 0.25, 11, 2, 3),
-        ALOHANode(28, 0.25, 11, 1, 5),
-        ALOHANode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 1",  125), 1),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 2",  125), 2),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 3",  125), 3),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 4",  125), 4),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 5",  125), 5),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 6",  125), 6),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 7",  125), 7),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 8",  125), 8),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 9",  125), 9),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 10", 125), 10),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 11", 125), 11),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 12", 125), 12),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 13", 125), 13),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 14", 125), 14),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 15", 125), 15),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 16", 125), 16),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 17", 125), 17),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 18", 125), 18),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 19", 125), 19),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 20", 125), 20),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 21", 125), 21),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 22", 125), 22),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 23", 125), 23),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 24", 125), 24),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 25", 125), 25),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 26", 125), 26),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 27", 125), 27),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 28", 125), 28),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 29", 125), 29),
-    ],
-    29,
-    0
-)
+    def run(self, simulation_time: int, active_transmissions: Channel) -> DataSinkResult | None:
+        """
+        Executes one clock tick. Returns the result once all expected messages arrived at the sink.
+        """
+        self.send_messages(simulation_time)
 
-data_sink_aloha_150 = Scenario(
-    "data_sink_aloha_150",
-    0.25, 
-    5,
-    [
-        ALOHANode(0, 0.25, 11, 10, 10), # sink
-        ALOHANode(1, 0.25, 11, 0, 10),
-        ALOHANode(2, 0.25, 11, 0, 12),
-        ALOHANode(3, 0.25, 11, 1, 14),
-        ALOHANode(4, 0.25, 11, 2, 16),
-        ALOHANode(5, 0.25, 11, 4, 18),
-        ALOHANode(6, 0.25, 11, 6, 19),
-        ALOHANode(7, 0.25, 11, 8, 20),
-        ALOHANode(8, 0.25, 11, 10, 20),
-        ALOHANode(9, 0.25, 11, 12, 20),
-        ALOHANode(10, 0.25, 11, 14, 19),
-        ALOHANode(11, 0.25, 11, 16, 18),
-        ALOHANode(12, 0.25, 11, 18, 16),
-        ALOHANode(13, 0.25, 11, 19, 14),
-        ALOHANode(14, 0.25, 11, 20, 12),
-        ALOHANode(15, 0.25, 11, 20, 10),
-        ALOHANode(16, 0.25, 11, 10, 0),
-        ALOHANode(17, 0.25, 11, 12, 0),
-        ALOHANode(18, 0.25, 11, 14, 1),
-        ALOHANode(19, 0.25, 11, 16, 2),
-        ALOHANode(20, 0.25, 11, 18, 4),
-        ALOHANode(21, 0.25, 11, 19, 6),
-        ALOHANode(22, 0.25, 11, 20, 8),
-        ALOHANode(23, 0.25, 11, 20, 10),
-        ALOHANode(24, 0.25, 11, 8, 0),
-        ALOHANode(25, 0.25, 11, 6, 1),
-        ALOHANode(26, 0.25, 11, 4, 2),
-        ALOHANode(27, 0.25, 11, 2, 3),
-        ALOHANode(28, 0.25, 11, 1, 5),
-        ALOHANode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 1",  150), 1),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 2",  150), 2),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 3",  150), 3),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 4",  150), 4),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 5",  150), 5),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 6",  150), 6),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 7",  150), 7),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 8",  150), 8),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 9",  150), 9),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 10", 150), 10),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 11", 150), 11),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 12", 150), 12),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 13", 150), 13),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 14", 150), 14),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 15", 150), 15),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 16", 150), 16),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 17", 150), 17),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 18", 150), 18),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 19", 150), 19),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 20", 150), 20),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 21", 150), 21),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 22", 150), 22),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 23", 150), 23),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 24", 150), 24),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 25", 150), 25),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 26", 150), 26),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 27", 150), 27),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 28", 150), 28),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 29", 150), 29),
-    ],
-    29,
-    0
-)
+        receivers = self.nodes
+        if self.engine:
+            receivers = self.engine.execute_state_machines(simulation_time, active_transmissions)
+        elif self.wakeup_queue:
+            receivers = self.wakeup_queue.execute_state_machines(simulation_time, active_transmissions)
+        else:
+            for node in self.nodes:
+                node.execute_state_machine(simulation_time, active_transmissions)
 
-data_sink_aloha_175 = Scenario(
-    "data_sink_aloha_175",
-    0.25, 
-    5,
-    [
-        ALOHANode(0, 0.25, 11, 10, 10), # sink
-        ALOHANode(1, 0.25, 11, 0, 10),
-        ALOHANode(2, 0.25, 11, 0, 12),
-        ALOHANode(3, 0.25, 11, 1, 14),
-        ALOHANode(4, 0.25, 11, 2, 16),
-        ALOHANode(5, 0.25, 11, 4, 18),
-        ALOHANode(6, 0.25, 11, 6, 19),
-        ALOHANode(7, 0.25, 11, 8, 20),
-        ALOHANode(8, 0.25, 11, 10, 20),
-        ALOHANode(9, 0.25, 11, 12, 20),
-        ALOHANode(10, 0.25, 11, 14, 19),
-        ALOHANode(11, 0.25, 11, 16, 18),
-        ALOHANode(12, 0.25, 11, 18, 16),
-        ALOHANode(13, 0.25, 11, 19, 14),
-        ALOHANode(14, 0.25, 11, 20, 12),
-        ALOHANode(15, 0.25, 11, 20, 10),
-        ALOHANode(16, 0.25, 11, 10, 0),
-        ALOHANode(17, 0.25, 11, 12, 0),
-        ALOHANode(18, 0.25, 11, 14, 1),
-        ALOHANode(19, 0.25, 11, 16, 2),
-        ALOHANode(20, 0.25, 11, 18, 4),
-        ALOHANode(21, 0.25, 11, 19, 6),
-        ALOHANode(22, 0.25, 11, 20, 8),
-        ALOHANode(23, 0.25, 11, 20, 10),
-        ALOHANode(24, 0.25, 11, 8, 0),
-        ALOHANode(25, 0.25, 11, 6, 1),
-        ALOHANode(26, 0.25, 11, 4, 2),
-        ALOHANode(27, 0.25, 11, 2, 3),
-        ALOHANode(28, 0.25, 11, 1, 5),
-        ALOHANode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 1",  175), 1),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 2",  175), 2),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 3",  175), 3),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 4",  175), 4),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 5",  175), 5),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 6",  175), 6),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 7",  175), 7),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 8",  175), 8),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 9",  175), 9),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 10", 175), 10),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 11", 175), 11),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 12", 175), 12),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 13", 175), 13),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 14", 175), 14),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 15", 175), 15),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 16", 175), 16),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 17", 175), 17),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 18", 175), 18),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 19", 175), 19),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 20", 175), 20),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 21", 175), 21),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 22", 175), 22),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 23", 175), 23),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 24", 175), 24),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 25", 175), 25),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 26", 175), 26),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 27", 175), 27),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 28", 175), 28),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 29", 175), 29),
-    ],
-    29,
-    0
-)
+        for node in receivers:
+            msg = node.receive()
+            if msg:
+                logging.info("Node {} received: {}".format(node.id, msg))
+                self.received_message_counter += 1
 
-data_sink_aloha_200 = Scenario(
-    "data_sink_aloha_200",
-    0.25, 
-    5,
-    [
-        ALOHANode(0, 0.25, 11, 10, 10), # sink
-        ALOHANode(1, 0.25, 11, 0, 10),
-        ALOHANode(2, 0.25, 11, 0, 12),
-        ALOHANode(3, 0.25, 11, 1, 14),
-        ALOHANode(4, 0.25, 11, 2, 16),
-        ALOHANode(5, 0.25, 11, 4, 18),
-        ALOHANode(6, 0.25, 11, 6, 19),
-        ALOHANode(7, 0.25, 11, 8, 20),
-        ALOHANode(8, 0.25, 11, 10, 20),
-        ALOHANode(9, 0.25, 11, 12, 20),
-        ALOHANode(10, 0.25, 11, 14, 19),
-        ALOHANode(11, 0.25, 11, 16, 18),
-        ALOHANode(12, 0.25, 11, 18, 16),
-        ALOHANode(13, 0.25, 11, 19, 14),
-        ALOHANode(14, 0.25, 11, 20, 12),
-        ALOHANode(15, 0.25, 11, 20, 10),
-        ALOHANode(16, 0.25, 11, 10, 0),
-        ALOHANode(17, 0.25, 11, 12, 0),
-        ALOHANode(18, 0.25, 11, 14, 1),
-        ALOHANode(19, 0.25, 11, 16, 2),
-        ALOHANode(20, 0.25, 11, 18, 4),
-        ALOHANode(21, 0.25, 11, 19, 6),
-        ALOHANode(22, 0.25, 11, 20, 8),
-        ALOHANode(23, 0.25, 11, 20, 10),
-        ALOHANode(24, 0.25, 11, 8, 0),
-        ALOHANode(25, 0.25, 11, 6, 1),
-        ALOHANode(26, 0.25, 11, 4, 2),
-        ALOHANode(27, 0.25, 11, 2, 3),
-        ALOHANode(28, 0.25, 11, 1, 5),
-        ALOHANode(29, 0.25, 11, 0, 8),
-    ],
-    [
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 1",  200), 1),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 2",  200), 2),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 3",  200), 3),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 4",  200), 4),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 5",  200), 5),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 6",  200), 6),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 7",  200), 7),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 8",  200), 8),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 9",  200), 9),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 10", 200), 10),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 11", 200), 11),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 12", 200), 12),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 13", 200), 13),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 14", 200), 14),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 15", 200), 15),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 16", 200), 16),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 17", 200), 17),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 18", 200), 18),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 19", 200), 19),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 20", 200), 20),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 21", 200), 21),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 22", 200), 22),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 23", 200), 23),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 24", 200), 24),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 25", 200), 25),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 26", 200), 26),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 27", 200), 27),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 28", 200), 28),
-        PlannedTransmission(0, HighLevelMessage(0, "Hello from 29", 200), 29),
-    ],
-    29,
-    0
-)
\ No newline at end of file
+                if self.received_message_counter == self.expected_received_messages:
+                    if self.engine:
+                        self.engine.sync()
+                    return self.report(simulation_time)
+
+def get_transmissions_by_time(send_schedule: list[PlannedTransmission]) -> dict[int, list[PlannedTransmission]]:
+    transmissions_by_time = {}
+    for transmission in send_schedule:
+        transmissions_by_time.setdefault(transmission.transmit_time, []).append(transmission)
+    return transmissions_by_time
+
+
+# Hand-placed ring around the sink at (10, 10) of the registered data sink scenarios, node i is at index i - 1
+DATA_SINK_RING = [
+    (0, 10), (0, 12), (1, 14), (2, 16), (4, 18), (6, 19), (8, 20), (10, 20), (12, 20), (14, 19),
+    (16, 18), (18, 16), (19, 14), (20, 12), (20, 10), (10, 0), (12, 0), (14, 1), (16, 2), (18, 4),
+    (19, 6), (20, 8), (20, 10), (8, 0), (6, 1), (4, 2), (2, 3), (1, 5), (0, 8),
+]
+DATA_SINK_POSITION = (10, 10)
+
+
+def ring_positions(node_count: int, ring_radius: float,
+                   center: tuple[float, float] = DATA_SINK_POSITION) -> list[tuple[float, float]]:
+    """
+    Spaces `node_count` positions evenly on a circle with radius `ring_radius` around `center`.
+    """
+    return [(center[0] + ring_radius * math.cos(2 * math.pi * i / node_count),
+             center[1] + ring_radius * math.sin(2 * math.pi * i / node_count))
+            for i in range(node_count)]
+
+
+def data_sink_scenario(name: str, node_class: type[Node], message_length: int, send_window: int | None = None,
+                       node_count: int | None = None, ring_radius: float = 10,
+                       transceive_range: float = 11, radius: float = 0.25) -> Scenario:
+    """
+    Builds a scenario in which every node on a ring sends one message to the sink 0 in its center.
+
+    :param name: name of the scenario
+    :param node_class: MAC of all nodes, e.g. `ALOHANode` or `RTSCTSNode`
+    :param message_length: length of every message
+    :param send_window: every node sends at a random time in [0, send_window), or all at time 0 if None
+    :param node_count: number of nodes on the ring, uses `DATA_SINK_RING` if None
+    :param ring_radius: radius of the ring if it is generated from `node_count`
+    :param transceive_range: transceive range of all nodes, needs to reach the sink from the ring
+    :param radius: movement radius of all nodes
+    """
+    positions = DATA_SINK_RING if node_count is None else ring_positions(node_count, ring_radius)
+    nodes = [node_class(0, radius, transceive_range, *DATA_SINK_POSITION)]
+    nodes += [node_class(i, radius, transceive_range, x, y) for i, (x, y) in enumerate(positions, start=1)]
+
+    send_schedule = [PlannedTransmission(0, HighLevelMessage(0, f"Hello from {i}", message_length), i)
+                     for i in range(1, len(nodes))]
+
+    return Scenario(name, radius, transceive_range, nodes, send_schedule, len(send_schedule), 0,
+                    send_window=send_window)
+
+
+DATA_SINK_MACS = {'aloha': ALOHANode, 'rts_cts': RTSCTSNode}
+# Transceive range the hand-written registered data sink scenarios had, their nodes all use the default of 11
+REGISTERED_DATA_SINK_TRANSCEIVE_RANGE = 5
+
+
+def registered_data_sink_scenario(name: str, *args, **kwargs) -> Scenario:
+    scenario = data_sink_scenario(name, *args, **kwargs)
+    scenario.transceive_range = REGISTERED_DATA_SINK_TRANSCEIVE_RANGE
+    return scenario
+
+
+def register_data_sink(name: str, *args, **kwargs):
+    register_scenario(partial(registered_data_sink_scenario, name, *args, **kwargs), name)
+
+
+for message_length in (5, 10, 15, 20, 25):
+    for mac, node_class in DATA_SINK_MACS.items():
+        for send_window in (25, 50, 75, 100):
+            register_data_sink(f"data_sink_{mac}_{message_length}_random_max_{send_window}",
+                               node_class, message_length, send_window)
+
+for mac in ('rts_cts', 'aloha'):
+    for message_length in (5, 25, 50, 75, 100, 125, 150, 175, 200):
+        register_data_sink(f"data_sink_{mac}_{message_length}", DATA_SINK_MACS[mac], message_length)
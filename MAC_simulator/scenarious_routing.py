@@ -1,14 +1,20 @@
 import logging
 import csv
-import random
-from node import Node, get_node_by_id
-from dataclasses import dataclass
+from node import Node
+from dataclasses import dataclass, field
 import numpy as np
 
 from protocols import DSDVRoutingProtocol
+from channel import Channel
+from neighbor_index import NeighborIndex, GridNeighborIndex
+from topology import Topology
+from random_streams import RandomStreams
+from routing_oracle import RoutingOracle
 from transmission import HighLevelMessage, Message, MessageType
 from rts_cts_node import RTSCTSNode
 from aloha_node import ALOHANode
+from scenario_registry import register_scenario
+from wakeup_queue import NodeWakeupQueue, WakeupQueue
 
 
 @dataclass
@@ -25,6 +31,10 @@ class Scenario:
     transceive_range: float
     nodes: list[Node]
     send_schedule: list[PlannedTransmission]
+    neighbor_index: NeighborIndex = field(default_factory=GridNeighborIndex)
+    topology: Topology = field(default_factory=Topology)
+    # Fill the routing tables with the shortest routes from `RoutingOracle` instead of waiting for DSDV to converge
+    ideal_routing: bool = False
 
     def get_collision_count(self):
         cnt = 0
@@ -40,29 +50,81 @@ class Scenario:
             writer.writerow([simulation_time, self.get_collision_count()])
 
 
-    def setup(self):
+    def setup(self, random_streams: RandomStreams):
         self.hops = 0
         self.established_time = -1
         self.resulting_time = -1
         for node in self.nodes:
-            node.routing_protocol = DSDVRoutingProtocol(node.id)
+            node_streams = random_streams.get_node_streams(node.id)
+            node.set_random_streams(node_streams)
+            node.routing_protocol = DSDVRoutingProtocol(node.id, node_streams.routing)
+        self.routing_oracle = RoutingOracle() if self.ideal_routing else None
+        self.topology.update(self.nodes)
+        self.neighbor_index.update(self.nodes)
+        self.wakeup_queue = None
+        self.routing_queue = None
+        self.update_routes(0)
+
+
+    def set_event_driven(self, event_driven: bool, simulation_time: int, active_transmissions: Channel):
+        """
+        Starts keeping track of the wake-up times of the nodes and their routing protocols for `next_event_time`, or
+        stops and executes all of them on every tick again.
+        """
+        if event_driven and not self.wakeup_queue:
+            self.wakeup_queue = NodeWakeupQueue(self.nodes, simulation_time, active_transmissions)
+            self.routing_queue = WakeupQueue([node.routing_protocol for node in self.nodes], simulation_time)
+        elif not event_driven and self.wakeup_queue:
+            self.wakeup_queue.stop(simulation_time, active_transmissions)
+            self.routing_queue.sync(simulation_time)
+            self.wakeup_queue = None
+            self.routing_queue = None
+
+
+    def update_routes(self, simulation_time: int):
+        """
+        Recomputes the ideal routes and fills the routing tables with them if the neighbors changed.
+        """
+        if self.routing_oracle is not None and self.routing_oracle.update(self.topology, self.neighbor_index):
+            self.routing_oracle.fill_tables(self.nodes)
+            if self.routing_queue:
+                for i in range(len(self.nodes)):
+                    self.routing_queue.refresh(i, simulation_time)
 
 
     def get_node_by_id(self, id: int) -> Node | None:
-        for node in self.nodes:
-            if node.id == id:
-                return node
-
-        return None
+        return self.topology.get_node(id)
 
 
     def send_messages(self, simulation_time: int):
         for transmission in self.send_schedule:
             if simulation_time == transmission.transmit_time:
                 self.get_node_by_id(transmission.source_node_id).routing_protocol.send(transmission.message)
+                if self.routing_queue:
+                    self.routing_queue.refresh(self.topology.get_index(transmission.source_node_id), simulation_time)
+
+
+    def next_event_time(self, simulation_time: int, active_transmissions: Channel) -> int:
+        """
+        Returns the next simulation time at which any node, routing protocol or the send schedule can change state.
+        All ticks before that only count down timers and can be skipped using `fast_forward`.
+        Requires `set_event_driven`.
+        """
+        next_event_time = min(10_000, self.wakeup_queue.next_wakeup(), self.routing_queue.next_wakeup())
+        for transmission in self.send_schedule:
+            if transmission.transmit_time >= simulation_time:
+                next_event_time = min(next_event_time, transmission.transmit_time)
 
+        return next_event_time
 
-    def run(self, simulation_time: int, active_transmissions: list[Message]):
+
+    def fast_forward(self, simulation_time: int, ticks: int):
+        # `run` updates `established_time` on every tick the route is known, the wake-up queues fast-forward the nodes
+        if self.nodes[-1].id in self.nodes[-2].routing_protocol.table:
+            self.established_time = simulation_time + ticks - 1
+
+
+    def run(self, simulation_time: int, active_transmissions: Channel):
         self.send_messages(simulation_time)
 
         if simulation_time >= 10_000:
@@ -74,14 +136,23 @@ class Scenario:
         if target_node.id in source_node.routing_protocol.table:
             self.established_time = simulation_time
 
-        for node in self.nodes:
-            # node.move()
-            node.add_neighbors(self.nodes)
-
-        for node in self.nodes:
-            node.execute_state_machine(simulation_time, active_transmissions)
-
-        for node in self.nodes:
+        # for node in self.nodes:
+        #     node.move()
+        self.topology.update(self.nodes)
+        self.neighbor_index.update(self.nodes)
+        self.update_routes(simulation_time)
+
+        if self.wakeup_queue:
+            for node in self.wakeup_queue.execute_state_machines(simulation_time, active_transmissions):
+                self.routing_queue.schedule(self.topology.get_index(node.id), simulation_time)
+            due = self.routing_queue.pop_due(simulation_time)
+        else:
+            for node in self.nodes:
+                node.execute_state_machine(simulation_time, active_transmissions)
+            due = range(len(self.nodes))
+
+        for i in due:
+            node = self.nodes[i]
             msg = node.receive()
             if msg:
                 # if msg.get_type() == MessageType.Data:
@@ -93,12 +164,17 @@ class Scenario:
 
                 if 'cts' in msg.content:
                     logging.info("Node {} received: {}".format(node.id, msg))
-                reply = node.routing_protocol.reply(msg, node.get_packet_travel_time(get_node_by_id(self.nodes, msg.source)))
+                reply = node.routing_protocol.reply(msg, node.get_packet_travel_time(self.get_node_by_id(msg.source)))
             else:
                 reply = node.routing_protocol.tick()
             if reply:
                 logging.debug("Node {} wants to send: {}".format(node.id, reply))
                 node.send(reply)
+                if self.wakeup_queue:
+                    # The state machine already executed this tick
+                    self.wakeup_queue.refresh(i, simulation_time + 1)
+            if self.routing_queue:
+                self.routing_queue.finish(i, simulation_time)
 
 
         # if simulation_time == 250:
@@ -124,18 +200,27 @@ class Scenario:
         #             self.report(simulation_time)
         #             exit(0)
 
-np.random.seed(42)
-
-Routing_1_aloha = Scenario(
-    "Routing_1_aloha",
-    0.25,
-    3,
-    [RTSCTSNode(i, 0.25, 3, np.random.uniform(0, 10), np.random.uniform(0, 10)) for i in range(1, 20)] +
-    [RTSCTSNode(0, 0.25, 3, 0, 0),  # source
-     RTSCTSNode(100, 0.25, 3, 10, 10)],  # sink
-
-    [
-        PlannedTransmission(2, HighLevelMessage(100, "Hello message", 5), 0)
-    ]
-)
-
+@register_scenario
+def Routing_1_aloha() -> Scenario:
+    # The topology is fixed, independent of how the simulation itself is seeded
+    positions = np.random.RandomState(42)
+    return Scenario(
+        "Routing_1_aloha",
+        0.25,
+        3,
+        [RTSCTSNode(i, 0.25, 3, positions.uniform(0, 10), positions.uniform(0, 10)) for i in range(1, 20)] +
+        [RTSCTSNode(0, 0.25, 3, 0, 0),  # source
+         RTSCTSNode(100, 0.25, 3, 10, 10)],  # sink
+
+        [
+            PlannedTransmission(2, HighLevelMessage(100, "Hello message", 5), 0)
+        ]
+    )
+
+
+@register_scenario
+def Routing_1_aloha_ideal() -> Scenario:
+    scenario = Routing_1_aloha()
+    scenario.name = "Routing_1_aloha_ideal"
+    scenario.ideal_routing = True
+    return scenario
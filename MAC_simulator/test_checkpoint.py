@@ -0,0 +1,22 @@
+from aloha_node import ALOHANode
+from main import resume_scenario, run_scenario
+from scenarious import data_sink_scenario
+
+
+def build_ring(node_count: int):
+    # A long send window keeps the sink from being flooded, so the first messages arrive within a few thousand ticks
+    scenario = data_sink_scenario(f'data_sink_aloha_ring_{node_count}', ALOHANode, 5, 100_000, node_count=node_count)
+    scenario.expected_received_messages = 20
+    return scenario
+
+
+def test_resume_large_ring(tmp_path):
+    checkpoint_path = str(tmp_path / 'ring.ckpt')
+    expected = run_scenario(build_ring(1000), event_driven=True, seed=1)
+
+    result = run_scenario(build_ring(1000), event_driven=True, seed=1, checkpoint_path=checkpoint_path,
+                          checkpoint_interval=500)
+    assert result == expected
+
+    # The last checkpoint was saved before the run finished, resuming from it has to end the same way
+    assert resume_scenario(checkpoint_path, event_driven=True) == expected
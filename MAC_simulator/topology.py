@@ -0,0 +1,108 @@
+import numpy as np
+
+
+class Topology:
+    """
+    Stores the positions of all nodes in contiguous arrays and computes the pairwise distance and packet travel time
+    matrices in one vectorized pass whenever a node was added, removed or moved.
+
+    Nodes are attached to the topology by `update` and read their travel times by index, see
+    `Node.get_packet_travel_time`. The topology also serves as the registry mapping node ids to nodes and array indices.
+
+    The matrices can be memory-mapped, see `load`. Only the travel times that are actually read are copied out of them,
+    so attaching a large topology never reads the whole matrix.
+    """
+
+    def __init__(self):
+        self.ids: list[int] = []
+        self.nodes_by_id: dict[int, object] = {}
+        self.indices_by_id: dict[int, int] = {}
+        self.x_pos = np.empty(0, dtype=np.float64)
+        self.y_pos = np.empty(0, dtype=np.float64)
+        self.distances = np.empty((0, 0), dtype=np.float64)
+        self.travel_times = np.empty((0, 0), dtype=np.int64)
+        # Travel times read so far by receiver index and sender index, indexing those is a lot cheaper than indexing a
+        # numpy array element by element. Receivers only ever read the travel times from their few neighbors.
+        self.travel_time_rows: list[dict[int, int]] = []
+
+    def update(self, nodes: list) -> bool:
+        """
+        Recomputes the matrices if the positions changed since the last call.
+
+        :return: whether the topology changed
+        """
+        ids, x_pos, y_pos = get_positions(nodes)
+        if ids == self.ids and np.array_equal(x_pos, self.x_pos) and np.array_equal(y_pos, self.y_pos):
+            return False
+
+        distances = np.sqrt((x_pos[:, None] - x_pos[None, :]) ** 2 + (y_pos[:, None] - y_pos[None, :]) ** 2)
+        # Propagation speed is one distance unit per clock tick, cut off like `int()` does
+        self.attach(nodes, ids, x_pos, y_pos, distances, distances.astype(np.int64))
+        return True
+
+    def load(self, nodes: list, distances: np.ndarray, travel_times: np.ndarray):
+        """
+        Attaches `nodes` with matrices that `update` computed earlier for the same positions, e.g. memory-mapped from a
+        cache.
+        """
+        self.attach(nodes, *get_positions(nodes), distances, travel_times)
+
+    def share(self, base: 'Topology', nodes: list) -> bool:
+        """
+        Attaches `nodes` to the matrices of `base` if they are at the same positions, e.g. in another replication of
+        the same scenario. The matrices are never modified in place, so they can be shared without copying.
+
+        :return: whether the positions matched
+        """
+        ids, x_pos, y_pos = get_positions(nodes)
+        if ids != base.ids or not np.array_equal(x_pos, base.x_pos) or not np.array_equal(y_pos, base.y_pos):
+            return False
+
+        self.attach(nodes, ids, x_pos, y_pos, base.distances, base.travel_times, base.travel_time_rows)
+        return True
+
+    def attach(self, nodes: list, ids: list[int], x_pos: np.ndarray, y_pos: np.ndarray, distances: np.ndarray,
+               travel_times: np.ndarray, travel_time_rows: list[dict[int, int]] | None = None):
+        self.ids = ids
+        self.nodes_by_id = {node.id: node for node in nodes}
+        self.indices_by_id = {id: index for index, id in enumerate(ids)}
+        self.x_pos = x_pos
+        self.y_pos = y_pos
+        self.distances = distances
+        self.travel_times = travel_times
+        self.travel_time_rows = [{} for _ in ids] if travel_time_rows is None else travel_time_rows
+
+        for index, node in enumerate(nodes):
+            node.topology = self
+            node.topology_index = index
+
+    def __getstate__(self):
+        # `travel_time_rows` is only a cache of `travel_times`, keep checkpoints small
+        state = self.__dict__.copy()
+        del state['travel_time_rows']
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self.travel_time_rows = [{} for _ in self.ids]
+
+    def get_node(self, id: int):
+        return self.nodes_by_id.get(id)
+
+    def get_index(self, id: int) -> int | None:
+        return self.indices_by_id.get(id)
+
+    def get_travel_time(self, receiver, sender) -> int:
+        row = self.travel_time_rows[receiver.topology_index]
+        travel_time = row.get(sender.topology_index)
+        if travel_time is None:
+            travel_time = int(self.travel_times[receiver.topology_index, sender.topology_index])
+            row[sender.topology_index] = travel_time
+        return travel_time
+
+
+def get_positions(nodes: list) -> tuple[list[int], np.ndarray, np.ndarray]:
+    ids = [node.id for node in nodes]
+    x_pos = np.fromiter((node.x_pos for node in nodes), dtype=np.float64, count=len(nodes))
+    y_pos = np.fromiter((node.y_pos for node in nodes), dtype=np.float64, count=len(nodes))
+    return ids, x_pos, y_pos
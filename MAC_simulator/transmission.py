@@ -3,8 +3,10 @@ from enum import Enum
 
 """
 `HighLevelMessage` stores the actual data message. The `send_schedule` of a node is a list of `HighLevelMessage`
+
+The message records are slotted since long runs allocate millions of them.
 """
-@dataclass
+@dataclass(slots=True)
 class HighLevelMessage:
     target: int
     content: str
@@ -25,8 +27,10 @@ class MessageType(Enum):
 
 """
 `Message` is used for RTS, CTS, ACK and data messages.
+The type and the RTS/CTS fields are set once when the frame is built, so reading them does not require parsing `content`.
+Frames built without them get them parsed from `content` once, e.g. "rts <waiting time> <payload length>".
 """
-@dataclass
+@dataclass(slots=True)
 class Message:
     sequence_number: int
     target: int
@@ -35,9 +39,15 @@ class Message:
     length: int
     route_target: int
     route_source: int
+    message_type: MessageType
+    # RTS/CTS: how long other nodes have to stay quiet after receiving the frame
+    waiting_time: int
+    # RTS: length of the data message that is going to follow
+    payload_length: int
 
     def __init__(self, sequence_number: int, target: int, source: int,
-                 content: str, length: int, route_target: int = None, route_source: int = None):
+                 content: str, length: int, route_target: int = None, route_source: int = None,
+                 message_type: MessageType = None, waiting_time: int = None, payload_length: int = None):
         self.sequence_number: int = sequence_number
         self.target: int = target
         self.source: int = source
@@ -51,27 +61,29 @@ class Message:
             self.route_source = self.source
         else:
             self.route_source = route_source
+        if message_type is None:
+            self.message_type = parse_message_type(target, content)
+        else:
+            self.message_type = message_type
+        if waiting_time is None:
+            self.waiting_time = parse_waiting_time(self.message_type, content)
+        else:
+            self.waiting_time = waiting_time
+        if payload_length is None:
+            self.payload_length = parse_payload_length(self.message_type, content)
+        else:
+            self.payload_length = payload_length
 
 
     def get_type(self) -> MessageType:
+        # `target` gets rewritten by the routing layer, -1 always means broadcast
         if self.target == -1:
             return MessageType.BROADCAST
-        message_content_lower = self.content.lower()[0:3]
-        if "rts" == message_content_lower:
-            return MessageType.RTS
-        elif "cts" == message_content_lower:
-            return MessageType.CTS
-        elif "ack" == message_content_lower:
-            return MessageType.ACK
-        else:
-            return MessageType.Data
+        return self.message_type
         
 
     def get_waiting_time(self) -> int:
-        if self.get_type() == MessageType.RTS or self.get_type() == MessageType.CTS:
-            return int(self.content.split(" ")[1])
-        else:
-            return 0
+        return self.waiting_time
 
     def __repr__(self):
         return (f'Message(sequence_number={self.sequence_number},'
@@ -83,12 +95,48 @@ class Message:
     
 
     def get_message_length(self) -> int:
-        return int(self.content.split(" ")[2])
+        return self.payload_length
+
+
+def parse_message_type(target: int, content) -> MessageType:
+    """
+    Derives the type of messages that were built without an explicit `message_type` from their content.
+    """
+    if target == -1:
+        return MessageType.BROADCAST
+    message_content_lower = str(content).lower()[0:3]
+    if "rts" == message_content_lower:
+        return MessageType.RTS
+    elif "cts" == message_content_lower:
+        return MessageType.CTS
+    elif "ack" == message_content_lower:
+        return MessageType.ACK
+    else:
+        return MessageType.Data
+
+
+def parse_waiting_time(message_type: MessageType, content) -> int:
+    """
+    Reads the waiting time of RTS and CTS frames that were built without an explicit `waiting_time` from their content.
+    """
+    if message_type == MessageType.RTS or message_type == MessageType.CTS:
+        return int(str(content).split(" ")[1])
+    return 0
+
+
+def parse_payload_length(message_type: MessageType, content) -> int:
+    """
+    Reads the announced data length of RTS frames that were built without an explicit `payload_length` from their
+    content.
+    """
+    if message_type == MessageType.RTS:
+        return int(str(content).split(" ")[2])
+    return 0
 
 """
 `Transmission` is a wrapper for `Message` to include planned and actual transmission times.
 """
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Transmission:
     transmit_time: int
     message: Message
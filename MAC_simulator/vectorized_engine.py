@@ -0,0 +1,112 @@
+import numpy as np
+
+from node import Node, State
+from channel import Channel
+
+STATE_CODES = {state: code for code, state in enumerate(State)}
+IDLE = STATE_CODES[State.Idle]
+
+
+class VectorizedEngine:
+    """
+    Alternative to calling `execute_state_machine` on every node each tick. The state and the counter of the current
+    state of all nodes are kept in NumPy arrays. Every tick the counters of all nodes without an event are counted down
+    with one masked operation, only the nodes with an event execute their state machine in Python:
+        - the counter of the current state expires,
+        - the node is idle and has something to send,
+        - a transmission starts arriving or more than one transmission is arriving (see `Channel.get_busy_receivers`).
+
+    While the engine is in use the arrays are the source of truth for the counters, `sync` writes them back to the nodes.
+    Written for ALOHA, but works for every node that implements `get_state_counter` and `fast_forward`.
+
+    The nodes with an event are read from and written to the arrays in one batch per tick, element-wise access to
+    NumPy arrays would cost more than the masked operations save once many nodes have events.
+    """
+
+    def __init__(self, nodes: list[Node]):
+        self.nodes = nodes
+        self.indices_by_id = {node.id: index for index, node in enumerate(nodes)}
+        self.states = np.zeros(len(nodes), dtype=np.int8)
+        self.counters = np.zeros(len(nodes), dtype=np.int64)
+        # Whether the node has anything in its `send_schedule`
+        self.pending = np.zeros(len(nodes), dtype=bool)
+
+        self.load(range(len(nodes)))
+
+    def load(self, indices):
+        """
+        Reads the state of the nodes at `indices` into the arrays.
+        """
+        nodes = [self.nodes[index] for index in indices]
+        self.states[indices] = [STATE_CODES[node.state] for node in nodes]
+        self.counters[indices] = [node.get_state_counter() if node.state != State.Idle else 0 for node in nodes]
+        self.pending[indices] = [bool(node.send_schedule) for node in nodes]
+
+    def store(self, indices):
+        """
+        Writes the counters of the nodes at `indices` back to the nodes.
+        """
+        # Reading the arrays element by element is slow, convert them once
+        counters = self.counters.tolist()
+        for index in indices:
+            node = self.nodes[index]
+            if node.state != State.Idle:
+                node.fast_forward(node.get_state_counter() - counters[index])
+
+    def sync(self):
+        """
+        Writes the counters back to the nodes.
+        """
+        self.store(range(len(self.nodes)))
+
+    def mark_pending(self, node: Node):
+        """
+        Has to be called whenever a message gets added to the `send_schedule` of a node from outside the state machine.
+        """
+        self.pending[self.indices_by_id[node.id]] = True
+
+    def execute_state_machines(self, simulation_time: int, active_transmissions: Channel) -> list[Node]:
+        """
+        :return: the nodes that can have a received message, see `Node.receive`, in the order of `nodes`
+        """
+        counting = self.states != IDLE
+        # Counters are decremented before they are checked, so a counter <= 1 expires this tick
+        events = (counting & (self.counters <= 1)) | (~counting & self.pending)
+        busy_receivers = active_transmissions.get_busy_receivers(simulation_time)
+        if busy_receivers:
+            events[[self.indices_by_id[id] for id in busy_receivers]] = True
+
+        self.counters[counting & ~events] -= 1
+        indices = np.flatnonzero(events).tolist()
+        self.store(indices)
+
+        receivers = set(indices)
+        # In order of `nodes` so transmissions enter the channel in the same order as in the tick loop
+        for index in indices:
+            node = self.nodes[index]
+            receiving = node.protocol.currently_receiving if node.state == State.Receiving else None
+            node.execute_state_machine(simulation_time, active_transmissions)
+
+            # A node that finished receiving an ACK hands the acknowledged message of the ACK's sender to `receive`
+            if receiving is not None and receiving.source in self.indices_by_id:
+                receivers.add(self.indices_by_id[receiving.source])
+
+        self.load(indices)
+        return [self.nodes[index] for index in sorted(receivers)]
+
+    def next_wakeup(self, simulation_time: int) -> int | float:
+        """
+        Vectorized `Node.next_wakeup` over all nodes.
+        """
+        counting = self.states != IDLE
+        if (~counting & self.pending).any():
+            return simulation_time
+        if not counting.any():
+            return float('inf')
+        return simulation_time + int(np.maximum(self.counters[counting], 1).min()) - 1
+
+    def fast_forward(self, ticks: int):
+        """
+        Vectorized `Node.fast_forward` over all nodes.
+        """
+        self.counters[self.states != IDLE] -= ticks
@@ -0,0 +1,139 @@
+"""
+Wake-up times of nodes and routing protocols for the event-driven mode, see `run_scenario`.
+
+Instead of asking every node for its next wake-up on every executed tick, a heap holds the next wake-up time of every
+node. It is only updated for the nodes that executed and the nodes a transmission was scheduled to arrive at. Nodes
+without an event are not touched at all, `fast_forward` counts down their counters right before they execute next.
+"""
+import heapq
+
+from channel import Channel
+from node import Node, State
+
+
+class WakeupQueue:
+    """
+    Lazily advanced timers of `items`, i.e. anything with `next_wakeup(simulation_time)` and `fast_forward(ticks)` like
+    nodes and routing protocols. All ticks of item `i` before `synced_times[i]` were executed or fast-forwarded.
+    Skipping a tick at which an item does not wake up has to be the same as calling `fast_forward(1)`.
+    """
+
+    def __init__(self, items: list, simulation_time: int):
+        self.items = items
+        self.synced_times = [simulation_time] * len(items)
+        # Current wake-up time of every item, heap entries that differ from it are out of date and skipped
+        self.wakeups: list[int | float] = [float('inf')] * len(items)
+        self.heap: list[tuple[int, int]] = []
+
+        for index, item in enumerate(items):
+            self.schedule(index, item.next_wakeup(simulation_time))
+
+    def schedule(self, index: int, wakeup: int | float):
+        """
+        Moves the wake-up of item `index` to `wakeup` if that is earlier.
+        """
+        if wakeup < self.wakeups[index]:
+            self.wakeups[index] = wakeup
+            heapq.heappush(self.heap, (wakeup, index))
+
+    def refresh(self, index: int, earliest: int):
+        """
+        Has to be called whenever something else than the item itself changed its `next_wakeup`, e.g. by adding a
+        message to the send schedule of a node. The item wakes up no earlier than `earliest`.
+        """
+        self.schedule(index, max(self.items[index].next_wakeup(self.synced_times[index]), earliest))
+
+    def next_wakeup(self) -> int | float:
+        heap = self.heap
+        while heap and heap[0][0] != self.wakeups[heap[0][1]]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else float('inf')
+
+    def pop_due(self, simulation_time: int) -> list[int]:
+        """
+        Returns the indices of all items that wake up at `simulation_time` in ascending order, advanced to it.
+        """
+        heap = self.heap
+        due = []
+        while heap and heap[0][0] <= simulation_time:
+            wakeup, index = heapq.heappop(heap)
+            if wakeup == self.wakeups[index]:
+                self.advance(index, simulation_time)
+                due.append(index)
+
+        due.sort()
+        return due
+
+    def advance(self, index: int, simulation_time: int):
+        """
+        Fast-forwards item `index` to `simulation_time` so it can execute that tick, see `finish`.
+        """
+        ticks = simulation_time - self.synced_times[index]
+        if ticks > 0:
+            self.items[index].fast_forward(ticks)
+            self.synced_times[index] = simulation_time
+        self.wakeups[index] = float('inf')
+
+    def finish(self, index: int, simulation_time: int, wakeup: int | float = float('inf')):
+        """
+        Has to be called after item `index` executed tick `simulation_time`.
+
+        :param wakeup: wake-up from another source than the item itself, e.g. the next arrival at a node
+        """
+        self.synced_times[index] = simulation_time + 1
+        self.schedule(index, min(self.items[index].next_wakeup(simulation_time + 1), wakeup))
+
+    def sync(self, simulation_time: int):
+        """
+        Fast-forwards all items to `simulation_time`, e.g. before they are executed every tick again.
+        """
+        for index in range(len(self.items)):
+            self.advance(index, simulation_time)
+
+
+class NodeWakeupQueue(WakeupQueue):
+    """
+    `WakeupQueue` of the state machines of `nodes`. A node also wakes up whenever a transmission starts arriving at it
+    or more than one transmission is arriving, see `Channel.next_arrival`, which the channel reports for every new
+    transmission through `schedule_arrival`.
+    """
+
+    def __init__(self, nodes: list[Node], simulation_time: int, active_transmissions: Channel):
+        super().__init__(nodes, simulation_time)
+        self.indices_by_id = {node.id: index for index, node in enumerate(nodes)}
+        for index, node in enumerate(nodes):
+            self.schedule(index, active_transmissions.next_arrival(node.id, simulation_time))
+        active_transmissions.arrival_listener = self.schedule_arrival
+
+    def schedule_arrival(self, receiver_id: int, arrival_time: int):
+        self.schedule(self.indices_by_id[receiver_id], arrival_time)
+
+    def stop(self, simulation_time: int, active_transmissions: Channel):
+        """
+        Fast-forwards all nodes to `simulation_time` and detaches from the channel, so every node can be executed on
+        every tick again.
+        """
+        active_transmissions.arrival_listener = None
+        self.sync(simulation_time)
+
+    def execute_state_machines(self, simulation_time: int, active_transmissions: Channel) -> list[Node]:
+        """
+        Executes the state machines of the nodes that wake up at `simulation_time`, in the order of `nodes` like the
+        tick loop.
+
+        :return: the nodes that can have a received message, see `Node.receive`, in the order of `nodes`
+        """
+        receivers = set()
+        for index in self.pop_due(simulation_time):
+            node = self.items[index]
+            receiving = node.protocol.currently_receiving if node.state == State.Receiving else None
+
+            node.execute_state_machine(simulation_time, active_transmissions)
+            self.finish(index, simulation_time, active_transmissions.next_arrival(node.id, simulation_time + 1))
+
+            receivers.add(index)
+            # A node that finished receiving an ACK hands the acknowledged message of the ACK's sender to `receive`
+            if receiving is not None and receiving.source in self.indices_by_id:
+                receivers.add(self.indices_by_id[receiving.source])
+
+        return [self.items[index] for index in sorted(receivers)]